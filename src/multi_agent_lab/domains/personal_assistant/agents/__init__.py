@@ -2,12 +2,17 @@
 Personal Assistant Agents
 """
 
+from .route_cache import RouteCache
+from .routing import RouteDecision, TieredRouter
 from .schedule_manager import ScheduleManagerAgent
 from .supervisor import PersonalAssistantSupervisor
 from .todo_manager import TodoManagerAgent
 
 __all__ = [
     "PersonalAssistantSupervisor",
+    "RouteCache",
+    "RouteDecision",
     "ScheduleManagerAgent",
+    "TieredRouter",
     "TodoManagerAgent",
 ]
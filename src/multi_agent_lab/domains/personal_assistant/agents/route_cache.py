@@ -0,0 +1,187 @@
+"""
+RouteCache - 라우팅 결정 캐시
+
+같은(또는 거의 같은) 질문의 라우팅 결정을 재사용해서 LLM 분류 호출을
+줄이는 2단 캐시입니다.
+
+📌 목적:
+- "오늘 할일 보여줘"처럼 하루에도 여러 번 반복되는 질문은 한 번만 분류
+- 1단: 프로세스 내 LRU + TTL (infra.cache.LRUCache)
+- 2단(선택): RedisClient 공유 캐시 (여러 워커 프로세스가 결정 공유)
+
+💡 캐시 키:
+- 질문 정규화: NFKC → 소문자 → 문장부호 제거 → 공백 정리
+  ("오늘 할일 보여줘!" == "오늘  할일 보여줘")
+- Skill Card 지문(파일별 sha256)을 키에 포함 → 카드가 바뀌면 이전 결정은 자동으로 무시
+- fallback 결정(LLM 실패 등)은 일시적일 수 있으므로 저장하지 않음
+
+💡 사용 방식:
+    cache = RouteCache(maxsize=2048, ttl=600, redis=RedisClient(RedisConfig.from_env()))
+    router = TieredRouter(SkillCardManager(), llm=llm, cache=cache)
+"""
+
+import contextlib
+import hashlib
+import json
+import math
+import unicodedata
+from dataclasses import asdict, replace
+
+import redis as redis_lib
+
+from multi_agent_lab.infra.cache import LRUCache
+from multi_agent_lab.infra.database.redis import RedisClient
+from multi_agent_lab.platform.skill_card import RegistrySnapshot
+
+from .routing import RouteDecision
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키용 질문 정규화
+
+    Args:
+        query: 사용자 질문
+
+    Returns:
+        정규화된 질문 (NFKC, 소문자, 문장부호 제거, 공백 하나로)
+    """
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = "".join(
+        " " if unicodedata.category(char).startswith("P") else char for char in text
+    )
+    return " ".join(text.split())
+
+
+def card_fingerprint(snapshot: RegistrySnapshot) -> str:
+    """
+    Skill Card 스냅샷 지문 (프로세스가 달라도 같은 카드면 같은 값)
+
+    Args:
+        snapshot: SkillCardManager 스냅샷
+
+    Returns:
+        16자리 hex 문자열
+    """
+    digest = hashlib.sha256()
+    for name, entry in sorted(snapshot.files.items()):
+        digest.update(f"{name}:{entry.sha256};".encode())
+    return digest.hexdigest()[:16]
+
+
+class RouteCache:
+    """
+    라우팅 결정 LRU + TTL 캐시 (Redis 공유 캐시 선택)
+
+    Redis 오류는 캐시 미스로 처리합니다 (라우팅은 계속 동작).
+
+    Example:
+        >>> cache = RouteCache(ttl=600)
+        >>> cache.set("오늘 할일 보여줘", "fp", RouteDecision("todo", "llm", 1.0))
+        >>> cache.get("오늘 할일 보여줘!", "fp").cached
+        True
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = 600,
+        redis: RedisClient | None = None,
+        prefix: str = "supervisor:route:",
+    ):
+        """
+        Args:
+            maxsize: 프로세스 내 최대 항목 수
+            ttl: 만료 시간 (초, None이면 만료 없음). Redis에도 같은 값 사용
+            redis: 공유 캐시용 RedisClient (None이면 프로세스 내 캐시만)
+            prefix: Redis 키 접두사
+        """
+        self.local = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        self.redis = redis
+        self.prefix = prefix
+        self.redis_hits = 0
+        # 마지막으로 계산한 (스냅샷, 지문)
+        self._fingerprint: tuple[RegistrySnapshot | None, str] = (None, "")
+
+    def fingerprint(self, snapshot: RegistrySnapshot) -> str:
+        """
+        스냅샷 지문 (같은 스냅샷이면 다시 계산하지 않음)
+
+        Args:
+            snapshot: SkillCardManager 스냅샷
+
+        Returns:
+            card_fingerprint(snapshot)
+        """
+        cached_snapshot, fingerprint = self._fingerprint
+        if cached_snapshot is not snapshot:
+            fingerprint = card_fingerprint(snapshot)
+            self._fingerprint = (snapshot, fingerprint)
+        return fingerprint
+
+    def _key(self, query: str, fingerprint: str) -> str:
+        normalized = normalize_query(query)
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+        return f"{fingerprint}:{digest}"
+
+    def get(self, query: str, fingerprint: str) -> RouteDecision | None:
+        """
+        캐시된 라우팅 결정 조회 (로컬 → Redis)
+
+        Args:
+            query: 사용자 질문 (정규화 전)
+            fingerprint: Skill Card 지문 (card_fingerprint)
+
+        Returns:
+            cached=True인 RouteDecision (없으면 None)
+        """
+        key = self._key(query, fingerprint)
+        decision = self.local.get(key)
+        if decision is not None:
+            return decision
+
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(self.prefix + key)
+        except redis_lib.RedisError:
+            return None
+        if raw is None:
+            return None
+        try:
+            decision = replace(RouteDecision(**json.loads(raw)), cached=True)
+        except (TypeError, ValueError):
+            return None  # 형식이 다른 값은 무시
+        self.redis_hits += 1
+        self.local.set(key, decision)
+        return decision
+
+    def set(self, query: str, fingerprint: str, decision: RouteDecision):
+        """
+        라우팅 결정 저장 (fallback 결정은 저장하지 않음)
+
+        Args:
+            query: 사용자 질문 (정규화 전)
+            fingerprint: Skill Card 지문 (card_fingerprint)
+            decision: 라우팅 결정
+        """
+        if decision.tier == "fallback":
+            return
+
+        key = self._key(query, fingerprint)
+        self.local.set(key, replace(decision, cached=True))
+
+        if self.redis is None:
+            return
+        payload = asdict(replace(decision, cached=False))
+        ex = math.ceil(self.ttl) if self.ttl is not None else None
+        # 공유 캐시 저장 실패는 무시 (다음 워커가 다시 결정)
+        with contextlib.suppress(redis_lib.RedisError):
+            self.redis.set(
+                self.prefix + key, json.dumps(payload, ensure_ascii=False), ex=ex
+            )
+
+    def clear(self):
+        """프로세스 내 캐시 비우기 (Redis 공유 캐시는 TTL로 만료)"""
+        self.local.clear()
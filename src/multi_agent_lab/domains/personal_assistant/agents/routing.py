@@ -0,0 +1,417 @@
+"""
+TieredRouter - Skill Card 기반 단계별 라우터
+
+Supervisor가 질문마다 LLM을 호출하지 않도록, 싼 판단부터 차례로 시도하고
+확신이 없을 때만 다음 단계로 넘기는 라우터입니다.
+
+📌 단계 (tier):
+    1. skill_card: Skill Card 트리거 키워드 / 예시 문장 매칭
+       (한 Agent로만 매칭되거나, 1등 점수가 2등보다 keyword_margin 이상 높을 때)
+    2. classifier: 예시 문장 최근접 이웃 분류 (카드 임계값과 무관하게
+       최고 유사도가 min_similarity 이상이고 2등과 min_margin 이상 차이날 때).
+       "알려줘", "추가해줘"처럼 의도와 무관하게 겹치는 문장 끝 서술어(마지막 어절)는
+       빼고 비교합니다 ("날씨 알려줘"가 "태스크부터 알려줘"와 가깝다고 보지 않도록)
+    3. llm: 라우팅 프롬프트로 LLM 호출
+    -  fallback: LLM이 없거나 실패/잘못된 응답이면 앞 단계의 최선 추정 (없으면 unknown)
+
+    cache(RouteCache)를 주면 정규화된 질문별로 결정을 재사용합니다.
+
+💡 복합 요청 (route_intents):
+    "내일 3시 회의 잡고 보고서 작성 할일도 추가해줘"처럼 여러 Agent가 필요한
+    질문은 절 단위로 나눠 각각 Skill Card 단계로 라우팅하고, Agent별로 묶어서
+    반환합니다. 트리거 근거가 있는 절이 서로 다른 Agent로 2개 이상일 때만 나눕니다.
+
+💡 Agent 매핑:
+    Skill Card의 agent_type("ScheduleManagerAgent")을 Supervisor의 라우팅
+    값("schedule")으로 바꿉니다. 매핑에 없는 카드는 무시합니다.
+
+💡 사용 방식:
+    router = TieredRouter(SkillCardManager(), llm=ChatOllama(...))
+    decision = router.route("장보기 할일 추가해줘")
+    print(decision.agent_type, decision.tier)   # todo skill_card
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from multi_agent_lab.platform.skill_card import RegistrySnapshot, SkillCardManager
+
+if TYPE_CHECKING:
+    from .route_cache import RouteCache
+
+AgentType = Literal["schedule", "todo", "unknown"]
+RouteTier = Literal["skill_card", "classifier", "llm", "fallback"]
+
+# Skill Card agent_type → Supervisor 라우팅 값
+DEFAULT_AGENT_TYPES: dict[str, AgentType] = {
+    "ScheduleManagerAgent": "schedule",
+    "TodoManagerAgent": "todo",
+}
+
+ROUTING_PROMPT = """당신은 질문 분류 전문가입니다.
+
+사용자 질문을 분석하여 다음 중 하나로 분류하세요:
+
+- schedule: 일정, 회의, 약속, 캘린더, 시간 관련 질문
+  예: "내일 회의 잡아줘", "이번 주 일정 보여줘", "오후 3시에 약속 있어?"
+
+- todo: 할일, 작업, 태스크, 목록 관련 질문
+  예: "장보기 추가해줘", "오늘 할일 뭐야?", "숙제 완료 처리해줘"
+
+- unknown: 위 두 가지에 해당하지 않는 질문
+
+반드시 schedule, todo, unknown 중 하나만 응답하세요. 다른 말은 하지 마세요."""
+
+
+# 복합 요청의 절 경계: 쉼표/세미콜론, 문장부호 뒤 공백, "그리고", 연결 어미 "-고"
+# ("-고"는 순서를 뜻할 때도 있어, 나눈 절은 Skill Card 근거가 있을 때만 분리)
+_CLAUSE_BOUNDARY = re.compile(
+    r"\s*(?:[,;]|(?<=[.!?])\s|(?<![가-힣])그리고(?=\s)|(?<=[가-힣]고)\s)\s*"
+)
+
+
+def split_clauses(query: str) -> list[str]:
+    """
+    질문을 절 단위로 나누기
+
+    Args:
+        query: 사용자 질문
+
+    Returns:
+        빈 절을 제외한 절 목록 (나눌 곳이 없으면 [query])
+
+    Example:
+        >>> split_clauses("내일 3시 회의 잡고 보고서 작성 할일도 추가해줘")
+        ['내일 3시 회의 잡고', '보고서 작성 할일도 추가해줘']
+    """
+    clauses = [c.strip() for c in _CLAUSE_BOUNDARY.split(query) if c and c.strip()]
+    return clauses or [query]
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """
+    라우팅 결과
+
+    Attributes:
+        agent_type: 선택된 Agent 유형 (schedule, todo, unknown)
+        tier: 결정한 단계 (skill_card, classifier, llm, fallback)
+        confidence: 결정 근거 점수 (0~1, llm 단계는 1.0)
+        card_id: 근거가 된 Skill Card ID (skill_card/classifier 단계)
+        cached: RouteCache에서 재사용한 결정인지 여부 (tier는 처음 결정한 단계)
+    """
+
+    agent_type: AgentType
+    tier: RouteTier
+    confidence: float = 0.0
+    card_id: str | None = None
+    cached: bool = False
+
+
+@dataclass(frozen=True)
+class RoutedIntent:
+    """
+    복합 요청에서 Agent 하나가 맡을 부분
+
+    Attributes:
+        query: 이 Agent에게 전달할 질문 (해당 절들, 단일 의도면 원래 질문)
+        decision: 라우팅 결정
+    """
+
+    query: str
+    decision: RouteDecision
+
+
+class TieredRouter:
+    """
+    Skill Card → 분류기 → LLM 순서의 단계별 라우터
+
+    Example:
+        >>> router = TieredRouter(SkillCardManager())
+        >>> router.route("내일 오후 2시에 팀 회의 일정 잡아줘")
+        RouteDecision(agent_type='schedule', tier='skill_card', confidence=1.0, ...)
+    """
+
+    def __init__(
+        self,
+        manager: SkillCardManager,
+        llm: Any | None = None,
+        agent_types: Mapping[str, AgentType] | None = None,
+        keyword_margin: float = 1.0,
+        min_similarity: float = 0.25,
+        min_margin: float = 0.1,
+        cache: "RouteCache | None" = None,
+    ):
+        """
+        Args:
+            manager: 트리거 인덱스를 가진 SkillCardManager
+            llm: 마지막 단계 LLM (invoke(messages).content, None이면 LLM 단계 생략)
+            agent_types: Skill Card agent_type → 라우팅 값 (None이면 기본 매핑)
+            keyword_margin: 여러 Agent가 키워드 매칭될 때 필요한 1등-2등 점수 차
+            min_similarity: 분류기가 결정하는 최소 유사도 (마지막 어절 제외)
+            min_margin: 분류기가 결정하는 1등-2등 유사도 차 (미달이면 LLM 단계로)
+            cache: 라우팅 결정 캐시 (None이면 매번 결정)
+        """
+        self.manager = manager
+        self.llm = llm
+        self.agent_types = dict(agent_types or DEFAULT_AGENT_TYPES)
+        self.keyword_margin = keyword_margin
+        self.min_similarity = min_similarity
+        self.min_margin = min_margin
+        self.cache = cache
+
+    def route(self, query: str) -> RouteDecision:
+        """
+        질문을 처리할 Agent 유형 결정
+
+        Args:
+            query: 사용자 질문
+
+        Returns:
+            RouteDecision (어느 단계에서 결정했는지 포함)
+        """
+        # 모든 단계가 같은 스냅샷을 보도록 한 번만 읽음
+        snapshot = self.manager.snapshot
+        if self.cache is None:
+            return self._decide(snapshot, query)
+
+        fingerprint = self.cache.fingerprint(snapshot)
+        decision = self.cache.get(query, fingerprint)
+        if decision is None:
+            decision = self._decide(snapshot, query)
+            self.cache.set(query, fingerprint, decision)
+        return decision
+
+    def route_intents(self, query: str) -> list[RoutedIntent]:
+        """
+        복합 요청을 Agent별 의도로 나누기
+
+        절마다 LLM 없이 Skill Card 단계로만 결정하고, 서로 다른 Agent로 확실히
+        결정된 절이 2개 이상일 때만 나눕니다. 결정하지 못한 절은 바로 앞 절과
+        같은 Agent에게 붙입니다 (맨 앞이면 다음 절). 나누지 않으면 전체 질문을
+        route()로 한 번만 결정하므로 LLM 호출은 많아야 1번입니다.
+
+        Args:
+            query: 사용자 질문
+
+        Returns:
+            RoutedIntent 목록 (절 순서, Agent당 하나).
+            의도가 하나면 [RoutedIntent(query, route(query))]
+        """
+        intents = self._split_intents(self.manager.snapshot, query)
+        return intents or [RoutedIntent(query, self.route(query))]
+
+    async def aroute(self, query: str) -> RouteDecision:
+        """
+        route()의 비동기 버전 (LLM 단계만 ainvoke로 기다림)
+
+        Skill Card/분류기 단계와 캐시 조회는 짧은 CPU 작업이라 그대로 실행합니다.
+
+        Args:
+            query: 사용자 질문
+
+        Returns:
+            RouteDecision
+        """
+        snapshot = self.manager.snapshot
+        if self.cache is None:
+            return await self._adecide(snapshot, query)
+
+        fingerprint = self.cache.fingerprint(snapshot)
+        decision = self.cache.get(query, fingerprint)
+        if decision is None:
+            decision = await self._adecide(snapshot, query)
+            self.cache.set(query, fingerprint, decision)
+        return decision
+
+    async def aroute_intents(self, query: str) -> list[RoutedIntent]:
+        """
+        route_intents()의 비동기 버전 (나누지 않을 때만 aroute()로 결정)
+
+        Args:
+            query: 사용자 질문
+
+        Returns:
+            RoutedIntent 목록
+        """
+        intents = self._split_intents(self.manager.snapshot, query)
+        return intents or [RoutedIntent(query, await self.aroute(query))]
+
+    def _decide(self, snapshot: RegistrySnapshot, query: str) -> RouteDecision:
+        decision, guess = self._decide_locally(snapshot, query)
+        return decision or self._ask_llm(query, guess)
+
+    async def _adecide(self, snapshot: RegistrySnapshot, query: str) -> RouteDecision:
+        decision, guess = self._decide_locally(snapshot, query)
+        return decision or await self._aask_llm(query, guess)
+
+    def _decide_locally(
+        self, snapshot: RegistrySnapshot, query: str
+    ) -> tuple[RouteDecision | None, RouteDecision | None]:
+        """
+        1~2단계 (LLM 없이)
+
+        Returns:
+            (결정, 결정하지 못했을 때의 최선 추정)
+        """
+        decision, guess = self._match_skill_cards(snapshot, query)
+        if decision is not None:
+            return decision, None
+
+        decision, classified = self._classify(snapshot, query)
+        if decision is not None:
+            return decision, None
+        return None, guess or classified
+
+    def _split_intents(
+        self, snapshot: RegistrySnapshot, query: str
+    ) -> list[RoutedIntent]:
+        """절별 1단계(Skill Card) 결정으로 의도 나누기 (나눌 수 없으면 빈 목록)"""
+        clauses = split_clauses(query)
+        if len(clauses) < 2:
+            return []
+        # 짧은 절은 분류기 결정이 불안정하므로 Skill Card 근거가 있는 절만 인정
+        # ("회의 끝나고 보고서 정리해줘"의 "-고"는 연결이 아니라 순서)
+        unknown = RouteDecision("unknown", "fallback")
+        decisions = []
+        for clause in clauses:
+            decision, _ = self._match_skill_cards(snapshot, clause)
+            decisions.append(decision or unknown)
+        known = {d.agent_type for d in decisions if d.agent_type != "unknown"}
+        if len(known) < 2:
+            return []
+        return _group_clauses(clauses, decisions)
+
+    def _label(self, snapshot: RegistrySnapshot, card_id: str) -> AgentType | None:
+        entry = snapshot.cards.entries.get(card_id)
+        if entry is None:
+            return None
+        return self.agent_types.get(entry.summary.get("agent_type", ""))
+
+    def _match_skill_cards(
+        self, snapshot: RegistrySnapshot, query: str
+    ) -> tuple[RouteDecision | None, RouteDecision | None]:
+        """
+        1단계: 트리거 키워드 → 예시 문장 (카드 임계값)
+
+        Returns:
+            (결정, 결정하지 못했을 때의 최선 추정)
+        """
+        # Agent 유형별 최고 키워드 점수 (점수순이므로 처음 나온 카드가 최고)
+        best: dict[AgentType, tuple[float, str]] = {}
+        for match in snapshot.keyword_index.search(query):
+            label = self._label(snapshot, match.card_id)
+            if label is not None and label not in best:
+                best[label] = (match.score, match.card_id)
+
+        if best:
+            ranked = sorted(best.items(), key=lambda item: -item[1][0])
+            label, (top, card_id) = ranked[0]
+            if len(ranked) == 1:
+                return RouteDecision(label, "skill_card", 1.0, card_id), None
+            gap = top - ranked[1][1][0]
+            confidence = gap / top if top > 0 else 0.0
+            if gap >= self.keyword_margin:
+                return RouteDecision(label, "skill_card", confidence, card_id), None
+            return None, RouteDecision(label, "fallback", confidence, card_id)
+
+        for match in snapshot.semantic_index.search(query):
+            label = self._label(snapshot, match.card_id)
+            if label is not None:
+                decision = RouteDecision(
+                    label, "skill_card", match.score, match.card_id
+                )
+                return decision, None
+        return None, None
+
+    def _classify(
+        self, snapshot: RegistrySnapshot, query: str
+    ) -> tuple[RouteDecision | None, RouteDecision | None]:
+        """
+        2단계: 예시 문장 최근접 이웃 분류 (마지막 어절 제외)
+
+        유사도가 애매하면 추정도 남기지 않습니다. 마지막 어절을 빼도 겹치는 말이
+        적은 질문은 다른 도메인일 가능성이 높아 LLM(없으면 unknown)에게 맡깁니다.
+
+        Returns:
+            (결정, None)
+        """
+        best: dict[AgentType, tuple[float, str]] = {}
+        content = _strip_predicate(query)
+        for match in snapshot.semantic_index.search(content, threshold=-1.0):
+            label = self._label(snapshot, match.card_id)
+            if label is not None and label not in best:
+                best[label] = (match.score, match.card_id)
+        if not best:
+            return None, None
+
+        ranked = sorted(best.items(), key=lambda item: -item[1][0])
+        label, (top, card_id) = ranked[0]
+        runner_up = ranked[1][1][0] if len(ranked) > 1 else 0.0
+        if top >= self.min_similarity and top - runner_up >= self.min_margin:
+            return RouteDecision(label, "classifier", top, card_id), None
+        return None, None
+
+    def _ask_llm(self, query: str, guess: RouteDecision | None) -> RouteDecision:
+        """
+        3단계: LLM 분류 (없거나 실패하면 최선 추정으로 fallback)
+        """
+        fallback = guess or RouteDecision("unknown", "fallback")
+        if self.llm is None:
+            return fallback
+        try:
+            response = self.llm.invoke(_llm_messages(query))
+        except Exception:
+            return fallback
+        return _parse_llm_answer(response.content, fallback)
+
+    async def _aask_llm(self, query: str, guess: RouteDecision | None) -> RouteDecision:
+        """3단계 비동기 버전 (llm.ainvoke)"""
+        fallback = guess or RouteDecision("unknown", "fallback")
+        if self.llm is None:
+            return fallback
+        try:
+            response = await self.llm.ainvoke(_llm_messages(query))
+        except Exception:
+            return fallback
+        return _parse_llm_answer(response.content, fallback)
+
+
+def _strip_predicate(query: str) -> str:
+    """문장 끝 서술어(마지막 어절) 제외 (한 어절이면 그대로)"""
+    words = query.split()
+    return " ".join(words[:-1]) if len(words) > 1 else query
+
+
+def _llm_messages(query: str) -> list:
+    return [
+        SystemMessage(content=ROUTING_PROMPT),
+        HumanMessage(content=f"질문: {query}"),
+    ]
+
+
+def _parse_llm_answer(content: Any, fallback: RouteDecision) -> RouteDecision:
+    """LLM 응답을 RouteDecision으로 (schedule/todo/unknown이 아니면 fallback)"""
+    agent_type = str(content).strip().lower()
+    if agent_type not in ("schedule", "todo", "unknown"):
+        return fallback
+    return RouteDecision(agent_type, "llm", 1.0)
+
+
+def _group_clauses(
+    clauses: list[str], decisions: list[RouteDecision]
+) -> list[RoutedIntent]:
+    """절을 Agent별로 묶기 (unknown 절은 앞 절, 맨 앞이면 첫 known 절의 Agent로)"""
+    owner = next(d for d in decisions if d.agent_type != "unknown")
+    grouped: dict[AgentType, tuple[RouteDecision, list[str]]] = {}
+    for clause, decision in zip(clauses, decisions, strict=True):
+        if decision.agent_type != "unknown":
+            owner = decision
+        grouped.setdefault(owner.agent_type, (owner, []))[1].append(clause)
+    return [
+        RoutedIntent(" ".join(parts), decision) for decision, parts in grouped.values()
+    ]
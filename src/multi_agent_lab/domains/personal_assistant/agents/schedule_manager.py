@@ -29,11 +29,14 @@
 - Prompt: AI의 역할 정의 ("당신은 일정 관리 전문가입니다")
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_ollama import ChatOllama
+from langchain_core.runnables import RunnableConfig
 
 from multi_agent_lab.core.middleware import BaseMiddleware
 from multi_agent_lab.domains.personal_assistant.tools.schedule_tools import (
@@ -41,6 +44,7 @@ from multi_agent_lab.domains.personal_assistant.tools.schedule_tools import (
     find_free_time,
     list_events,
 )
+from multi_agent_lab.infra.llm import get_chat_model
 
 
 class ScheduleManagerAgent:
@@ -56,22 +60,22 @@ class ScheduleManagerAgent:
         model_name: str = "gpt-oss:20b",
         temperature: float = 0.1,
         middleware: list[BaseMiddleware] | None = None,
+        llm: BaseChatModel | None = None,
     ):
         """
         Args:
             model_name: Ollama 모델명
             temperature: 생성 온도 (0.0 ~ 1.0)
             middleware: Middleware 리스트 (순서대로 실행)
+            llm: 사용할 Chat 모델 (None이면 (model_name, temperature)
+                공유 풀에서 가져옴)
         """
         self.model_name = model_name
         self.temperature = temperature
         self.middleware = middleware or []
 
-        # LLM 초기화
-        self.llm = ChatOllama(
-            model=model_name,
-            temperature=temperature,
-        )
+        # LLM (같은 설정의 Agent끼리 클라이언트 공유)
+        self.llm = llm or get_chat_model(model_name, temperature)
 
         # Tools 설정
         self.tools = [create_event, list_events, find_free_time]
@@ -96,6 +100,7 @@ class ScheduleManagerAgent:
         self.prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", self.system_prompt),
+                ("placeholder", "{chat_history}"),
                 ("human", "{input}"),
                 ("placeholder", "{agent_scratchpad}"),
             ]
@@ -116,12 +121,20 @@ class ScheduleManagerAgent:
             handle_parsing_errors=True,
         )
 
-    def chat(self, message: str, **kwargs) -> str:
+    def chat(
+        self,
+        message: str,
+        config: RunnableConfig | None = None,
+        history: Sequence[BaseMessage] | None = None,
+        **kwargs,
+    ) -> str:
         """
         간단한 채팅 인터페이스 (Middleware 지원)
 
         Args:
             message: 사용자 메시지
+            config: Runnable 설정 (callbacks, tags 등, 스트리밍 이벤트 전달용)
+            history: 이전 대화 턴 메시지 (프롬프트의 chat_history로 전달)
             **kwargs: 추가 컨텍스트 (user_id 등)
 
         Returns:
@@ -140,17 +153,14 @@ class ScheduleManagerAgent:
             >>> # PII가 자동으로 마스킹되고, 로그에 기록됨
         """
         # 1. Before Request - Middleware 전처리
-        processed_input = message
-        for mw in self.middleware:
-            try:
-                processed_input = mw.before_request(processed_input, **kwargs)
-            except Exception as e:
-                mw.on_error(e, **kwargs)
-                raise
+        processed_input = self._before_request(message, **kwargs)
 
         # 2. Agent 실행
         try:
-            result = self.executor.invoke({"input": processed_input})
+            result = self.executor.invoke(
+                {"input": processed_input, "chat_history": list(history or [])},
+                config=config,
+            )
             output = result["output"]
         except Exception as e:
             # 에러 발생 시 모든 middleware에 알림
@@ -159,6 +169,55 @@ class ScheduleManagerAgent:
             raise
 
         # 3. After Response - Middleware 후처리
+        return self._after_response(output, **kwargs)
+
+    async def achat(
+        self,
+        message: str,
+        config: RunnableConfig | None = None,
+        history: Sequence[BaseMessage] | None = None,
+        **kwargs,
+    ) -> str:
+        """
+        chat()의 비동기 버전 (Ollama 응답을 기다리는 동안 이벤트 루프를 막지 않음)
+
+        Args:
+            message: 사용자 메시지
+            config: Runnable 설정 (callbacks, tags 등, 스트리밍 이벤트 전달용)
+            history: 이전 대화 턴 메시지 (프롬프트의 chat_history로 전달)
+            **kwargs: 추가 컨텍스트 (user_id 등)
+
+        Returns:
+            str: Agent 응답
+        """
+        processed_input = self._before_request(message, **kwargs)
+
+        try:
+            result = await self.executor.ainvoke(
+                {"input": processed_input, "chat_history": list(history or [])},
+                config=config,
+            )
+            output = result["output"]
+        except Exception as e:
+            for mw in self.middleware:
+                mw.on_error(e, **kwargs)
+            raise
+
+        return self._after_response(output, **kwargs)
+
+    def _before_request(self, message: str, **kwargs) -> str:
+        """Middleware 전처리 (실패하면 해당 middleware에 알리고 다시 발생)"""
+        processed_input = message
+        for mw in self.middleware:
+            try:
+                processed_input = mw.before_request(processed_input, **kwargs)
+            except Exception as e:
+                mw.on_error(e, **kwargs)
+                raise
+        return processed_input
+
+    def _after_response(self, output: str, **kwargs) -> str:
+        """Middleware 후처리 (실패하면 해당 middleware에 알리고 다시 발생)"""
         processed_output = output
         for mw in self.middleware:
             try:
@@ -166,7 +225,6 @@ class ScheduleManagerAgent:
             except Exception as e:
                 mw.on_error(e, **kwargs)
                 raise
-
         return processed_output
 
     def invoke(self, message: str, **kwargs) -> dict[str, Any]:
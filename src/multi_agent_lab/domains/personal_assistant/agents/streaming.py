@@ -0,0 +1,123 @@
+"""
+Supervisor 스트리밍 이벤트
+
+LangGraph 스트리밍 모드(messages / custom / updates)의 출력을
+화면에 바로 그릴 수 있는 dict 이벤트로 바꾸는 모듈
+
+📌 목적:
+- Sub-Agent 전체 응답을 기다리지 않고 LLM 토큰을 생성되는 대로 전달
+- 도구 호출 시작/종료를 이벤트로 전달 ("📅 find_free_time 실행 중...")
+- 사용자가 체감하는 지연 = 첫 토큰까지의 시간
+
+💡 이벤트 형식:
+    {"type": "token", "agent": "todo", "content": "남은"}          # messages 모드
+    {"type": "tool_start", "agent": "todo", "tool": "list_tasks", "input": {...}}
+    {"type": "tool_end", "agent": "todo", "tool": "list_tasks", "output": "..."}
+    {"type": "tool_error", "agent": "todo", "tool": "list_tasks", "error": "..."}
+    {"type": "update", "node": "merge", "data": {"response": "..."}}  # updates 모드
+
+💡 사용 방식:
+    for event in supervisor.stream("오늘 할일 보여줘"):
+        if event["type"] == "token":
+            print(event["content"], end="", flush=True)
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+
+StreamEvent = dict[str, Any]
+
+
+class ToolEventHandler(BaseCallbackHandler):
+    """
+    Sub-Agent의 도구 호출을 스트리밍 이벤트로 내보내는 콜백
+
+    LangGraph의 get_stream_writer()를 writer로 받아 custom 모드로 전달합니다.
+    """
+
+    # 비동기 실행에서도 이벤트 순서를 지키도록 같은 스레드에서 호출
+    run_inline = True
+
+    def __init__(self, agent_type: str, writer: Callable[[Any], None]):
+        """
+        Args:
+            agent_type: 도구를 호출한 Agent 유형 (schedule, todo)
+            writer: 이벤트를 받을 함수 (get_stream_writer())
+        """
+        self.agent_type = agent_type
+        self.writer = writer
+        # run_id → 도구 이름 (on_tool_end에는 이름이 없음)
+        self._tools: dict[UUID, str] = {}
+
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        inputs: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        self._tools[run_id] = name
+        self.writer(
+            {
+                "type": "tool_start",
+                "agent": self.agent_type,
+                "tool": name,
+                "input": inputs if inputs is not None else input_str,
+            }
+        )
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any):
+        self.writer(
+            {
+                "type": "tool_end",
+                "agent": self.agent_type,
+                "tool": self._tools.pop(run_id, "tool"),
+                "output": str(getattr(output, "content", output)),
+            }
+        )
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self.writer(
+            {
+                "type": "tool_error",
+                "agent": self.agent_type,
+                "tool": self._tools.pop(run_id, "tool"),
+                "error": str(error),
+            }
+        )
+
+
+def to_stream_events(
+    mode: str, chunk: Any, agent_nodes: dict[str, str]
+) -> Iterable[StreamEvent]:
+    """
+    LangGraph 스트림 출력 하나를 StreamEvent로 변환
+
+    Args:
+        mode: 스트리밍 모드 (messages, custom, updates)
+        chunk: 해당 모드의 출력
+        agent_nodes: 실행 Node 이름 → Agent 유형 (이 Node의 토큰만 전달,
+            router의 분류 LLM 토큰은 제외)
+
+    Yields:
+        StreamEvent
+    """
+    if mode == "messages":
+        message, metadata = chunk
+        agent = agent_nodes.get(metadata.get("langgraph_node", ""))
+        content = message.content if isinstance(message, BaseMessage) else None
+        if agent is not None and isinstance(content, str) and content:
+            yield {"type": "token", "agent": agent, "content": content}
+    elif mode == "custom":
+        if isinstance(chunk, dict) and "type" in chunk:
+            yield chunk
+    elif mode == "updates":
+        for node, data in chunk.items():
+            yield {"type": "update", "node": node, "data": data}
@@ -13,6 +13,12 @@ Supervisor 패턴을 사용하여 사용자 질문을 분석하고
     response = supervisor.chat("내일 오후 2시에 회의 잡아줘")
     print(response)
 
+    # 대화 상태를 Redis에 저장 (어느 워커에서든 thread_id로 이어서 대화)
+    supervisor = PersonalAssistantSupervisor(
+        checkpointer=RedisCheckpointSaver(RedisClient(RedisConfig.from_env()))
+    )
+    supervisor.chat("장보기 할일 추가해줘", thread_id="user-123")
+
 실행:
     uv run python -m src.examples.10_langgraph_supervisor
 
@@ -23,37 +29,162 @@ Supervisor 패턴을 사용하여 사용자 질문을 분석하고
                       │
                       ▼
     ┌─────────────────────────────────────────┐
-    │          Router (LLM 판단)               │
+    │     Router (Skill Card → 분류기 → LLM)   │
     │   "일정" → schedule / "할일" → todo      │
     └─────────────────┬───────────────────────┘
-                      │
+                      │  의도별 Send (복합 요청은 병렬 실행)
           ┌───────────┼───────────┐
           ▼           ▼           ▼
     ┌──────────┐ ┌──────────┐ ┌──────────┐
     │ Schedule │ │   Todo   │ │ Fallback │
     │  Agent   │ │  Agent   │ │          │
     └──────────┘ └──────────┘ └──────────┘
-                      │
+          └───────────┼───────────┘
                       ▼
     ┌─────────────────────────────────────────┐
-    │            Final Response               │
+    │     Merge (Agent별 응답 → 최종 응답)     │
     └─────────────────────────────────────────┘
 """
 
-from typing import Literal, TypedDict
+import threading
+from collections.abc import AsyncIterator, Iterator, Sequence
+from pathlib import Path
+from typing import Annotated, Any, NotRequired, TypedDict
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_ollama import ChatOllama
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables.config import merge_configs
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
+
+from multi_agent_lab.infra.llm import get_chat_model
+from multi_agent_lab.platform.skill_card import SkillCardManager
 
+from .route_cache import RouteCache
+from .routing import AgentType, RoutedIntent, RouteTier, TieredRouter
 from .schedule_manager import ScheduleManagerAgent
+from .streaming import StreamEvent, ToolEventHandler, to_stream_events
 from .todo_manager import TodoManagerAgent
 
+# personal_assistant 도메인의 Skill Card 디렉토리 (실행 위치와 무관)
+SKILL_CARDS_DIR = Path(__file__).resolve().parent.parent / "skill_cards"
+
+# Agent 유형 → 실행 Node
+EXECUTOR_NODES: dict[AgentType, str] = {
+    "schedule": "schedule_executor",
+    "todo": "todo_executor",
+    "unknown": "fallback",
+}
+
+# Agent 유형 → Sub-Agent 클래스 (처음 라우팅될 때 생성)
+SUB_AGENTS: dict[AgentType, type] = {
+    "schedule": ScheduleManagerAgent,
+    "todo": TodoManagerAgent,
+}
+
+# 복합 요청 응답을 합칠 때 Agent별 머리말
+RESPONSE_HEADERS: dict[AgentType, str] = {
+    "schedule": "📅 일정",
+    "todo": "✅ 할일",
+    "unknown": "❓ 기타",
+}
+
+# 토큰을 전달할 실행 Node → Agent 유형 (router 분류 LLM 토큰은 제외)
+STREAM_NODES: dict[str, AgentType] = {
+    node: agent_type
+    for agent_type, node in EXECUTOR_NODES.items()
+    if agent_type in SUB_AGENTS
+}
+
+# stream() 기본 모드: LLM 토큰 + 도구 이벤트 + Node 완료
+STREAM_MODES = ("messages", "custom", "updates")
+
+# 대화 상태에 보관할 최근 턴 수 (체크포인트 크기 제한)
+MAX_HISTORY_TURNS = 20
+
+# Sub-Agent 프롬프트(chat_history)에 넣을 최근 턴 수 (LLM 컨텍스트 제한)
+AGENT_HISTORY_TURNS = 5
+
 # =============================================================================
 # State 정의
 # =============================================================================
 
 
+class Intent(TypedDict):
+    """
+    복합 요청에서 Agent 하나가 맡을 부분
+
+    Attributes:
+        agent_type: 담당 Agent 유형
+        query: 해당 Agent에게 전달할 질문
+        route_tier: 라우팅을 결정한 단계
+    """
+
+    agent_type: AgentType
+    query: str
+    route_tier: RouteTier
+
+
+class AgentResponse(TypedDict):
+    """
+    Agent 실행 Node 하나의 응답
+
+    Attributes:
+        agent_type: 응답한 Agent 유형
+        response: Agent 응답
+    """
+
+    agent_type: AgentType
+    response: str
+
+
+class Turn(TypedDict):
+    """
+    대화 한 턴 (체크포인터 사용 시 thread별로 누적)
+
+    Attributes:
+        query: 사용자 질문
+        agent_type: 처리한 Agent 유형 (복합 요청이면 첫 의도)
+        response: 최종 응답
+    """
+
+    query: str
+    agent_type: AgentType
+    response: str
+
+
+def add_responses(
+    left: list[AgentResponse] | None, right: list[AgentResponse] | None
+) -> list[AgentResponse]:
+    """responses 리듀서: 병렬 Node 응답은 이어 붙이고, None이면 새 턴으로 초기화"""
+    if right is None:
+        return []
+    return [*(left or []), *right]
+
+
+def add_history(left: list[Turn] | None, right: list[Turn]) -> list[Turn]:
+    """history 리듀서: 최근 MAX_HISTORY_TURNS개 턴만 유지"""
+    return [*(left or []), *right][-MAX_HISTORY_TURNS:]
+
+
+def history_messages(history: Sequence[Turn]) -> list[BaseMessage]:
+    """
+    이전 턴 기록 → Sub-Agent 프롬프트의 chat_history 메시지
+
+    Args:
+        history: 체크포인터로 복원한 이전 턴 기록
+
+    Returns:
+        list[BaseMessage]: 최근 AGENT_HISTORY_TURNS개 턴의 질문/응답 메시지
+    """
+    messages: list[BaseMessage] = []
+    for turn in history[-AGENT_HISTORY_TURNS:]:
+        messages += [HumanMessage(turn["query"]), AIMessage(turn["response"])]
+    return messages
+
+
 class SupervisorState(TypedDict):
     """
     Supervisor의 상태를 정의하는 TypedDict
@@ -63,13 +194,23 @@ class SupervisorState(TypedDict):
 
     Attributes:
         query: 사용자 질문
-        agent_type: 선택된 Agent 유형 (schedule, todo, unknown)
-        response: Agent 응답
+        agent_type: 선택된 Agent 유형 (schedule, todo, unknown, 복합 요청이면 첫 의도)
+        response: 최종 응답 (merge Node가 responses를 합친 결과)
+        route_tier: 라우팅을 결정한 단계 (skill_card, classifier, llm, fallback)
+        intents: 의도별 Agent와 질문 (복합 요청이면 2개 이상)
+        responses: Agent 실행 Node별 응답 (병렬 Node의 결과를 이어 붙임,
+            매 턴 시작 시 초기화)
+        history: 이전 턴 기록 (체크포인터로 thread별 복원, 최근 20턴,
+            Sub-Agent 프롬프트의 chat_history로 전달)
     """
 
     query: str
-    agent_type: Literal["schedule", "todo", "unknown"]
+    agent_type: AgentType
     response: str
+    route_tier: NotRequired[RouteTier]
+    intents: NotRequired[list[Intent]]
+    responses: NotRequired[Annotated[list[AgentResponse], add_responses]]
+    history: NotRequired[Annotated[list[Turn], add_history]]
 
 
 # =============================================================================
@@ -92,9 +233,13 @@ class PersonalAssistantSupervisor:
 
     Attributes:
         model_name: 사용할 Ollama 모델명
-        llm: LLM 인스턴스 (라우팅용)
-        schedule_agent: 일정 관리 Agent
-        todo_agent: 할일 관리 Agent
+        llm: LLM 인스턴스 (라우팅 마지막 단계용)
+        skill_cards: 라우팅에 사용하는 SkillCardManager
+        router: 단계별 라우터 (TieredRouter)
+        route_cache: 라우팅 결정 캐시 (RouteCache)
+        checkpointer: 대화 상태 저장소 (None이면 매 턴 독립 실행)
+        schedule_agent: 일정 관리 Agent (처음 사용할 때 생성)
+        todo_agent: 할일 관리 Agent (처음 사용할 때 생성)
         graph: LangGraph StateGraph
         app: 컴파일된 그래프 앱
 
@@ -108,48 +253,103 @@ class PersonalAssistantSupervisor:
         self,
         model_name: str = "gpt-oss:20b",
         verbose: bool = True,
+        skill_cards: SkillCardManager | None = None,
+        route_cache: RouteCache | None = None,
+        checkpointer: BaseCheckpointSaver | None = None,
     ):
         """
         Args:
             model_name: Ollama 모델명
             verbose: 상세 로그 출력 여부
+            skill_cards: 라우팅용 SkillCardManager
+                (None이면 personal_assistant/skill_cards 로드)
+            route_cache: 라우팅 결정 캐시 (None이면 프로세스 내 LRU 캐시,
+                여러 워커가 공유하려면 RouteCache(redis=RedisClient(...)))
+            checkpointer: 대화 상태 저장소 (예: RedisCheckpointSaver). 지정하면
+                chat/invoke 등에 thread_id를 넘겨 이전 턴 상태에서 이어갑니다
         """
         self.model_name = model_name
         self.verbose = verbose
 
-        # 라우팅용 LLM (빠른 판단을 위해 temperature=0)
-        self.llm = ChatOllama(
-            model=model_name,
-            temperature=0.0,
-        )
+        # 라우팅 마지막 단계용 LLM (빠른 판단을 위해 temperature=0, 공유 풀)
+        self.llm = get_chat_model(model_name, temperature=0.0)
 
-        # Sub-Agents 초기화
-        if self.verbose:
-            print("🔧 Sub-Agents 초기화 중...")
+        # 단계별 라우터 (Skill Card/분류기로 결정하면 LLM 호출 없음)
+        self.skill_cards = skill_cards or SkillCardManager(SKILL_CARDS_DIR)
+        self.route_cache = route_cache or RouteCache()
+        self.router = TieredRouter(
+            self.skill_cards, llm=self.llm, cache=self.route_cache
+        )
 
-        self.schedule_agent = ScheduleManagerAgent(model_name=model_name)
-        self.todo_agent = TodoManagerAgent(model_name=model_name)
-
-        if self.verbose:
-            print("   ✅ ScheduleManagerAgent 준비 완료")
-            print("   ✅ TodoManagerAgent 준비 완료")
+        # Sub-Agents는 처음 라우팅될 때 생성 (agent_type → Agent)
+        self._agents: dict[AgentType, Any] = {}
+        self._agents_lock = threading.Lock()
 
         # LangGraph 구성
         if self.verbose:
             print("🔧 LangGraph 구성 중...")
 
+        self.checkpointer = checkpointer
         self.graph = self._build_graph()
-        self.app = self.graph.compile()
+        self.app = self.graph.compile(checkpointer=checkpointer)
 
         if self.verbose:
             print("   ✅ StateGraph 컴파일 완료")
 
+    @property
+    def schedule_agent(self) -> ScheduleManagerAgent:
+        """일정 관리 Agent (처음 접근할 때 생성)"""
+        return self._get_agent("schedule")
+
+    @schedule_agent.setter
+    def schedule_agent(self, agent: Any):
+        self._agents["schedule"] = agent
+
+    @property
+    def todo_agent(self) -> TodoManagerAgent:
+        """할일 관리 Agent (처음 접근할 때 생성)"""
+        return self._get_agent("todo")
+
+    @todo_agent.setter
+    def todo_agent(self, agent: Any):
+        self._agents["todo"] = agent
+
+    @property
+    def loaded_agents(self) -> frozenset[AgentType]:
+        """이미 생성된 Sub-Agent 유형"""
+        return frozenset(self._agents)
+
+    def _get_agent(self, agent_type: AgentType) -> Any:
+        """
+        Sub-Agent 조회 (없으면 생성해서 캐시)
+
+        병렬 branch가 동시에 접근해도 Agent는 하나만 생성됩니다.
+        Agent들의 LLM은 (model_name, temperature) 공유 풀에서 가져옵니다.
+        """
+        agent = self._agents.get(agent_type)
+        if agent is not None:
+            return agent
+
+        with self._agents_lock:
+            agent = self._agents.get(agent_type)
+            if agent is None:
+                factory = SUB_AGENTS[agent_type]
+                if self.verbose:
+                    print(f"🔧 {factory.__name__} 초기화 중...")
+                agent = factory(model_name=self.model_name)
+                self._agents[agent_type] = agent
+        return agent
+
     def _build_graph(self) -> StateGraph:
         """
         LangGraph StateGraph 구성
 
         그래프 구조:
-            START → router → (schedule_executor | todo_executor | fallback) → END
+            START → router → (schedule_executor | todo_executor | fallback)
+                  → merge → END
+
+        복합 요청은 router가 의도별로 Send를 보내서 schedule_executor와
+        todo_executor가 같은 super-step에서 병렬로 실행됩니다.
 
         Returns:
             StateGraph: 구성된 그래프
@@ -159,151 +359,232 @@ class PersonalAssistantSupervisor:
         graph = StateGraph(SupervisorState)
 
         # Node 추가
-        graph.add_node("router", self._router)
-        graph.add_node("schedule_executor", self._execute_schedule)
-        graph.add_node("todo_executor", self._execute_todo)
+        # 동기(invoke)/비동기(ainvoke) 구현을 함께 등록
+        graph.add_node("router", RunnableLambda(self._router, afunc=self._arouter))
+        graph.add_node(
+            "schedule_executor",
+            RunnableLambda(self._execute_schedule, afunc=self._aexecute_schedule),
+        )
+        graph.add_node(
+            "todo_executor",
+            RunnableLambda(self._execute_todo, afunc=self._aexecute_todo),
+        )
         graph.add_node("fallback", self._fallback)
+        graph.add_node("merge", self._merge)
 
         # Entry Point 설정
         graph.set_entry_point("router")
 
-        # Conditional Edge: router → (schedule | todo | fallback)
+        # Conditional Edge: router → 의도별 (schedule | todo | fallback)
         graph.add_conditional_edges(
-            "router",
-            self._route_decision,
-            {
-                "schedule": "schedule_executor",
-                "todo": "todo_executor",
-                "unknown": "fallback",
-            },
+            "router", self._route_decision, list(EXECUTOR_NODES.values())
         )
 
-        # 종료 Edge
-        graph.add_edge("schedule_executor", END)
-        graph.add_edge("todo_executor", END)
-        graph.add_edge("fallback", END)
+        # 실행 Node → merge (병렬 branch가 모두 끝난 뒤 한 번 실행) → 종료
+        for node in EXECUTOR_NODES.values():
+            graph.add_edge(node, "merge")
+        graph.add_edge("merge", END)
 
         return graph
 
     def _router(self, state: SupervisorState) -> dict:
         """
-        Router Node: LLM이 Agent 유형 판단
+        Router Node: 단계별 라우터로 Agent 유형 판단
 
-        사용자 질문을 분석하여 적절한 Agent 유형을 결정합니다.
+        Skill Card 트리거 → 로컬 분류기 → LLM 순서로 시도하고,
+        확신이 없을 때만 다음 단계로 넘깁니다. 여러 Agent가 필요한
+        복합 요청은 의도별로 나눕니다.
 
         Args:
             state: 현재 상태
 
         Returns:
-            dict: 업데이트된 상태 (agent_type 포함)
+            dict: 업데이트된 상태 (agent_type, route_tier, intents 포함)
         """
         if self.verbose:
             print("\n🔀 Router: 질문 분석 중...")
-            print(f"   질문: {state.query}")
-
-        # 라우팅 프롬프트
-        routing_prompt = """당신은 질문 분류 전문가입니다.
-
-사용자 질문을 분석하여 다음 중 하나로 분류하세요:
-
-- schedule: 일정, 회의, 약속, 캘린더, 시간 관련 질문
-  예: "내일 회의 잡아줘", "이번 주 일정 보여줘", "오후 3시에 약속 있어?"
-
-- todo: 할일, 작업, 태스크, 목록 관련 질문
-  예: "장보기 추가해줘", "오늘 할일 뭐야?", "숙제 완료 처리해줘"
+            print(f"   질문: {state['query']}")
 
-- unknown: 위 두 가지에 해당하지 않는 질문
+        return self._router_update(self.router.route_intents(state["query"]))
 
-반드시 schedule, todo, unknown 중 하나만 응답하세요. 다른 말은 하지 마세요."""
-
-        messages = [
-            SystemMessage(content=routing_prompt),
-            HumanMessage(content=f"질문: {state.query}"),
-        ]
+    async def _arouter(self, state: SupervisorState) -> dict:
+        """Router Node 비동기 버전 (LLM 단계는 ainvoke)"""
+        if self.verbose:
+            print("\n🔀 Router: 질문 분석 중...")
+            print(f"   질문: {state['query']}")
 
-        # LLM 호출
-        response = self.llm.invoke(messages)
-        agent_type = response.content.strip().lower()
-
-        # 유효성 검증
-        if agent_type not in ["schedule", "todo", "unknown"]:
-            # 키워드 기반 폴백
-            query_lower = state.query.lower()
-            if any(
-                kw in query_lower for kw in ["일정", "회의", "약속", "캘린더", "시간"]
-            ):
-                agent_type = "schedule"
-            elif any(
-                kw in query_lower for kw in ["할일", "태스크", "작업", "추가", "완료"]
-            ):
-                agent_type = "todo"
-            else:
-                agent_type = "unknown"
+        return self._router_update(await self.router.aroute_intents(state["query"]))
 
+    def _router_update(self, routed: list[RoutedIntent]) -> dict:
+        """라우팅 결과 → 상태 업데이트 (agent_type, route_tier, intents)"""
         if self.verbose:
-            print(f"   → Agent 유형: {agent_type}")
-
-        return {"agent_type": agent_type}
+            for intent in routed:
+                decision = intent.decision
+                cached = ", cached" if decision.cached else ""
+                print(
+                    f"   → Agent 유형: {decision.agent_type} "
+                    f"(tier={decision.tier}, "
+                    f"confidence={decision.confidence:.2f}{cached})"
+                    + (f" ← {intent.query}" if len(routed) > 1 else "")
+                )
+
+        intents: list[Intent] = [
+            {
+                "agent_type": intent.decision.agent_type,
+                "query": intent.query,
+                "route_tier": intent.decision.tier,
+            }
+            for intent in routed
+        ]
+        return {
+            "agent_type": intents[0]["agent_type"],
+            "route_tier": intents[0]["route_tier"],
+            "intents": intents,
+        }
 
-    def _route_decision(self, state: SupervisorState) -> str:
+    def _route_decision(self, state: SupervisorState) -> list[Send]:
         """
         라우팅 결정 함수
 
-        Conditional Edge에서 사용되어 다음 Node를 결정합니다.
+        Conditional Edge에서 사용되어 의도마다 실행 Node로 Send를 보냅니다.
+        Send마다 해당 의도의 질문만 담긴 상태가 전달됩니다.
 
         Args:
             state: 현재 상태
 
         Returns:
-            str: 다음 Node 이름 (schedule, todo, unknown)
+            list[Send]: 의도별 (실행 Node 이름, 상태)
         """
-        return state.agent_type
+        intents = state.get("intents") or [
+            {
+                "agent_type": state["agent_type"],
+                "query": state["query"],
+                "route_tier": state.get("route_tier", "fallback"),
+            }
+        ]
+        return [
+            Send(
+                EXECUTOR_NODES[intent["agent_type"]],
+                {**state, "query": intent["query"], "agent_type": intent["agent_type"]},
+            )
+            for intent in intents
+        ]
 
-    def _execute_schedule(self, state: SupervisorState) -> dict:
+    def _execute_schedule(
+        self, state: SupervisorState, config: RunnableConfig | None = None
+    ) -> dict:
         """
         Schedule Agent 실행 Node
 
         Args:
             state: 현재 상태
+            config: 그래프 실행 설정 (스트리밍 콜백을 Agent까지 전달)
 
         Returns:
-            dict: 업데이트된 상태 (response 포함)
+            dict: 업데이트된 상태 (responses에 추가할 응답)
         """
         if self.verbose:
             print("\n📅 ScheduleAgent 실행 중...")
 
         try:
-            response = self.schedule_agent.chat(state.query)
+            response = self.schedule_agent.chat(
+                state["query"],
+                config=self._agent_config(config, "schedule"),
+                history=history_messages(state.get("history", [])),
+            )
         except Exception as e:
             response = f"일정 처리 중 오류가 발생했습니다: {e}"
 
         if self.verbose:
             print("   ✅ 완료")
 
-        return {"response": response}
+        return {"responses": [{"agent_type": "schedule", "response": response}]}
+
+    async def _aexecute_schedule(
+        self, state: SupervisorState, config: RunnableConfig | None = None
+    ) -> dict:
+        """Schedule Agent 실행 Node 비동기 버전 (agent.achat)"""
+        if self.verbose:
+            print("\n📅 ScheduleAgent 실행 중...")
+
+        try:
+            response = await self.schedule_agent.achat(
+                state["query"],
+                config=self._agent_config(config, "schedule"),
+                history=history_messages(state.get("history", [])),
+            )
+        except Exception as e:
+            response = f"일정 처리 중 오류가 발생했습니다: {e}"
 
-    def _execute_todo(self, state: SupervisorState) -> dict:
+        if self.verbose:
+            print("   ✅ 완료")
+
+        return {"responses": [{"agent_type": "schedule", "response": response}]}
+
+    def _execute_todo(
+        self, state: SupervisorState, config: RunnableConfig | None = None
+    ) -> dict:
         """
         Todo Agent 실행 Node
 
         Args:
             state: 현재 상태
+            config: 그래프 실행 설정 (스트리밍 콜백을 Agent까지 전달)
 
         Returns:
-            dict: 업데이트된 상태 (response 포함)
+            dict: 업데이트된 상태 (responses에 추가할 응답)
         """
         if self.verbose:
             print("\n✅ TodoAgent 실행 중...")
 
         try:
-            response = self.todo_agent.chat(state.query)
+            response = self.todo_agent.chat(
+                state["query"],
+                config=self._agent_config(config, "todo"),
+                history=history_messages(state.get("history", [])),
+            )
+        except Exception as e:
+            response = f"할일 처리 중 오류가 발생했습니다: {e}"
+
+        if self.verbose:
+            print("   ✅ 완료")
+
+        return {"responses": [{"agent_type": "todo", "response": response}]}
+
+    async def _aexecute_todo(
+        self, state: SupervisorState, config: RunnableConfig | None = None
+    ) -> dict:
+        """Todo Agent 실행 Node 비동기 버전 (agent.achat)"""
+        if self.verbose:
+            print("\n✅ TodoAgent 실행 중...")
+
+        try:
+            response = await self.todo_agent.achat(
+                state["query"],
+                config=self._agent_config(config, "todo"),
+                history=history_messages(state.get("history", [])),
+            )
         except Exception as e:
             response = f"할일 처리 중 오류가 발생했습니다: {e}"
 
         if self.verbose:
             print("   ✅ 완료")
 
-        return {"response": response}
+        return {"responses": [{"agent_type": "todo", "response": response}]}
+
+    def _agent_config(
+        self, config: RunnableConfig | None, agent_type: AgentType
+    ) -> RunnableConfig | None:
+        """
+        Sub-Agent 실행 설정 (그래프 설정 + 도구 이벤트 콜백)
+
+        그래프 설정을 그대로 넘겨야 messages 모드가 Sub-Agent의 LLM 토큰을
+        받을 수 있습니다. 도구 호출은 ToolEventHandler가 custom 모드로 전달합니다.
+        """
+        if config is None:
+            return None
+        handler = ToolEventHandler(agent_type, get_stream_writer())
+        return merge_configs(config, {"callbacks": [handler]})
 
     def _fallback(self, state: SupervisorState) -> dict:
         """
@@ -313,7 +594,7 @@ class PersonalAssistantSupervisor:
             state: 현재 상태
 
         Returns:
-            dict: 업데이트된 상태 (response 포함)
+            dict: 업데이트된 상태 (responses에 추가할 응답)
         """
         if self.verbose:
             print("\n❓ Fallback: 처리할 수 없는 요청")
@@ -329,9 +610,45 @@ class PersonalAssistantSupervisor:
 - "장보기 할일 추가해줘"
 - "오늘 할일 목록 보여줘"
 """
-        return {"response": response}
+        return {"responses": [{"agent_type": "unknown", "response": response}]}
+
+    def _merge(self, state: SupervisorState) -> dict:
+        """
+        Merge Node: Agent별 응답을 최종 응답으로 합치기
+
+        응답이 하나면 그대로, 여러 개면 의도 순서대로 머리말을 붙여 합칩니다.
+
+        Args:
+            state: 현재 상태
+
+        Returns:
+            dict: 업데이트된 상태 (response, 이번 턴 history 포함)
+        """
+        responses = state.get("responses", [])
+        if len(responses) == 1:
+            return self._finish_turn(state, responses[0]["response"])
+
+        order = {
+            intent["agent_type"]: i for i, intent in enumerate(state.get("intents", []))
+        }
+        ordered = sorted(
+            responses, key=lambda r: order.get(r["agent_type"], len(order))
+        )
+        response = "\n\n".join(
+            f"{RESPONSE_HEADERS[r['agent_type']]}\n{r['response']}" for r in ordered
+        )
+        return self._finish_turn(state, response)
+
+    def _finish_turn(self, state: SupervisorState, response: str) -> dict:
+        """최종 응답 + 이번 턴 기록"""
+        turn: Turn = {
+            "query": state["query"],
+            "agent_type": state["agent_type"],
+            "response": response,
+        }
+        return {"response": response, "history": [turn]}
 
-    def chat(self, query: str) -> str:
+    def chat(self, query: str, thread_id: str | None = None) -> str:
         """
         메인 인터페이스
 
@@ -339,6 +656,7 @@ class PersonalAssistantSupervisor:
 
         Args:
             query: 사용자 질문
+            thread_id: 대화 ID (checkpointer를 지정했을 때 필수)
 
         Returns:
             str: Agent 응답
@@ -348,15 +666,8 @@ class PersonalAssistantSupervisor:
             print("🤖 Supervisor: 새 요청 수신")
             print("=" * 60)
 
-        # 초기 상태 생성 (TypedDict는 모든 필드 명시)
-        initial_state: SupervisorState = {
-            "query": query,
-            "agent_type": "unknown",
-            "response": "",
-        }
-
         # 그래프 실행
-        result = self.app.invoke(initial_state)
+        result = self.invoke(query, thread_id)
 
         if self.verbose:
             print("\n" + "=" * 60)
@@ -365,22 +676,187 @@ class PersonalAssistantSupervisor:
 
         return result["response"]
 
-    def invoke(self, query: str) -> dict:
+    def invoke(self, query: str, thread_id: str | None = None) -> dict:
         """
         상세 결과 반환용 인터페이스
 
         Args:
             query: 사용자 질문
+            thread_id: 대화 ID (checkpointer를 지정했을 때 필수)
+
+        Returns:
+            dict: 전체 상태 (query, agent_type, response, route_tier,
+                intents, responses, history)
+        """
+        return self.app.invoke(
+            self._initial_state(query), self._thread_config(thread_id)
+        )
+
+    async def achat(self, query: str, thread_id: str | None = None) -> str:
+        """
+        chat()의 비동기 버전
+
+        Ollama 응답을 기다리는 동안 이벤트 루프를 막지 않으므로, 한 프로세스에서
+        여러 대화를 동시에 처리할 수 있습니다.
+
+        Args:
+            query: 사용자 질문
+            thread_id: 대화 ID (checkpointer를 지정했을 때 필수)
 
         Returns:
-            dict: 전체 상태 (query, agent_type, response)
+            str: Agent 응답
         """
-        initial_state: SupervisorState = {
+        if self.verbose:
+            print("\n" + "=" * 60)
+            print("🤖 Supervisor: 새 요청 수신")
+            print("=" * 60)
+
+        result = await self.ainvoke(query, thread_id)
+
+        if self.verbose:
+            print("\n" + "=" * 60)
+            print("🏁 처리 완료")
+            print("=" * 60)
+
+        return result["response"]
+
+    async def ainvoke(self, query: str, thread_id: str | None = None) -> dict:
+        """
+        invoke()의 비동기 버전
+
+        Args:
+            query: 사용자 질문
+            thread_id: 대화 ID (checkpointer를 지정했을 때 필수)
+
+        Returns:
+            dict: 전체 상태
+        """
+        return await self.app.ainvoke(
+            self._initial_state(query), self._thread_config(thread_id)
+        )
+
+    async def abatch(
+        self,
+        queries: list[str],
+        max_concurrency: int = 8,
+        thread_ids: Sequence[str] | None = None,
+    ) -> list[str]:
+        """
+        여러 질문을 동시에 처리
+
+        Args:
+            queries: 사용자 질문 목록
+            max_concurrency: 동시에 실행할 최대 대화 수
+            thread_ids: 질문별 대화 ID (checkpointer를 지정했을 때 필수)
+
+        Returns:
+            list[str]: 질문 순서대로 Agent 응답
+
+        Example:
+            >>> responses = await supervisor.abatch(
+            ...     ["오늘 할일 보여줘", "내일 회의 잡아줘"], max_concurrency=4
+            ... )
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다")
+        if thread_ids is not None and len(thread_ids) != len(queries):
+            raise ValueError("thread_ids는 queries와 개수가 같아야 합니다")
+
+        configs = [
+            {
+                **self._thread_config(thread_ids[i] if thread_ids else None),
+                "max_concurrency": max_concurrency,
+            }
+            for i in range(len(queries))
+        ]
+        results = await self.app.abatch(
+            [self._initial_state(query) for query in queries], configs
+        )
+        return [result["response"] for result in results]
+
+    def stream(
+        self,
+        query: str,
+        stream_mode: Sequence[str] = STREAM_MODES,
+        thread_id: str | None = None,
+    ) -> Iterator[StreamEvent]:
+        """
+        스트리밍 인터페이스
+
+        선택된 Sub-Agent의 LLM 토큰과 도구 호출을 생성되는 대로 전달합니다.
+        router의 분류 LLM 토큰은 전달하지 않습니다.
+
+        Args:
+            query: 사용자 질문
+            stream_mode: LangGraph 스트리밍 모드 (messages, custom, updates 중 선택)
+            thread_id: 대화 ID (checkpointer를 지정했을 때 필수)
+
+        Yields:
+            StreamEvent: token / tool_start / tool_end / tool_error / update 이벤트
+
+        Example:
+            >>> for event in supervisor.stream("오늘 할일 보여줘"):
+            ...     if event["type"] == "token":
+            ...         print(event["content"], end="", flush=True)
+        """
+        for mode, chunk in self.app.stream(
+            self._initial_state(query),
+            self._thread_config(thread_id),
+            stream_mode=list(stream_mode),
+        ):
+            yield from to_stream_events(mode, chunk, STREAM_NODES)
+
+    async def astream(
+        self,
+        query: str,
+        stream_mode: Sequence[str] = STREAM_MODES,
+        thread_id: str | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """stream()의 비동기 버전"""
+        async for mode, chunk in self.app.astream(
+            self._initial_state(query),
+            self._thread_config(thread_id),
+            stream_mode=list(stream_mode),
+        ):
+            for event in to_stream_events(mode, chunk, STREAM_NODES):
+                yield event
+
+    def get_history(self, thread_id: str) -> list[Turn]:
+        """
+        대화 기록 조회 (checkpointer에 저장된 thread 상태)
+
+        Args:
+            thread_id: 대화 ID
+
+        Returns:
+            list[Turn]: 이전 턴 목록 (오래된 순, 없으면 빈 리스트)
+
+        Raises:
+            ValueError: checkpointer 없이 생성한 경우
+        """
+        if self.checkpointer is None:
+            raise ValueError("대화 기록을 조회하려면 checkpointer가 필요합니다")
+        snapshot = self.app.get_state(self._thread_config(thread_id))
+        return list(snapshot.values.get("history", []))
+
+    def _initial_state(self, query: str) -> SupervisorState:
+        """
+        그래프 입력 상태 (TypedDict는 필수 필드 명시)
+
+        responses=None은 이전 턴 응답을 비우는 신호 (add_responses 참고)
+        """
+        return {
             "query": query,
             "agent_type": "unknown",
             "response": "",
+            "responses": None,
         }
-        return self.app.invoke(initial_state)
+
+    def _thread_config(self, thread_id: str | None) -> RunnableConfig:
+        """thread_id → 그래프 실행 config (없으면 빈 config)"""
+        if thread_id is None:
+            return {}
+        return {"configurable": {"thread_id": thread_id}}
 
     def get_mermaid(self) -> str:
         """Mermaid 다이어그램반환"""
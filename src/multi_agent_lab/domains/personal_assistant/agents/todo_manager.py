@@ -20,9 +20,13 @@ LLM이 Tool을 동적으로 선택하여 할일을 관리합니다.
     "
 """
 
+from collections.abc import Sequence
+
 from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_ollama import ChatOllama
+from langchain_core.runnables import RunnableConfig
 
 from multi_agent_lab.core.middleware import BaseMiddleware
 from multi_agent_lab.domains.personal_assistant.tools.todo_tools import (
@@ -31,6 +35,7 @@ from multi_agent_lab.domains.personal_assistant.tools.todo_tools import (
     delete_task,
     list_tasks,
 )
+from multi_agent_lab.infra.llm import get_chat_model
 
 
 class TodoManagerAgent:
@@ -56,22 +61,22 @@ class TodoManagerAgent:
         model_name: str = "gpt-oss:20b",
         temperature: float = 0.1,
         middleware: list[BaseMiddleware] | None = None,
+        llm: BaseChatModel | None = None,
     ):
         """
         Args:
             model_name: Ollama 모델명
             temperature: 생성 온도 (0.0 ~ 1.0)
             middleware: Middleware 리스트 (순서대로 실행)
+            llm: 사용할 Chat 모델 (None이면 (model_name, temperature)
+                공유 풀에서 가져옴)
         """
         self.model_name = model_name
         self.temperature = temperature
         self.middleware = middleware or []
 
-        # LLM 초기화
-        self.llm = ChatOllama(
-            model=model_name,
-            temperature=temperature,
-        )
+        # LLM (같은 설정의 Agent끼리 클라이언트 공유)
+        self.llm = llm or get_chat_model(model_name, temperature)
 
         # Tools 설정
         self.tools = [add_task, list_tasks, complete_task, delete_task]
@@ -104,6 +109,7 @@ class TodoManagerAgent:
         self.prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", self.system_prompt),
+                ("placeholder", "{chat_history}"),
                 ("human", "{input}"),
                 ("placeholder", "{agent_scratchpad}"),
             ]
@@ -124,40 +130,68 @@ class TodoManagerAgent:
             handle_parsing_errors=True,
         )
 
-    def chat(self, query: str) -> str:
+    def chat(
+        self,
+        query: str,
+        config: RunnableConfig | None = None,
+        history: Sequence[BaseMessage] | None = None,
+    ) -> str:
         """
         사용자 질문에 응답
 
         Args:
             query: 사용자 질문
+            config: Runnable 설정 (callbacks, tags 등, 스트리밍 이벤트 전달용)
+            history: 이전 대화 턴 메시지 (프롬프트의 chat_history로 전달)
 
         Returns:
             str: Agent 응답
         """
         # Before Middleware 적용
-        processed_input = query
-        for mw in self.middleware:
-            if hasattr(mw, "before_request"):
-                processed_input = mw.before_request(processed_input)
-            elif hasattr(mw, "pre_process"):
-                processed_input = mw.pre_process(processed_input)
+        processed_input = self._apply_before_middleware(query)
 
         # Agent 실행
         try:
-            result = self.executor.invoke({"input": processed_input})
+            result = self.executor.invoke(
+                {"input": processed_input, "chat_history": list(history or [])},
+                config=config,
+            )
             output = result.get("output", "")
         except Exception as e:
-            # 에러 미들웨어 처리
-            error_msg = str(e)
-            for mw in self.middleware:
-                if hasattr(mw, "on_error"):
-                    error_msg = mw.on_error(error_msg)
-            return f"오류가 발생했습니다: {error_msg}"
+            return self._error_response(e)
 
         # After Middleware 적용
-        final_output = self._apply_after_middleware(output)
+        return self._apply_after_middleware(output)
+
+    async def achat(
+        self,
+        query: str,
+        config: RunnableConfig | None = None,
+        history: Sequence[BaseMessage] | None = None,
+    ) -> str:
+        """
+        chat()의 비동기 버전 (Ollama 응답을 기다리는 동안 이벤트 루프를 막지 않음)
+
+        Args:
+            query: 사용자 질문
+            config: Runnable 설정 (callbacks, tags 등, 스트리밍 이벤트 전달용)
+            history: 이전 대화 턴 메시지 (프롬프트의 chat_history로 전달)
+
+        Returns:
+            str: Agent 응답
+        """
+        processed_input = self._apply_before_middleware(query)
 
-        return final_output
+        try:
+            result = await self.executor.ainvoke(
+                {"input": processed_input, "chat_history": list(history or [])},
+                config=config,
+            )
+            output = result.get("output", "")
+        except Exception as e:
+            return self._error_response(e)
+
+        return self._apply_after_middleware(output)
 
     def invoke(self, query: str) -> dict:
         """
@@ -170,12 +204,7 @@ class TodoManagerAgent:
             dict: Agent 실행 결과 (input, output, intermediate_steps 등)
         """
         # Before Middleware 적용
-        processed_input = query
-        for mw in self.middleware:
-            if hasattr(mw, "before_request"):
-                processed_input = mw.before_request(processed_input)
-            elif hasattr(mw, "pre_process"):
-                processed_input = mw.pre_process(processed_input)
+        processed_input = self._apply_before_middleware(query)
 
         # Agent 실행
         result = self.executor.invoke({"input": processed_input})
@@ -186,6 +215,24 @@ class TodoManagerAgent:
 
         return result
 
+    def _apply_before_middleware(self, query: str) -> str:
+        """Before Middleware 적용"""
+        processed_input = query
+        for mw in self.middleware:
+            if hasattr(mw, "before_request"):
+                processed_input = mw.before_request(processed_input)
+            elif hasattr(mw, "pre_process"):
+                processed_input = mw.pre_process(processed_input)
+        return processed_input
+
+    def _error_response(self, error: Exception) -> str:
+        """에러 Middleware 적용 후 오류 응답 생성"""
+        error_msg = str(error)
+        for mw in self.middleware:
+            if hasattr(mw, "on_error"):
+                error_msg = mw.on_error(error_msg)
+        return f"오류가 발생했습니다: {error_msg}"
+
     def _apply_after_middleware(self, output: str) -> str:
         """After Middleware 적용"""
         for mw in self.middleware:
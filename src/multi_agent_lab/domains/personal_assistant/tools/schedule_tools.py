@@ -13,18 +13,22 @@
 5. find_free_time: 비어있는 시간대 찾기
 6. send_notification: 일정 생성 알림 전송 ⭐ NEW!
 
+🔮 보조 함수:
+- predict_event_date: LLM 없이 질의에서 날짜만 빠르게 추측 (추측 실행용)
+
 💡 동작 방식:
 - Agent가 사용자 말을 듣고 → 적절한 도구 선택 → 실행
 - 예: "회의 잡아줘" → Agent가 create_event 도구 사용
 """
 
+import re
 from datetime import datetime, timedelta
 
 from langchain_core.tools import tool
-from langchain_ollama import ChatOllama
 from pydantic import BaseModel, Field
 
 from multi_agent_lab.domains.personal_assistant.storage.memory_db import db
+from multi_agent_lab.infra.llm import get_chat_model
 
 # ============================================================================
 # Pydantic 모델: LLM Structured Output용
@@ -84,13 +88,12 @@ def parse_event_info(query: str, verbose: bool = False) -> dict:
         set_debug(True)
 
     # LLM 초기화
-    llm = ChatOllama(
-        model="gpt-oss:20b",
-        temperature=0.0,
-    )
+    llm = get_chat_model("gpt-oss:20b", temperature=0.0)
 
-    # Structured Output 설정
-    structured_llm = llm.with_structured_output(EventInfo)
+    # Structured Output 설정 (추출용 JSON 토큰은 Supervisor 스트림에서 제외)
+    structured_llm = llm.with_structured_output(EventInfo).with_config(
+        tags=["nostream"]
+    )
 
     # Prompt 구성
     prompt = f"""당신은 일정 정보를 추출하는 전문가입니다.
@@ -393,3 +396,58 @@ def find_free_time(date: str, duration: int = 60) -> dict:
         "count": len(available_slots),
         "best_slot": best_slot,  # 추가!
     }
+
+
+# ============================================================================
+# 보조 함수: 추측 실행용 날짜 예측
+# ============================================================================
+
+_RELATIVE_DAYS = {"오늘": 0, "내일": 1, "모레": 2, "글피": 3}
+_WEEKDAYS = "월화수목금토일"
+# \b는 한글도 단어 문자로 보므로 "2025-11-12에"처럼 조사가 붙으면 매칭되지 않음
+_DATE_PATTERN = re.compile(r"(?<!\d)(\d{4}-\d{2}-\d{2})(?!\d)")
+_WEEK_PATTERN = re.compile(
+    r"(이번\s*주|다음\s*주|다다음\s*주)\s*([월화수목금토일])요일"
+)
+
+
+def predict_event_date(query: str, today: datetime | None = None) -> str | None:
+    """
+    질의에서 일정 날짜를 규칙 기반으로 추측
+
+    parse_event_info(LLM)보다 훨씬 빠르지만 단순한 표현만 이해합니다.
+    SkillCardExecutor의 추측 실행에서 get_calendar_events를 미리
+    호출할 때 사용하고, 틀리면 LLM 결과로 다시 조회합니다.
+
+    Args:
+        query: 사용자 질의 (예: "내일 오후 2시에 팀 회의")
+        today: 기준 날짜 (기본값: 현재 시각)
+
+    Returns:
+        "YYYY-MM-DD" 형식 날짜 (추측할 수 없으면 None)
+
+    Example:
+        >>> predict_event_date("다음주 월요일 10시 미팅", datetime(2025, 11, 12))
+        '2025-11-17'
+    """
+    today = today or datetime.now()
+
+    if match := _DATE_PATTERN.search(query):
+        return match.group(1)
+
+    if match := _WEEK_PATTERN.search(query):
+        week = match.group(1).replace(" ", "")
+        weeks_ahead = {"이번주": 0, "다음주": 1, "다다음주": 2}[week]
+        monday = today - timedelta(days=today.weekday())
+        target = monday + timedelta(
+            weeks=weeks_ahead, days=_WEEKDAYS.index(match.group(2))
+        )
+        return target.strftime("%Y-%m-%d")
+
+    found = [(query.find(word), days) for word, days in _RELATIVE_DAYS.items()]
+    found = [(position, days) for position, days in found if position >= 0]
+    if len(found) == 1:
+        return (today + timedelta(days=found[0][1])).strftime("%Y-%m-%d")
+
+    # 날짜 표현이 없거나 여러 개면 추측하지 않음
+    return None
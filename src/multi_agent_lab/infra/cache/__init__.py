@@ -0,0 +1,8 @@
+"""Cache Module
+
+LRU + TTL 캐시 모듈
+"""
+
+from .memory import MISSING, LRUCache
+
+__all__ = ["MISSING", "LRUCache"]
@@ -0,0 +1,129 @@
+"""In-Memory LRU Cache
+
+크기 제한(LRU)과 만료 시간(TTL)을 지원하는 스레드 안전 캐시
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# 캐시 미스를 나타내는 표식 (None도 캐시할 수 있도록)
+MISSING = object()
+
+
+class LRUCache:
+    """
+    LRU + TTL 캐시
+
+    - maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 항목별 TTL(초)이 지나면 조회 시 만료 처리
+
+    Example:
+        >>> cache = LRUCache(maxsize=1024, ttl=60)
+        >>> cache.set("key", {"value": 1})
+        >>> cache.get("key")
+        {'value': 1}
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            ttl: 기본 만료 시간 (초, None이면 만료 없음)
+            clock: 시간 함수 (테스트용)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # key → (만료 시각 또는 None, 값)
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        값 조회 (조회한 항목은 최근 사용으로 갱신)
+
+        Args:
+            key: 키
+            default: 없거나 만료된 경우 반환할 값
+
+        Returns:
+            캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """
+        값 저장
+
+        Args:
+            key: 키
+            value: 값
+            ttl: 만료 시간 (초, None이면 기본 ttl 사용)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        항목 삭제
+
+        Returns:
+            삭제 여부
+        """
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        조건에 맞는 키 모두 삭제
+
+        Args:
+            predicate: 키를 받아 삭제 여부를 반환하는 함수
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, MISSING) is not MISSING
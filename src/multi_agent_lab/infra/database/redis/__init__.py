@@ -1,9 +1,10 @@
 """Redis Database Module
 
-Redis 클라이언트 및 설정 모듈
+Redis 클라이언트, 설정, LangGraph 체크포인트 저장소 모듈
 """
 
+from .checkpointer import RedisCheckpointSaver
 from .client import RedisClient
 from .config import RedisConfig
 
-__all__ = ["RedisClient", "RedisConfig"]
+__all__ = ["RedisCheckpointSaver", "RedisClient", "RedisConfig"]
@@ -0,0 +1,521 @@
+"""Redis Checkpoint Saver
+
+RedisClient 기반 LangGraph 체크포인트 저장소
+
+대화(thread_id)별 그래프 상태를 Redis에 저장해서, 어느 워커에서든
+다음 턴을 이전 상태에서 이어갈 수 있게 합니다.
+
+키 구조 ({prefix}{thread_id}:...):
+    latest:{ns}                     마지막 checkpoint_id
+    checkpoint:{id}:{ns}            체크포인트(채널 값 제외) + 메타데이터 + 부모 ID
+    blob:{channel}:{version}:{ns}   채널 값 (버전별, 여러 체크포인트가 공유)
+    writes:{id}:{ns}                pending writes (Hash, task별 필드)
+    index                           최근 checkpoint 목록 (Sorted Set, list()용)
+
+저장 비용:
+    단계마다 바뀐 채널(new_versions)의 값만 저장합니다. 20턴 대화 기록처럼
+    큰 채널도 바뀐 단계에서만 한 번 저장되고, 나머지 단계는 같은 blob을
+    참조합니다. index가 max_checkpoints를 넘으면 오래된 체크포인트와
+    남은 체크포인트가 참조하지 않는 blob을 함께 지웁니다.
+
+직렬화:
+    LangGraph 직렬화기(msgpack) → 일정 크기 이상이면 zlib 압축 → base64
+    (RedisConfig 기본값 decode_responses=True에서도 안전하게 문자열로 저장)
+
+모든 키에 TTL을 걸어 오래된 대화는 Redis가 자동으로 정리합니다.
+"""
+
+import asyncio
+import base64
+import zlib
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+from .client import RedisClient
+
+# new_versions에 있지만 값이 없는 채널 (빈 채널도 버전은 기록됨)
+_EMPTY = "empty"
+
+
+class RedisCheckpointSaver(BaseCheckpointSaver[int]):
+    """
+    Redis 체크포인트 저장소 (LangGraph checkpointer)
+
+    Example:
+        >>> client = RedisClient(RedisConfig.from_env())
+        >>> saver = RedisCheckpointSaver(client, ttl_seconds=3600)
+        >>> app = graph.compile(checkpointer=saver)
+        >>> app.invoke(state, {"configurable": {"thread_id": "user-123"}})
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        prefix: str = "langgraph:checkpoint:",
+        ttl_seconds: int | None = 86400,
+        compress_min_bytes: int | None = 1024,
+        serde: SerializerProtocol | None = None,
+        max_checkpoints: int | None = 20,
+    ):
+        """
+        Args:
+            client: RedisClient 인스턴스
+            prefix: 키 접두사
+            ttl_seconds: 대화 상태 만료 시간 (저장할 때마다 갱신, None이면 만료 없음)
+            compress_min_bytes: 이 크기 이상인 값만 zlib 압축 (None이면 압축 안 함)
+            serde: LangGraph 직렬화기 (None이면 기본 JsonPlusSerializer)
+            max_checkpoints: thread당 보관할 최근 체크포인트 수
+                (None이면 TTL로만 정리, namespace의 최신 체크포인트는 항상 보관)
+        """
+        super().__init__(serde=serde)
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.compress_min_bytes = compress_min_bytes
+        self.max_checkpoints = max_checkpoints
+
+    # === 키 / 직렬화 ===
+
+    def _key(self, thread_id: str, *parts: str) -> str:
+        return ":".join([f"{self.prefix}{thread_id}", *parts])
+
+    def _blob_key(
+        self, thread_id: str, checkpoint_ns: str, channel: str, version: Any
+    ) -> str:
+        return self._key(thread_id, "blob", channel, str(version), checkpoint_ns)
+
+    def _encode(self, value: Any) -> str:
+        type_, data = self.serde.dumps_typed(value)
+        flag = "r"
+        if self.compress_min_bytes is not None and len(data) >= self.compress_min_bytes:
+            data = zlib.compress(data)
+            flag = "z"
+        return f"{type_}:{flag}:{base64.b64encode(data).decode('ascii')}"
+
+    def _decode(self, raw: str | bytes) -> Any:
+        type_, flag, encoded = _text(raw).split(":", 2)
+        data = base64.b64decode(encoded)
+        if flag == "z":
+            data = zlib.decompress(data)
+        return self.serde.loads_typed((type_, data))
+
+    # === 조회 ===
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """
+        체크포인트 조회
+
+        config에 checkpoint_id가 있으면 해당 체크포인트, 없으면 thread의 최신 체크포인트
+
+        Args:
+            config: {"configurable": {"thread_id": ..., "checkpoint_ns": ...}}
+
+        Returns:
+            CheckpointTuple (없거나 만료되었으면 None)
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        if checkpoint_id is None:
+            latest = self.client.get(self._key(thread_id, "latest", checkpoint_ns))
+            if latest is None:
+                return None
+            checkpoint_id = _text(latest)
+        return self._load(thread_id, checkpoint_ns, checkpoint_id)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        thread의 체크포인트 목록 (최신순)
+
+        Args:
+            config: thread_id 필수 (checkpoint_ns가 있으면 해당 namespace만)
+            filter: 메타데이터 일치 조건
+            before: 이 체크포인트보다 이전 것만
+            limit: 최대 개수
+
+        Yields:
+            CheckpointTuple
+
+        Raises:
+            ValueError: config에 thread_id가 없는 경우 (전체 thread 조회는 지원 안 함)
+        """
+        if not config or "thread_id" not in config.get("configurable", {}):
+            raise ValueError("RedisCheckpointSaver.list()에는 thread_id가 필요합니다")
+
+        thread_id = config["configurable"]["thread_id"]
+        config_ns = config["configurable"].get("checkpoint_ns")
+        config_id = get_checkpoint_id(config)
+        before_id = get_checkpoint_id(before) if before else None
+
+        # 멤버: "{checkpoint_id}|{checkpoint_ns}" (checkpoint_id는 시간순 정렬 가능)
+        index_key = self._key(thread_id, "index")
+        for member in self.client.zrevrange(index_key, 0, -1):
+            checkpoint_id, _, checkpoint_ns = _text(member).partition("|")
+            if config_ns is not None and checkpoint_ns != config_ns:
+                continue
+            if config_id and checkpoint_id != config_id:
+                continue
+            if before_id and checkpoint_id >= before_id:
+                continue
+
+            saved = self._load(thread_id, checkpoint_ns, checkpoint_id)
+            if saved is None:
+                # TTL로 만료된 체크포인트: 다음 조회에서 다시 읽지 않도록 정리
+                self.client.zrem(index_key, member)
+                continue
+            if filter and not all(
+                saved.metadata.get(key) == value for key, value in filter.items()
+            ):
+                continue
+
+            if limit is not None:
+                if limit <= 0:
+                    break
+                limit -= 1
+            yield saved
+
+    def _load(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> CheckpointTuple | None:
+        raw = self.client.get(
+            self._key(thread_id, "checkpoint", checkpoint_id, checkpoint_ns)
+        )
+        if raw is None:
+            return None
+        saved = self._decode(raw)
+        checkpoint = saved["checkpoint"]
+        checkpoint["channel_values"] = self._load_blobs(
+            thread_id, checkpoint_ns, checkpoint["channel_versions"]
+        )
+
+        stored_writes = [
+            self._decode(value)
+            for value in self.client.hgetall(
+                self._key(thread_id, "writes", checkpoint_id, checkpoint_ns)
+            ).values()
+        ]
+        stored_writes.sort(
+            key=lambda w: writes_sort_key(w["task_path"], w["task_id"], w["idx"])
+        )
+
+        parent_id = saved["parent_checkpoint_id"]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=checkpoint,
+            metadata=saved["metadata"],
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (w["task_id"], w["channel"], w["value"]) for w in stored_writes
+            ],
+        )
+
+    def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        """채널 버전 → 채널 값 (MGET 한 번)"""
+        channels = list(versions)
+        raw_values = self.client.mget(
+            *(
+                self._blob_key(thread_id, checkpoint_ns, channel, versions[channel])
+                for channel in channels
+            )
+        )
+        return {
+            channel: self._decode(raw)
+            for channel, raw in zip(channels, raw_values, strict=True)
+            if raw is not None and _text(raw) != _EMPTY
+        }
+
+    def _load_saved(
+        self, thread_id: str, members: Sequence[str]
+    ) -> Sequence[dict | None]:
+        """index 멤버들의 저장 내용 (채널 값 제외, MGET 한 번, 없으면 None)"""
+        keys = []
+        for member in members:
+            checkpoint_id, _, checkpoint_ns = member.partition("|")
+            keys.append(
+                self._key(thread_id, "checkpoint", checkpoint_id, checkpoint_ns)
+            )
+        return [
+            None if raw is None else self._decode(raw)
+            for raw in self.client.mget(*keys)
+        ]
+
+    # === 저장 ===
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        체크포인트 저장 (바뀐 채널 값만 버전별 blob으로 저장)
+
+        Args:
+            config: 부모 체크포인트 config
+            checkpoint: 저장할 체크포인트
+            metadata: 체크포인트 메타데이터
+            new_versions: 이번 단계에서 바뀐 채널 버전 (이 채널 값만 저장)
+
+        Returns:
+            저장한 체크포인트를 가리키는 config
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = checkpoint["id"]
+        ttl = self.ttl_seconds
+
+        values = checkpoint["channel_values"]
+        for channel, version in new_versions.items():
+            blob = self._encode(values[channel]) if channel in values else _EMPTY
+            self.client.set(
+                self._blob_key(thread_id, checkpoint_ns, channel, version),
+                blob,
+                ex=ttl,
+            )
+        if ttl is not None:
+            # 이전 단계의 blob을 공유하는 채널도 대화가 이어지는 동안 만료되지 않게
+            for channel, version in checkpoint["channel_versions"].items():
+                if channel not in new_versions:
+                    self.client.expire(
+                        self._blob_key(thread_id, checkpoint_ns, channel, version),
+                        ttl,
+                    )
+
+        payload = self._encode(
+            {
+                "checkpoint": {**checkpoint, "channel_values": {}},
+                "metadata": get_checkpoint_metadata(config, metadata),
+                "parent_checkpoint_id": config["configurable"].get("checkpoint_id"),
+            }
+        )
+        self.client.set(
+            self._key(thread_id, "checkpoint", checkpoint_id, checkpoint_ns),
+            payload,
+            ex=self.ttl_seconds,
+        )
+        self.client.set(
+            self._key(thread_id, "latest", checkpoint_ns),
+            checkpoint_id,
+            ex=self.ttl_seconds,
+        )
+        index_key = self._key(thread_id, "index")
+        self.client.zadd(index_key, {f"{checkpoint_id}|{checkpoint_ns}": 0})
+        if self.ttl_seconds is not None:
+            self.client.expire(index_key, self.ttl_seconds)
+        if self.max_checkpoints is not None:
+            self._trim(thread_id)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    def _trim(self, thread_id: str):
+        """
+        max_checkpoints를 넘는 오래된 체크포인트 정리
+
+        체크포인트/writes 키와, 남은 체크포인트가 참조하지 않는 blob을 지웁니다.
+        namespace의 최신 체크포인트는 오래됐어도 남깁니다 (get_tuple 대상).
+        """
+        index_key = self._key(thread_id, "index")
+        members = [_text(m) for m in self.client.zrange(index_key, 0, -1)]
+        excess = len(members) - self.max_checkpoints
+        if excess <= 0:
+            return
+
+        latest: dict[str, str | None] = {}
+        stale = []
+        for member in members[:excess]:
+            checkpoint_id, _, checkpoint_ns = member.partition("|")
+            if checkpoint_ns not in latest:
+                value = self.client.get(self._key(thread_id, "latest", checkpoint_ns))
+                latest[checkpoint_ns] = None if value is None else _text(value)
+            if checkpoint_id != latest[checkpoint_ns]:
+                stale.append(member)
+        if not stale:
+            return
+        self.client.zrem(index_key, *stale)
+
+        # 남은 체크포인트가 참조하는 (ns, channel, version)
+        removed = set(stale)
+        referenced = set()
+        saved = dict(zip(members, self._load_saved(thread_id, members), strict=True))
+        for member in members:
+            if member in removed or saved[member] is None:
+                continue
+            checkpoint_ns = member.partition("|")[2]
+            versions = saved[member]["checkpoint"]["channel_versions"]
+            referenced.update((checkpoint_ns, c, v) for c, v in versions.items())
+
+        keys = []
+        for member in stale:
+            checkpoint_id, _, checkpoint_ns = member.partition("|")
+            keys.append(
+                self._key(thread_id, "checkpoint", checkpoint_id, checkpoint_ns)
+            )
+            keys.append(self._key(thread_id, "writes", checkpoint_id, checkpoint_ns))
+            if saved[member] is None:
+                continue
+            versions = saved[member]["checkpoint"]["channel_versions"]
+            keys.extend(
+                self._blob_key(thread_id, checkpoint_ns, channel, version)
+                for channel, version in versions.items()
+                if (checkpoint_ns, channel, version) not in referenced
+            )
+        self.client.delete(*keys)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        pending writes 저장 (병렬 task가 동시에 저장해도 필드가 달라 안전)
+
+        Args:
+            config: 대상 체크포인트 config
+            writes: (channel, value) 목록
+            task_id: write를 만든 task ID
+            task_path: task 경로
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        writes_key = self._key(thread_id, "writes", checkpoint_id, checkpoint_ns)
+
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            self.client.hset(
+                writes_key,
+                f"{task_id}:{write_idx}",
+                self._encode(
+                    {
+                        "task_id": task_id,
+                        "channel": channel,
+                        "value": value,
+                        "task_path": task_path,
+                        "idx": write_idx,
+                    }
+                ),
+            )
+        if writes and self.ttl_seconds is not None:
+            self.client.expire(writes_key, self.ttl_seconds)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        thread의 모든 체크포인트 삭제
+
+        공유 Redis에서 KEYS/SCAN으로 키 공간을 훑지 않도록, thread의 index
+        멤버에서 지울 키(체크포인트, writes, latest, 참조하는 blob)를 구합니다.
+
+        Args:
+            thread_id: 삭제할 대화 ID
+        """
+        index_key = self._key(thread_id, "index")
+        members = [_text(m) for m in self.client.zrange(index_key, 0, -1)]
+        keys = {index_key}
+        saved_list = self._load_saved(thread_id, members)
+        for member, saved in zip(members, saved_list, strict=True):
+            checkpoint_id, _, checkpoint_ns = member.partition("|")
+            keys.add(self._key(thread_id, "checkpoint", checkpoint_id, checkpoint_ns))
+            keys.add(self._key(thread_id, "writes", checkpoint_id, checkpoint_ns))
+            keys.add(self._key(thread_id, "latest", checkpoint_ns))
+            if saved is not None:
+                versions = saved["checkpoint"]["channel_versions"]
+                keys.update(
+                    self._blob_key(thread_id, checkpoint_ns, channel, version)
+                    for channel, version in versions.items()
+                )
+        self.client.delete(*keys)
+
+    # === 비동기 (RedisClient는 동기 클라이언트이므로 스레드에서 실행) ===
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def _text(value: str | bytes) -> str:
+    """decode_responses 설정과 관계없이 문자열로 변환"""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
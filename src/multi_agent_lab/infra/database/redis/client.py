@@ -101,6 +101,18 @@ class RedisClient:
         """
         return self.client.get(key)
 
+    def mget(self, *keys: str) -> list:
+        """
+        여러 키의 값을 한 번에 조회
+
+        Args:
+            *keys: 조회할 키들
+
+        Returns:
+            키 순서대로 값 리스트 (존재하지 않는 키는 None)
+        """
+        return self.client.mget(keys) if keys else []
+
     def delete(self, *keys: str) -> int:
         """
         키 삭제
@@ -0,0 +1,8 @@
+"""LLM Module
+
+Chat 모델 인스턴스 풀 모듈
+"""
+
+from .pool import ChatModelPool, default_pool, get_chat_model
+
+__all__ = ["ChatModelPool", "default_pool", "get_chat_model"]
@@ -0,0 +1,87 @@
+"""Chat Model Pool
+
+(모델명, temperature)별로 ChatOllama 인스턴스를 하나만 만들어 공유하는 풀
+
+같은 설정의 Agent/도구가 각자 클라이언트(HTTP 연결 풀 포함)를 만들지 않도록
+프로세스 안에서 재사용합니다.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_ollama import ChatOllama
+
+
+class ChatModelPool:
+    """
+    Chat 모델 인스턴스 풀
+
+    키: (model, temperature, 추가 옵션). 처음 요청할 때 생성하고 이후에는
+    같은 인스턴스를 반환합니다. 여러 스레드에서 동시에 요청해도 하나만 생성됩니다.
+
+    Example:
+        >>> pool = ChatModelPool()
+        >>> a = pool.get("gpt-oss:20b", temperature=0.1)
+        >>> b = pool.get("gpt-oss:20b", temperature=0.1)
+        >>> a is b
+        True
+    """
+
+    def __init__(self, factory: Callable[..., BaseChatModel] = ChatOllama):
+        """
+        Args:
+            factory: 모델 생성 함수 (model=, temperature=, **options로 호출)
+        """
+        self.factory = factory
+        self._models: dict[Hashable, BaseChatModel] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, model: str, temperature: float = 0.0, **options: Any
+    ) -> BaseChatModel:
+        """
+        Chat 모델 조회 (없으면 생성)
+
+        Args:
+            model: 모델명
+            temperature: 생성 온도
+            **options: 추가 생성 옵션 (num_predict 등, 해시 가능한 값)
+
+        Returns:
+            공유 Chat 모델 인스턴스
+        """
+        key = (model, float(temperature), tuple(sorted(options.items())))
+        llm = self._models.get(key)
+        if llm is None:
+            with self._lock:
+                llm = self._models.get(key)
+                if llm is None:
+                    llm = self.factory(model=model, temperature=temperature, **options)
+                    self._models[key] = llm
+        return llm
+
+    def clear(self):
+        """풀 비우기 (이미 받아간 인스턴스는 그대로 사용 가능)"""
+        with self._lock:
+            self._models.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# 프로세스 기본 풀
+default_pool = ChatModelPool()
+
+
+def get_chat_model(
+    model: str, temperature: float = 0.0, **options: Any
+) -> BaseChatModel:
+    """
+    기본 풀에서 Chat 모델 조회
+
+    Example:
+        >>> llm = get_chat_model("gpt-oss:20b", temperature=0.1)
+    """
+    return default_pool.get(model, temperature, **options)
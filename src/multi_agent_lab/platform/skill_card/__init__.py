@@ -4,12 +4,56 @@ Skill Card 시스템
 Skill Card를 로드, 검증, 관리하고 실행합니다.
 """
 
-from .executor import SkillCardExecutor
-from .manager import SkillCardManager
+from .analyzer import AnalysisReport, PlanAnalyzer, PlanIssue
+from .batch import BatchItem, BatchRun, BatchStats
+from .cache import StepCache
+from .checkpoint import (
+    CheckpointStore,
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    RedisCheckpointStore,
+)
+from .events import StepEvent
+from .executor import PlanTimeoutError, SkillCardExecutor, StepTimeoutError
+from .keyword_index import KeywordIndex, KeywordMatch
+from .manager import RegistrySnapshot, SkillCardManager
+from .pools import configure_process_pool, shutdown_process_pool
 from .schema import SkillCard
+from .semantic import Embedder, HashingEmbedder, SemanticMatch
+from .tracing import JsonLinesExporter, Span, TraceListener, Tracer
+from .versions import TrafficSplit
+from .watcher import SkillCardWatcher
 
 __all__ = [
+    "AnalysisReport",
+    "BatchItem",
+    "BatchRun",
+    "BatchStats",
+    "CheckpointStore",
+    "Embedder",
+    "FileCheckpointStore",
+    "HashingEmbedder",
+    "InMemoryCheckpointStore",
+    "JsonLinesExporter",
+    "KeywordIndex",
+    "KeywordMatch",
+    "PlanAnalyzer",
+    "PlanIssue",
+    "PlanTimeoutError",
+    "RedisCheckpointStore",
+    "RegistrySnapshot",
+    "SemanticMatch",
     "SkillCard",
     "SkillCardExecutor",
     "SkillCardManager",
+    "SkillCardWatcher",
+    "Span",
+    "StepCache",
+    "StepEvent",
+    "StepTimeoutError",
+    "TraceListener",
+    "Tracer",
+    "TrafficSplit",
+    "configure_process_pool",
+    "shutdown_process_pool",
 ]
@@ -0,0 +1,442 @@
+"""
+Execution Plan 정적 분석기
+
+Skill Card를 실행하지 않고 Execution Plan의 문제와 예상 지연 시간을
+분석하는 모듈
+
+📌 검사 항목:
+- unresolved_reference: 앞에서 만들어지지 않은 ${...} 변수 참조
+- unused_output: 아무 Step도 읽지 않는 output_to 변수
+- unregistered_action: 등록된 Tool이 없는 action (실행 시 Mock으로 대체됨)
+- invalid_condition: 잘못된 when / exit_if 조건식
+- duplicate_step / cycle: Step 번호 중복, 순환 의존성
+- over_budget: 예상 지연 시간이 latency_budget_ms 초과
+
+📌 비용 모델:
+- Action별 지연 시간(기록된 통계 또는 Step timeout_ms)으로
+  의존성 그래프의 임계 경로(critical path) 계산
+- 임계 경로에서 가장 오래 걸리는 Step = 먼저 최적화할 Step
+
+💡 사용 방식:
+    analyzer = PlanAnalyzer(
+        tools=executor.tools,
+        latency=batch.stats.step_latency,  # execute_many 통계
+        context_variables=["user_query", "user_id"],
+        latency_budget_ms=5000,
+    )
+    report = analyzer.analyze(card)
+    if not report.ok:
+        print(report.summary())
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from .batch import LatencyHistogram
+from .condition import compile_condition
+from .planner import ExecutionGraph
+from .schema import ExecutionStep, SkillCard
+from .template import compile_template
+
+Severity = Literal["error", "warning"]
+
+
+@dataclass(frozen=True)
+class PlanIssue:
+    """
+    분석에서 발견한 문제
+
+    Attributes:
+        severity: error(배포 차단) 또는 warning
+        code: 문제 종류 (unresolved_reference, unused_output 등)
+        message: 설명
+        step: 관련 Step 번호 (plan 전체 문제면 None)
+    """
+
+    severity: Severity
+    code: str
+    message: str
+    step: int | None = None
+
+    def __str__(self) -> str:
+        icon = "❌" if self.severity == "error" else "⚠️ "
+        where = f"Step {self.step}: " if self.step is not None else ""
+        return f"{icon} [{self.code}] {where}{self.message}"
+
+
+@dataclass
+class StepCost:
+    """
+    Step별 예상 비용
+
+    Attributes:
+        step: Step 번호
+        action: Action 이름
+        latency_ms: 예상 지연 시간
+        measured: 기록된 통계를 사용했는지 여부 (False면 timeout_ms로 추정)
+        start_ms: 가장 빠른 시작 시각
+        finish_ms: 가장 빠른 종료 시각
+        slack_ms: 전체 지연 시간을 늘리지 않고 늦어질 수 있는 시간
+    """
+
+    step: int
+    action: str
+    latency_ms: float
+    measured: bool
+    start_ms: float = 0.0
+    finish_ms: float = 0.0
+    slack_ms: float = 0.0
+
+    @property
+    def critical(self) -> bool:
+        """임계 경로에 있는지 여부"""
+        return self.slack_ms <= 1e-9
+
+
+@dataclass
+class CostReport:
+    """
+    예상 지연 시간 분석 결과
+
+    Attributes:
+        critical_path_ms: 병렬 실행 시 예상 지연 시간 (임계 경로 길이)
+        sequential_ms: 순차 실행 시 예상 지연 시간 (모든 Step 합)
+        critical_path: 임계 경로 Step 번호 (실행 순서)
+        steps: Step 번호 → StepCost
+    """
+
+    critical_path_ms: float
+    sequential_ms: float
+    critical_path: list[int]
+    steps: dict[int, StepCost]
+
+    @property
+    def bottleneck(self) -> StepCost | None:
+        """임계 경로에서 가장 오래 걸리는 Step (먼저 최적화할 Step)"""
+        candidates = [self.steps[n] for n in self.critical_path]
+        return max(candidates, key=lambda c: c.latency_ms, default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """요약 dict"""
+        bottleneck = self.bottleneck
+        return {
+            "critical_path_ms": round(self.critical_path_ms, 3),
+            "sequential_ms": round(self.sequential_ms, 3),
+            "critical_path": self.critical_path,
+            "bottleneck": bottleneck.step if bottleneck else None,
+            "steps": {
+                n: {
+                    "action": c.action,
+                    "latency_ms": round(c.latency_ms, 3),
+                    "measured": c.measured,
+                    "start_ms": round(c.start_ms, 3),
+                    "slack_ms": round(c.slack_ms, 3),
+                }
+                for n, c in self.steps.items()
+            },
+        }
+
+
+@dataclass
+class AnalysisReport:
+    """
+    Execution Plan 분석 결과
+
+    Attributes:
+        card_id: Skill Card ID
+        issues: 발견한 문제 목록
+        graph: 의존성 그래프 (순환/중복이 있으면 None)
+        cost: 예상 지연 시간 (그래프가 없으면 None)
+    """
+
+    card_id: str
+    issues: list[PlanIssue] = field(default_factory=list)
+    graph: ExecutionGraph | None = None
+    cost: CostReport | None = None
+
+    @property
+    def errors(self) -> list[PlanIssue]:
+        """배포를 막아야 하는 문제"""
+        return [i for i in self.issues if i.severity == "error"]
+
+    @property
+    def warnings(self) -> list[PlanIssue]:
+        """경고"""
+        return [i for i in self.issues if i.severity == "warning"]
+
+    @property
+    def ok(self) -> bool:
+        """error가 없는지 여부"""
+        return not self.errors
+
+    def to_dict(self) -> dict[str, Any]:
+        """요약 dict"""
+        return {
+            "card_id": self.card_id,
+            "ok": self.ok,
+            "issues": [
+                {
+                    "severity": i.severity,
+                    "code": i.code,
+                    "step": i.step,
+                    "message": i.message,
+                }
+                for i in self.issues
+            ],
+            "levels": self.graph.levels() if self.graph else None,
+            "cost": self.cost.to_dict() if self.cost else None,
+        }
+
+    def summary(self) -> str:
+        """사람이 읽기 쉬운 요약 문자열"""
+        lines = [f"📋 Plan 분석: {self.card_id} ({'OK' if self.ok else 'FAILED'})"]
+        lines.extend(f"  {issue}" for issue in self.issues)
+        if self.cost is not None:
+            cost = self.cost
+            path = " → ".join(str(n) for n in cost.critical_path)
+            lines.append(
+                f"  ⏱  예상 지연: {cost.critical_path_ms:.0f}ms "
+                f"(순차 {cost.sequential_ms:.0f}ms), 임계 경로: {path}"
+            )
+            if bottleneck := cost.bottleneck:
+                source = "측정" if bottleneck.measured else "timeout 추정"
+                lines.append(
+                    f"  🎯 병목: Step {bottleneck.step} ({bottleneck.action}, "
+                    f"{bottleneck.latency_ms:.0f}ms, {source})"
+                )
+        return "\n".join(lines)
+
+
+class PlanAnalyzer:
+    """
+    Execution Plan 정적 분석기
+
+    Example:
+        >>> analyzer = PlanAnalyzer(context_variables=["user_query", "user_id"])
+        >>> report = analyzer.analyze(manager.get("SC_SCHEDULE_001"))
+        >>> report.cost.critical_path
+        [1, 2, 3, 4, 5]
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[str] | None = None,
+        latency: Mapping[str, float | LatencyHistogram] | None = None,
+        context_variables: Iterable[str] = ("user_query",),
+        percentile: float = 0.5,
+        latency_budget_ms: float | None = None,
+    ):
+        """
+        Args:
+            tools: 등록된 Tool 이름 (None이면 unregistered_action 검사 안 함,
+                executor.tools dict를 그대로 넘겨도 됨)
+            latency: Action별 지연 시간 (ms 값 또는 LatencyHistogram,
+                예: execute_many의 batch.stats.step_latency)
+            context_variables: 실행 시 컨텍스트로 주어지는 변수명
+            percentile: LatencyHistogram에서 사용할 백분위수 (0.0 ~ 1.0)
+            latency_budget_ms: 허용 지연 시간 (넘으면 over_budget error)
+        """
+        self.tools = set(tools) if tools is not None else None
+        self.latency = dict(latency or {})
+        self.context_variables = set(context_variables)
+        self.percentile = percentile
+        self.latency_budget_ms = latency_budget_ms
+
+    def analyze(self, card: SkillCard) -> AnalysisReport:
+        """
+        Skill Card 분석
+
+        Args:
+            card: 분석할 Skill Card
+
+        Returns:
+            AnalysisReport
+        """
+        report = AnalysisReport(card_id=card.id)
+        plan = card.execution_plan
+
+        numbers = [s.step for s in plan]
+        duplicates = sorted({n for n in numbers if numbers.count(n) > 1})
+        for n in duplicates:
+            report.issues.append(
+                PlanIssue("error", "duplicate_step", "step 번호가 중복됩니다", n)
+            )
+
+        report.issues.extend(self._check_references(plan))
+        report.issues.extend(self._check_actions(plan))
+
+        # 중복 번호나 잘못된 조건식이 있으면 그래프를 만들 수 없음
+        if duplicates or any(i.code == "invalid_condition" for i in report.issues):
+            return report
+
+        graph = ExecutionGraph.from_steps(plan)
+        try:
+            graph.levels()
+        except ValueError as e:
+            report.issues.append(PlanIssue("error", "cycle", str(e)))
+            return report
+        report.graph = graph
+        report.cost = self.estimate(plan, graph)
+
+        budget = self.latency_budget_ms
+        if budget is not None and report.cost.critical_path_ms > budget:
+            report.issues.append(
+                PlanIssue(
+                    "error",
+                    "over_budget",
+                    f"예상 지연 시간 {report.cost.critical_path_ms:.0f}ms가 "
+                    f"허용치 {budget:.0f}ms를 넘습니다",
+                )
+            )
+        return report
+
+    def estimate(self, plan: list[ExecutionStep], graph: ExecutionGraph) -> CostReport:
+        """
+        임계 경로 기반 지연 시간 예측
+
+        Args:
+            plan: Execution Plan
+            graph: 의존성 그래프
+
+        Returns:
+            CostReport
+        """
+        costs: dict[int, StepCost] = {}
+        for step in plan:
+            latency_ms, measured = self._latency_of(step)
+            costs[step.step] = StepCost(step.step, step.action, latency_ms, measured)
+
+        # 가장 빠른 시작/종료 시각 (plan 순서 = 위상 순서)
+        for step in plan:
+            cost = costs[step.step]
+            deps = graph.dependencies[step.step]
+            cost.start_ms = max((costs[d].finish_ms for d in deps), default=0.0)
+            cost.finish_ms = cost.start_ms + cost.latency_ms
+
+        total = max((c.finish_ms for c in costs.values()), default=0.0)
+
+        # 가장 늦은 종료 시각 → 여유 시간
+        latest_finish: dict[int, float] = {}
+        for step in reversed(plan):
+            latest_finish[step.step] = min(
+                (
+                    latest_finish[d] - costs[d].latency_ms
+                    for d in graph.dependents.get(step.step, ())
+                ),
+                default=total,
+            )
+            costs[step.step].slack_ms = latest_finish[step.step] - (
+                costs[step.step].finish_ms
+            )
+
+        return CostReport(
+            critical_path_ms=total,
+            sequential_ms=sum(c.latency_ms for c in costs.values()),
+            critical_path=self._critical_path(costs, graph),
+            steps=costs,
+        )
+
+    def _latency_of(self, step: ExecutionStep) -> tuple[float, bool]:
+        """Action 지연 시간 (통계가 없으면 Step timeout_ms로 추정)"""
+        recorded = self.latency.get(step.action)
+        if isinstance(recorded, LatencyHistogram):
+            if recorded.count:
+                return recorded.percentile(self.percentile), True
+        elif recorded is not None:
+            return float(recorded), True
+        return float(step.timeout_ms), False
+
+    @staticmethod
+    def _critical_path(costs: dict[int, StepCost], graph: ExecutionGraph) -> list[int]:
+        """가장 늦게 끝나는 Step에서 거꾸로 따라간 임계 경로"""
+        if not costs:
+            return []
+        current = max(costs.values(), key=lambda c: (c.finish_ms, -c.step))
+        path = [current.step]
+        while deps := graph.dependencies[current.step]:
+            # 이 Step의 시작 시각을 결정한 선행 Step
+            current = max((costs[d] for d in deps), key=lambda c: (c.finish_ms, c.step))
+            path.append(current.step)
+        return path[::-1]
+
+    def _check_references(self, plan: list[ExecutionStep]) -> list[PlanIssue]:
+        """${...} 참조와 output_to 사용 여부 검사"""
+        issues: list[PlanIssue] = []
+        defined = set(self.context_variables)
+        later_outputs = {s.output_to: s.step for s in plan if s.output_to}
+        # Step 번호 → (실행 전에 읽는 변수, 실행 후 exit_if가 읽는 변수)
+        reads: dict[int, tuple[set[str], set[str]]] = {}
+
+        for step in plan:
+            before = set(compile_template(step.input).references)
+            after: set[str] = set()
+            for expression, target in ((step.when, before), (step.exit_if, after)):
+                try:
+                    condition = compile_condition(expression)
+                except ValueError as e:
+                    issues.append(
+                        PlanIssue("error", "invalid_condition", str(e), step.step)
+                    )
+                    continue
+                if condition is not None:
+                    target |= condition.references
+            reads[step.step] = (before, after)
+
+            # exit_if는 Step이 끝난 뒤 평가되므로 자신의 output_to를 읽을 수 있음
+            missing = before - defined
+            if step.output_to:
+                defined.add(step.output_to)
+            missing |= after - defined
+
+            for var in sorted(missing):
+                if var in later_outputs:
+                    message = (
+                        f"${{{var}}}는 뒤에 있는 Step {later_outputs[var]}에서 "
+                        "만들어집니다"
+                    )
+                else:
+                    message = f"${{{var}}}를 만드는 Step이나 컨텍스트가 없습니다"
+                issues.append(
+                    PlanIssue("error", "unresolved_reference", message, step.step)
+                )
+
+        # output_to를 쓴 뒤 덮어쓰기 전에 읽는 곳이 없으면 unused
+        # (마지막 Step의 output_to는 실행 결과이므로 제외)
+        for index, step in enumerate(plan[:-1]):
+            var = step.output_to
+            if not var:
+                continue
+            used = var in reads[step.step][1]
+            for later in plan[index + 1 :]:
+                if used or var in reads[later.step][0]:
+                    used = True
+                    break
+                if later.output_to == var:
+                    break
+                used = var in reads[later.step][1]
+            if not used:
+                issues.append(
+                    PlanIssue(
+                        "warning",
+                        "unused_output",
+                        f"output_to '{var}'를 읽는 Step이 없습니다",
+                        step.step,
+                    )
+                )
+        return issues
+
+    def _check_actions(self, plan: list[ExecutionStep]) -> list[PlanIssue]:
+        """등록되지 않은 action 검사"""
+        if self.tools is None:
+            return []
+        return [
+            PlanIssue(
+                "error",
+                "unregistered_action",
+                f"등록된 Tool이 없습니다: {step.action} (실행 시 Mock으로 대체)",
+                step.step,
+            )
+            for step in plan
+            if step.action not in self.tools
+        ]
@@ -0,0 +1,317 @@
+"""
+Skill Card 배치 실행
+
+하나의 Skill Card를 수천 개의 질의에 대해 실행하는 모듈
+(요청 로그 재실행, 회귀 테스트, 백필 용도)
+
+📌 목적:
+- Executor 하나(등록된 Tool 포함)를 재사용하며 N개씩 동시에 실행
+- 끝나는 순서대로 결과를 스트리밍
+- 실행 종료 후 처리량(runs/s)과 Step별 지연 시간 히스토그램 제공
+
+💡 사용 방식:
+    batch = executor.execute_many(queries, concurrency=16)
+    for item in batch:
+        print(item.index, item.success)
+    batch.print_summary()
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+# 히스토그램 버킷 상한 (밀리초), 마지막 버킷은 그 이상 전부
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1000,
+    2000,
+    5000,
+    10000,
+)
+
+BatchQuery = str | tuple[str, dict[str, Any]]
+
+
+class LatencyHistogram:
+    """
+    고정 버킷 지연 시간 히스토그램
+
+    샘플을 모두 저장하지 않고 버킷별 개수만 셉니다.
+    백분위수는 해당 버킷의 상한값으로 근사합니다.
+    """
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        """샘플 추가"""
+        index = len(self.buckets_ms)
+        for i, bound in enumerate(self.buckets_ms):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        """평균 (밀리초)"""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        백분위수 근사값 (밀리초)
+
+        Args:
+            q: 0.0 ~ 1.0 (예: 0.95)
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                if i < len(self.buckets_ms):
+                    return min(self.buckets_ms[i], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """요약 통계"""
+        buckets = {
+            f"<={bound}ms": count
+            for bound, count in zip(self.buckets_ms, self.counts, strict=False)
+            if count
+        }
+        if self.counts[-1]:
+            buckets[f">{self.buckets_ms[-1]}ms"] = self.counts[-1]
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class BatchItem:
+    """
+    배치 실행 결과 한 건
+
+    Attributes:
+        index: 입력 순서 (0부터)
+        query: 사용자 질의
+        result: execute() 결과 (실패 시 None)
+        error: 실패 메시지 (성공 시 None)
+        elapsed_ms: 실행 시간
+    """
+
+    index: int
+    query: str
+    result: dict[str, Any] | None
+    error: str | None
+    elapsed_ms: float
+
+    @property
+    def success(self) -> bool:
+        """성공 여부"""
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """
+    배치 실행 집계
+
+    Attributes:
+        total: 완료된 실행 수
+        succeeded: 성공 수
+        failed: 실패 수
+        wall_time_s: 전체 소요 시간 (초)
+        run_latency: 실행 단위 지연 시간 히스토그램
+        step_latency: Action별 지연 시간 히스토그램
+    """
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    wall_time_s: float = 0.0
+    run_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    step_latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """처리량 (runs/s)"""
+        return self.total / self.wall_time_s if self.wall_time_s else 0.0
+
+    def record(self, item: BatchItem):
+        """실행 결과 한 건 집계"""
+        self.total += 1
+        if item.success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.run_latency.record(item.elapsed_ms)
+
+        for step_result in (item.result or {}).get("step_results", []):
+            elapsed = step_result.get("elapsed_ms")
+            if elapsed is None:
+                continue
+            histogram = self.step_latency.setdefault(
+                step_result["action"], LatencyHistogram(self.run_latency.buckets_ms)
+            )
+            histogram.record(elapsed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """요약 통계"""
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_time_s": round(self.wall_time_s, 3),
+            "throughput": round(self.throughput, 2),
+            "run_latency": self.run_latency.to_dict(),
+            "step_latency": {
+                action: histogram.to_dict()
+                for action, histogram in self.step_latency.items()
+            },
+        }
+
+
+class BatchRun:
+    """
+    배치 실행 (지연 실행 이터레이터)
+
+    순회를 시작하면 실행이 시작되고, 끝나는 순서대로 BatchItem을 반환합니다.
+    동시에 실행 중인 질의는 concurrency개를 넘지 않으며, 입력 질의도
+    필요한 만큼만 읽으므로 큰 로그 파일 이터레이터를 그대로 넘길 수 있습니다.
+
+    Attributes:
+        stats: 집계 통계 (순회가 끝나면 완성됨)
+    """
+
+    def __init__(
+        self,
+        run: Callable[[str, dict[str, Any] | None], dict[str, Any]],
+        queries: Iterable[BatchQuery],
+        concurrency: int,
+        context: dict[str, Any] | None = None,
+    ):
+        """
+        Args:
+            run: 질의 한 건 실행 함수 (user_query, context) → 결과
+            queries: 질의 목록 (str 또는 (질의, 컨텍스트) 튜플)
+            concurrency: 동시에 실행할 최대 질의 수
+            context: 모든 질의에 공통으로 넣을 컨텍스트
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency는 1 이상이어야 합니다")
+
+        self._run = run
+        self._queries = queries
+        self.concurrency = concurrency
+        self.context = context or {}
+        self.stats = BatchStats()
+
+    def __iter__(self) -> Iterator[BatchItem]:
+        source = enumerate(self._queries)
+        running: dict[Future, tuple[int, str]] = {}
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="skill-card-batch"
+        ) as pool:
+
+            def submit_next() -> bool:
+                entry = next(source, None)
+                if entry is None:
+                    return False
+                index, query = entry
+                if isinstance(query, tuple):
+                    query, extra = query
+                    context = {**self.context, **extra}
+                else:
+                    context = dict(self.context)
+                running[pool.submit(self._timed_run, query, context)] = (index, query)
+                return True
+
+            for _ in range(self.concurrency):
+                if not submit_next():
+                    break
+
+            try:
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, query = running.pop(future)
+                        result, error, elapsed_ms = future.result()
+                        item = BatchItem(index, query, result, error, elapsed_ms)
+                        self.stats.record(item)
+                        self.stats.wall_time_s = time.perf_counter() - start
+                        submit_next()
+                        yield item
+            finally:
+                # 순회를 중간에 멈춰도 대기 중인 실행은 취소
+                for future in running:
+                    future.cancel()
+
+    def _timed_run(
+        self, query: str, context: dict[str, Any]
+    ) -> tuple[dict[str, Any] | None, str | None, float]:
+        """질의 한 건 실행 (예외는 결과로 변환)"""
+        start = time.perf_counter()
+        try:
+            result = self._run(query, context)
+            error = None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        return result, error, (time.perf_counter() - start) * 1000
+
+    def collect(self) -> list[BatchItem]:
+        """모두 실행하고 입력 순서대로 정렬된 결과 반환"""
+        return sorted(self, key=lambda item: item.index)
+
+    def summary(self) -> str:
+        """처리량 및 Step별 지연 시간 요약 문자열"""
+        stats = self.stats
+        lines = [
+            f"📊 배치 실행: {stats.total}건 "
+            f"(성공 {stats.succeeded} / 실패 {stats.failed}), "
+            f"{stats.wall_time_s:.2f}s, {stats.throughput:.1f} runs/s",
+            f"   전체: mean {stats.run_latency.mean_ms:.1f}ms, "
+            f"p50 ≤{stats.run_latency.percentile(0.5):.0f}ms, "
+            f"p95 ≤{stats.run_latency.percentile(0.95):.0f}ms",
+        ]
+        for action, histogram in stats.step_latency.items():
+            lines.append(
+                f"   • {action}: mean {histogram.mean_ms:.1f}ms, "
+                f"p50 ≤{histogram.percentile(0.5):.0f}ms, "
+                f"p95 ≤{histogram.percentile(0.95):.0f}ms, "
+                f"max {histogram.max_ms:.0f}ms"
+            )
+        return "\n".join(lines)
+
+    def print_summary(self):
+        """요약 출력"""
+        print(self.summary())
@@ -0,0 +1,148 @@
+"""
+Step 결과 캐시
+
+(action, 치환된 input)을 키로 Step 실행 결과를 캐시하는 모듈
+
+📌 목적:
+- 몇 초 안에 같은 날짜/조건으로 반복되는 조회 Step(get_calendar_events,
+  find_free_time)을 Tool 호출 없이 바로 반환
+- 쓰기 Tool(create_event)이 성공하면 관련 조회 캐시 무효화
+- 무효화 전에 시작한 조회가 늦게 끝나도 옛 결과를 다시 저장하지 않음
+  (Action별 무효화 세대를 Tool 호출 전에 읽어 두고 저장 시 비교)
+
+💡 Skill Card 설정 (tools[]):
+    {"name": "get_calendar_events", "cache_ttl_ms": 5000}
+    {"name": "create_event", "invalidates": ["get_calendar_events"]}
+
+💡 사용 방식:
+    cache = StepCache(maxsize=1024)
+    executor = SkillCardExecutor(card, cache=cache)
+
+    generation = cache.generation("get_calendar_events")  # Tool 호출 전
+    cache.set("get_calendar_events", input_data, result, 5000, generation)
+"""
+
+import copy
+import json
+import threading
+from typing import Any
+
+from multi_agent_lab.infra.cache import MISSING, LRUCache
+
+
+class StepCache:
+    """
+    Step 결과 캐시 (LRU + Action별 TTL)
+
+    캐시된 값은 저장/조회 시 깊은 복사하므로 Tool이나 호출자가
+    결과를 수정해도 캐시에는 영향이 없습니다.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수 (넘으면 LRU로 제거)
+        """
+        self._cache = LRUCache(maxsize=maxsize)
+        # 무효화 세대: (전체 무효화 횟수, Action별 무효화 횟수)
+        self._epoch = 0
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(action: str, input_data: dict[str, Any]) -> tuple[str, str]:
+        """
+        캐시 키 생성: (action, 정렬된 JSON input)
+
+        Args:
+            action: Action 이름
+            input_data: 치환된 input
+        """
+        return action, json.dumps(
+            input_data, sort_keys=True, ensure_ascii=False, default=str
+        )
+
+    def get(self, action: str, input_data: dict[str, Any]) -> Any:
+        """
+        캐시 조회
+
+        Returns:
+            캐시된 결과 (없으면 MISSING)
+        """
+        value = self._cache.get(self.make_key(action, input_data), MISSING)
+        return value if value is MISSING else copy.deepcopy(value)
+
+    def generation(self, action: str) -> tuple[int, int]:
+        """
+        Action의 현재 무효화 세대 (Tool 호출 전에 읽어 set()에 전달)
+
+        Args:
+            action: Action 이름
+        """
+        with self._lock:
+            return self._epoch, self._generations.get(action, 0)
+
+    def set(
+        self,
+        action: str,
+        input_data: dict[str, Any],
+        result: Any,
+        ttl_ms: int,
+        generation: tuple[int, int] | None = None,
+    ) -> bool:
+        """
+        결과 저장
+
+        Args:
+            action: Action 이름
+            input_data: 치환된 input
+            result: Step 실행 결과
+            ttl_ms: 만료 시간 (밀리초)
+            generation: Tool 호출 전에 읽은 generation() (그 사이 무효화됐으면
+                저장하지 않음, None이면 항상 저장)
+
+        Returns:
+            저장 여부
+        """
+        value = copy.deepcopy(result)
+        key = self.make_key(action, input_data)
+        with self._lock:
+            current = (self._epoch, self._generations.get(action, 0))
+            if generation is not None and generation != current:
+                return False
+            self._cache.set(key, value, ttl_ms / 1000)
+        return True
+
+    def invalidate(self, *actions: str) -> int:
+        """
+        Action의 캐시 항목 모두 삭제
+
+        Args:
+            *actions: 무효화할 Action 이름들 (없으면 전체)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if not actions:
+                self._epoch += 1
+                count = len(self._cache)
+                self._cache.clear()
+                return count
+            targets = set(actions)
+            for action in targets:
+                self._generations[action] = self._generations.get(action, 0) + 1
+            return self._cache.delete_where(lambda key: key[0] in targets)
+
+    @property
+    def hits(self) -> int:
+        """캐시 적중 횟수"""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """캐시 미스 횟수"""
+        return self._cache.misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,165 @@
+"""
+Skill Card 실행 체크포인트
+
+Step이 끝날 때마다 ExecutionContext를 저장해서, 실패한 실행을
+처음부터가 아니라 실패한 Step부터 다시 시작할 수 있게 하는 모듈
+
+📌 목적:
+- Step 4(create_event)가 실패해도 Step 1~3 결과(LLM 파싱 등)를 보존
+- resume(run_id)로 끝나지 않은 Step만 다시 실행
+
+💡 저장소:
+- InMemoryCheckpointStore: 프로세스 내 dict (테스트/단일 프로세스용)
+- FileCheckpointStore: 디렉토리에 run_id별 JSON 파일
+- RedisCheckpointStore: RedisClient 기반 (여러 프로세스/서버가 공유)
+
+💡 사용 방식:
+    store = FileCheckpointStore(".checkpoints")
+    executor = SkillCardExecutor(card, checkpoint_store=store)
+
+    try:
+        executor.execute("내일 회의", run_id="req-123")
+    except Exception:
+        result = executor.resume("req-123")  # 실패한 Step부터 다시 실행
+"""
+
+import copy
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from multi_agent_lab.infra.database.redis import RedisClient
+
+
+class CheckpointStore(ABC):
+    """
+    체크포인트 저장소 인터페이스
+
+    체크포인트는 ExecutionContext.to_dict()로 만든 JSON 호환 dict입니다.
+    """
+
+    @abstractmethod
+    def save(self, run_id: str, checkpoint: dict[str, Any]):
+        """체크포인트 저장 (같은 run_id면 덮어씀)"""
+
+    @abstractmethod
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        """체크포인트 조회 (없으면 None)"""
+
+    @abstractmethod
+    def delete(self, run_id: str) -> bool:
+        """체크포인트 삭제 (삭제 여부 반환)"""
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """프로세스 메모리에 저장하는 체크포인트 저장소"""
+
+    def __init__(self):
+        self._data: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def save(self, run_id: str, checkpoint: dict[str, Any]):
+        # 실행 중인 Context가 이후에 바뀌어도 저장된 값은 그대로 유지
+        snapshot = copy.deepcopy(checkpoint)
+        with self._lock:
+            self._data[run_id] = snapshot
+
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            checkpoint = self._data.get(run_id)
+        return copy.deepcopy(checkpoint) if checkpoint is not None else None
+
+    def delete(self, run_id: str) -> bool:
+        with self._lock:
+            return self._data.pop(run_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    디렉토리에 run_id별 JSON 파일로 저장하는 체크포인트 저장소
+
+    임시 파일에 쓴 뒤 교체하므로 저장 도중 중단되어도
+    이전 체크포인트가 깨지지 않습니다.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        Args:
+            directory: 체크포인트 파일을 저장할 디렉토리 (없으면 생성)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, run_id: str) -> Path:
+        if not run_id or "/" in run_id or "\\" in run_id or run_id.startswith("."):
+            raise ValueError(f"사용할 수 없는 run_id입니다: {run_id!r}")
+        return self.directory / f"{run_id}.json"
+
+    def save(self, run_id: str, checkpoint: dict[str, Any]):
+        path = self._path(run_id)
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(_dumps(checkpoint), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        path = self._path(run_id)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def delete(self, run_id: str) -> bool:
+        path = self._path(run_id)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
+
+
+class RedisCheckpointStore(CheckpointStore):
+    """
+    Redis에 저장하는 체크포인트 저장소
+
+    Example:
+        >>> client = RedisClient(RedisConfig.from_env())
+        >>> store = RedisCheckpointStore(client, ttl_seconds=3600)
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        prefix: str = "skill_card:checkpoint:",
+        ttl_seconds: int | None = 86400,
+    ):
+        """
+        Args:
+            client: RedisClient 인스턴스
+            prefix: 키 접두사
+            ttl_seconds: 체크포인트 만료 시간 (None이면 만료 없음)
+        """
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, run_id: str) -> str:
+        return f"{self.prefix}{run_id}"
+
+    def save(self, run_id: str, checkpoint: dict[str, Any]):
+        self.client.set(self._key(run_id), _dumps(checkpoint), ex=self.ttl_seconds)
+
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        raw = self.client.get(self._key(run_id))
+        return json.loads(raw) if raw is not None else None
+
+    def delete(self, run_id: str) -> bool:
+        return self.client.delete(self._key(run_id)) > 0
+
+
+def _dumps(checkpoint: dict[str, Any]) -> str:
+    """체크포인트 직렬화 (JSON으로 표현할 수 없는 값은 문자열로 저장)"""
+    return json.dumps(checkpoint, ensure_ascii=False, default=str)
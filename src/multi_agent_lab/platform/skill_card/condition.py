@@ -0,0 +1,86 @@
+"""
+Step 실행 조건
+
+ExecutionStep의 when / exit_if 조건을 컴파일하고 평가하는 모듈
+
+📌 조건 문법:
+- "${available_slots.best_slot}": 값이 있고 참이면 True
+- "!${available_slots.best_slot}": 값이 없거나 거짓이면 True
+- "${event_data.title} 회의" 같은 문자열: 치환 결과가 빈 문자열/"false"/"0"이 아니면 True
+
+💡 사용 방식:
+    condition = compile_condition("!${available_slots.best_slot}")
+    condition.references  # {"available_slots"}
+    condition.evaluate({"available_slots": {"best_slot": None}})  # True
+"""
+
+from typing import Any
+
+from .template import MISSING, Placeholder, Template, compile_string
+
+# 문자열 조건에서 거짓으로 보는 값
+_FALSE_STRINGS = frozenset({"", "false", "0", "none", "null"})
+
+
+class Condition:
+    """컴파일된 실행 조건"""
+
+    __slots__ = ("expression", "negate", "template")
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: 조건식 (앞에 "!"를 붙이면 부정)
+        """
+        self.expression = expression
+        text = expression.strip()
+        self.negate = text.startswith("!")
+        if self.negate:
+            text = text[1:].strip()
+        if not text:
+            raise ValueError(f"빈 조건식입니다: {expression!r}")
+        self.template: Template = compile_string(text)
+
+    @property
+    def references(self) -> frozenset[str]:
+        """참조하는 루트 변수명"""
+        return self.template.references
+
+    def evaluate(self, variables: dict[str, Any]) -> bool:
+        """
+        조건 평가
+
+        Args:
+            variables: 실행 컨텍스트 변수
+
+        Returns:
+            조건 충족 여부
+        """
+        if isinstance(self.template, Placeholder):
+            value = self.template.lookup(variables)
+            result = value is not MISSING and bool(value)
+        else:
+            value = self.template.resolve(variables)
+            if isinstance(value, str):
+                result = value.strip().lower() not in _FALSE_STRINGS
+            else:
+                result = bool(value)
+        return result != self.negate
+
+    def __repr__(self) -> str:
+        return f"Condition({self.expression!r})"
+
+
+def compile_condition(expression: str) -> Condition | None:
+    """
+    조건식 컴파일
+
+    Args:
+        expression: 조건식 (빈 문자열이면 조건 없음)
+
+    Returns:
+        Condition (조건이 없으면 None)
+    """
+    if not expression or not expression.strip():
+        return None
+    return Condition(expression)
@@ -0,0 +1,72 @@
+"""
+Skill Card 실행 이벤트
+
+Execution Plan 실행 중 발생하는 이벤트 정의
+
+📌 이벤트 종류:
+- plan_started: 실행 시작
+- step_started: Step 시작 (치환된 input 포함)
+- step_finished: Step 성공 (output, 소요 시간 포함)
+- step_skipped: Step 실패했지만 on_error="skip"으로 건너뜀
+  (when 조건이 거짓이라 실행하지 않은 경우는 error=None)
+- step_failed: Step 실패 (on_error="fail")
+- plan_finished: 실행 완료 (최종 결과 포함)
+- plan_failed: 실행 실패
+
+💡 사용 방식:
+    for event in executor.execute_stream("내일 회의"):
+        if event.type == "step_finished":
+            print(event.step, event.action, event.elapsed_ms)
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+
+EventType = Literal[
+    "plan_started",
+    "step_started",
+    "step_finished",
+    "step_skipped",
+    "step_failed",
+    "plan_finished",
+    "plan_failed",
+]
+
+
+@dataclass(frozen=True)
+class StepEvent:
+    """
+    실행 이벤트
+
+    Attributes:
+        type: 이벤트 종류
+        step: Step 번호 (plan 이벤트는 None)
+        action: Action 이름 (plan 이벤트는 None)
+        input: 치환된 input (step_started)
+        output: Step 결과 또는 최종 결과 (step_finished, plan_finished)
+        error: 에러 메시지 (step_skipped, step_failed, plan_failed)
+        elapsed_ms: 소요 시간
+        attempts: Tool 호출 시도 횟수
+        cached: 캐시에서 가져온 결과인지 여부
+        timestamp: 발생 시각 (time.time)
+    """
+
+    type: EventType
+    step: int | None = None
+    action: str | None = None
+    input: Any = None
+    output: Any = None
+    error: str | None = None
+    elapsed_ms: float | None = None
+    attempts: int | None = None
+    cached: bool = False
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, Any]:
+        """dict로 변환 (JSON 응답/SSE 전송용)"""
+        return asdict(self)
+
+
+EventListener = Callable[[StepEvent], None]
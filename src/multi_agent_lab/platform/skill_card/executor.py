@@ -8,16 +8,116 @@ Skill Card의 Execution Plan을 실제로 실행하는 엔진
 2. 변수 치환: ${variable} → 실제 값
 3. Step 간 데이터 전달: output_to → 다음 Step의 input
 4. 에러 처리: on_error에 따라 fail/skip
+5. 병렬 실행: 서로 의존하지 않는 Step을 동시에 실행 (parallel=True)
+6. 비동기 실행: aexecute()로 이벤트 루프에서 실행
+7. 타임아웃/재시도: timeout_ms, tools[].retry, 전체 plan 마감 시간
+8. 배치 실행: execute_many()로 여러 질의를 동시에 실행하고 통계 집계
+9. 결과 캐시: tools[].cache_ttl_ms가 있는 Step은 (action, input)별로 캐시
+10. 스트리밍: execute_stream()/aexecute_stream()으로 Step 이벤트를 바로 전달
+11. 체크포인트: Step마다 진행 상황을 저장하고 resume()으로 실패한 Step부터 재실행
+12. 트레이싱: plan/Step별 span(소요 시간, input/output 크기, 재시도 횟수) 기록
+13. 조건 실행: when이 거짓이면 Step 건너뜀, exit_if가 참이면 plan 조기 종료
+14. 추측 실행: 예측값으로 read_only 조회 Step을 미리 실행하고 맞으면 결과 사용
+15. 실행 방식: Tool마다 inline/thread/process 선택 (CPU 위주 Tool은 프로세스 풀)
 
 💡 사용 방식:
     executor = SkillCardExecutor(skill_card)
     result = executor.execute(user_query="내일 회의", context={...})
+
+    # 의존성 그래프(DAG) 기반 병렬 실행
+    executor = SkillCardExecutor(skill_card, parallel=True, max_workers=4)
+
+    # 비동기 실행 (tool.ainvoke 사용)
+    result = await executor.aexecute(user_query="내일 회의")
+
+    # 전체 plan을 10초 안에 끝내기 (남은 시간만큼 Step 타임아웃이 줄어듦)
+    executor = SkillCardExecutor(skill_card, plan_timeout_ms=10_000)
+
+    # 요청 로그 재실행 (끝나는 순서대로 결과 반환)
+    batch = executor.execute_many(queries, concurrency=16)
+    for item in batch:
+        ...
+    batch.print_summary()
+
+    # 조회 Step 결과 캐시 (여러 Executor가 공유 가능)
+    executor = SkillCardExecutor(skill_card, cache=StepCache(maxsize=1024))
+
+    # Step 시작/종료 이벤트를 실시간으로 받기
+    for event in executor.execute_stream(user_query="내일 회의"):
+        print(event.type, event.step, event.elapsed_ms)
+
+    # 실패한 실행을 실패한 Step부터 다시 실행
+    executor = SkillCardExecutor(skill_card, checkpoint_store=store)
+    try:
+        executor.execute(user_query="내일 회의", run_id="req-123")
+    except Exception:
+        result = executor.resume("req-123")
+
+    # Step별 span을 JSON Lines로 기록
+    tracer = Tracer([JsonLinesExporter("traces.jsonl")])
+    executor = SkillCardExecutor(skill_card, tracer=tracer)
+
+    # LLM 파싱이 끝나기 전에 날짜를 예측해서 조회 Step을 미리 실행
+    executor.register_speculator(
+        "event_data", lambda v: {"date": predict_event_date(v["user_query"])}
+    )
+
+    # CPU 위주 Tool은 공유 프로세스 풀에서 실행
+    executor.register_tool("calculate_var", calculate_var, execution="process")
 """
 
-import re
+import asyncio
+import queue
+import random
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
-from .schema import ExecutionStep, SkillCard
+from multi_agent_lab.infra.cache import MISSING
+
+from .batch import BatchQuery, BatchRun
+from .cache import StepCache
+from .checkpoint import CheckpointStore
+from .condition import Condition, compile_condition
+from .events import EventListener, StepEvent
+from .planner import ExecutionGraph
+from .pools import (
+    TOOL_EXECUTIONS,
+    ToolExecution,
+    dump_input,
+    get_process_pool,
+    invoke_in_process,
+    process_target,
+)
+from .schema import ExecutionStep, SkillCard, ToolConfig
+from .speculation import (
+    Predictor,
+    SpeculationAbandonedError,
+    SpeculativeStep,
+    has_unresolved,
+)
+from .template import Template, compile_template
+from .tracing import Span, Tracer, payload_size
+
+
+class StepTimeoutError(TimeoutError):
+    """Step(Tool 호출)이 timeout_ms 안에 끝나지 않음"""
+
+
+class PlanTimeoutError(TimeoutError):
+    """전체 Execution Plan의 마감 시간 초과"""
+
+
+# Step 이벤트 종류 → span 상태
+_SPAN_STATUS = {
+    "step_finished": "ok",
+    "step_skipped": "skipped",
+    "step_failed": "error",
+}
 
 
 class ExecutionContext:
@@ -27,13 +127,101 @@ class ExecutionContext:
     Step 실행 중 생성된 변수들을 저장하고 관리합니다.
     """
 
-    def __init__(self, initial_data: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        initial_data: dict[str, Any] | None = None,
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+    ):
         """
         Args:
             initial_data: 초기 데이터 (user_query, user_id 등)
+            quiet: True면 실행 로그를 출력하지 않음
+            on_event: 실행 이벤트를 받을 콜백
         """
         self.variables: dict[str, Any] = initial_data or {}
         self.step_results: list[dict] = []
+        self.quiet = quiet
+        self.on_event = on_event
+        # 체크포인트 키 (checkpoint_store가 없으면 None)
+        self.run_id: str | None = None
+        # 끝난 Step 번호 (성공 또는 skip, resume 시 다시 실행하지 않음)
+        self.completed: set[int] = set()
+        # 트레이싱 span (Tracer에 리스너가 있을 때만 생성)
+        self.plan_span: Span | None = None
+        self.step_spans: dict[int, Span] = {}
+        # exit_if 조건으로 plan을 끝낸 Step 번호
+        self.exit_step: int | None = None
+        # 추측 실행 중인 Step (Step 번호 → SpeculativeStep)
+        self.speculations: dict[int, SpeculativeStep] = {}
+        # 추측 실행 결과를 사용한 Step 번호
+        self.speculated: set[int] = set()
+        # 추측 실행 Task (asyncio, 실행이 끝나면 취소)
+        self.speculation_tasks: list[asyncio.Task] = []
+        # 실행 시작 시각 (time.perf_counter 기준)
+        self.plan_started = time.perf_counter()
+        # 전체 plan 마감 시각 (time.monotonic 기준, None이면 무제한)
+        self.deadline: float | None = None
+        # Step 번호 → Tool 호출 시도 횟수 (재시도 포함)
+        self.attempts: dict[int, int] = {}
+        # Step 번호 → 시작 시각 (time.perf_counter 기준)
+        self.started: dict[int, float] = {}
+        # 캐시에서 결과를 가져온 Step 번호
+        self.cached: set[int] = set()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        체크포인트용 dict로 변환
+
+        Returns:
+            run_id, variables, step_results, completed를 담은 dict
+        """
+        return {
+            "run_id": self.run_id,
+            "variables": self.variables,
+            "step_results": self.step_results,
+            "completed": sorted(self.completed),
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+    ) -> "ExecutionContext":
+        """
+        체크포인트에서 실행 컨텍스트 복원
+
+        끝나지 않은 Step(실패한 Step)의 기록은 버립니다.
+
+        Args:
+            data: to_dict()로 만든 dict
+            quiet: True면 실행 로그를 출력하지 않음
+            on_event: 실행 이벤트를 받을 콜백
+        """
+        ctx = cls(dict(data["variables"]), quiet=quiet, on_event=on_event)
+        ctx.run_id = data.get("run_id")
+        ctx.completed = set(data.get("completed", []))
+        ctx.step_results = [
+            r for r in data.get("step_results", []) if r["step"] in ctx.completed
+        ]
+        return ctx
+
+    def emit(self, event: StepEvent):
+        """이벤트 전달 (콜백이 없으면 무시)"""
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def plan_elapsed_ms(self) -> float:
+        """실행 시작부터 지금까지 걸린 시간 (밀리초)"""
+        return (time.perf_counter() - self.plan_started) * 1000
+
+    def remaining_ms(self) -> float | None:
+        """전체 plan 마감까지 남은 시간 (밀리초, 마감이 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return (self.deadline - time.monotonic()) * 1000
 
     def set(self, key: str, value: Any):
         """변수 저장"""
@@ -44,53 +232,205 @@ class ExecutionContext:
         return self.variables.get(key)
 
     def add_step_result(
-        self, step: int, action: str, result: Any, error: str | None = None
-    ):
-        """Step 실행 결과 기록"""
-        self.step_results.append(
-            {
-                "step": step,
-                "action": action,
-                "result": result,
-                "error": error,
-            }
-        )
+        self,
+        step: int,
+        action: str,
+        result: Any,
+        error: str | None = None,
+        skipped: bool = False,
+    ) -> dict:
+        """Step 실행 결과 기록 (skipped: when 조건 불충족으로 실행하지 않음)"""
+        record = {
+            "step": step,
+            "action": action,
+            "result": result,
+            "error": error,
+            "attempts": 0 if skipped else self.attempts.get(step, 1),
+            "elapsed_ms": self._elapsed_ms(step),
+            "cached": step in self.cached,
+            "skipped": skipped,
+            "speculative": step in self.speculated,
+        }
+        self.step_results.append(record)
+        return record
+
+    def _elapsed_ms(self, step: int) -> float | None:
+        """Step 시작부터 지금까지 걸린 시간 (밀리초)"""
+        started = self.started.get(step)
+        if started is None:
+            return None
+        return (time.perf_counter() - started) * 1000
 
 
 class SkillCardExecutor:
     """Skill Card 실행 엔진"""
 
-    def __init__(self, skill_card: SkillCard, verbose: bool = False):
+    def __init__(
+        self,
+        skill_card: SkillCard,
+        verbose: bool = False,
+        parallel: bool = False,
+        max_workers: int = 4,
+        plan_timeout_ms: int | None = None,
+        enforce_timeouts: bool = True,
+        retry_backoff_ms: int = 100,
+        retry_backoff_max_ms: int = 2000,
+        tool_pool_size: int = 32,
+        cache: StepCache | None = None,
+        checkpoint_store: CheckpointStore | None = None,
+        tracer: Tracer | None = None,
+    ):
         """
         Args:
             skill_card: 실행할 Skill Card
             verbose: 상세 로그 출력 여부 (기본값: False)
+            parallel: 의존성 그래프 기반 병렬 실행 여부 (기본값: False)
+            max_workers: 병렬 실행 시 동시에 실행할 최대 Step 수
+            plan_timeout_ms: 전체 plan 마감 시간 (None이면 무제한)
+            enforce_timeouts: Step/Tool timeout_ms 적용 여부 (기본값: True)
+            retry_backoff_ms: 첫 재시도 전 대기 시간의 기준값
+            retry_backoff_max_ms: 재시도 대기 시간 상한
+            tool_pool_size: 타임아웃을 적용해 동시에 호출할 수 있는 최대 Tool 수
+                (여러 실행이 공유하며, 빈 스레드를 기다린 시간은 Step 타임아웃에
+                포함하지 않음)
+            cache: Step 결과 캐시 (None이면 캐시 안 함)
+            checkpoint_store: Step마다 진행 상황을 저장할 저장소
+                (None이면 저장 안 함, 있으면 resume() 사용 가능)
+            tracer: plan/Step span을 받을 Tracer (None이거나 리스너가 없으면
+                span을 만들지 않음)
         """
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다")
+        if plan_timeout_ms is not None and plan_timeout_ms <= 0:
+            raise ValueError("plan_timeout_ms는 0보다 커야 합니다")
+
         self.skill_card = skill_card
         self.verbose = verbose
+        self.parallel = parallel
+        self.max_workers = max_workers
         # Tools 저장소: {tool_name: tool_function}
         self.tools: dict[str, Any] = {}
+        # Tool 실행 방식: {tool_name: inline/thread/process}
+        self.tool_executions: dict[str, ToolExecution] = {}
+        # process Tool을 프로세스 풀로 보낼 때의 표현 (Tool 또는 ToolReference)
+        self._process_targets: dict[str, Any] = {}
+        # Step input 템플릿 (로드 시 한 번만 컴파일)
+        self.templates: dict[int, Template] = {
+            step.step: compile_template(step.input)
+            for step in skill_card.execution_plan
+        }
+        # Step 실행/종료 조건 (when, exit_if가 있는 Step만)
+        self.when_conditions: dict[int, Condition] = {}
+        self.exit_conditions: dict[int, Condition] = {}
+        for step in skill_card.execution_plan:
+            if when := compile_condition(step.when):
+                self.when_conditions[step.step] = when
+            if exit_if := compile_condition(step.exit_if):
+                self.exit_conditions[step.step] = exit_if
+        # plan 안에서의 Step 순서
+        self.step_order: dict[int, int] = {
+            step.step: i for i, step in enumerate(skill_card.execution_plan)
+        }
+        # Step 의존성 그래프 (input/조건의 ${...} 참조와 output_to로 계산)
+        self.graph = ExecutionGraph.from_steps(skill_card.execution_plan)
+
+        # 타임아웃/재시도 정책
+        self.plan_timeout_ms = plan_timeout_ms
+        self.enforce_timeouts = enforce_timeouts
+        self.retry_backoff_ms = retry_backoff_ms
+        self.retry_backoff_max_ms = retry_backoff_max_ms
+        self.tool_configs: dict[str, ToolConfig] = {
+            tool.name: tool for tool in skill_card.tools
+        }
+        self.cache = cache
+        self.checkpoint_store = checkpoint_store
+        self.tracer = tracer
+        # 추측 실행 predictor: {output_to 변수명: predictor}
+        self.speculators: dict[str, Predictor] = {}
+        # 타임아웃 적용용 Tool 호출 스레드 풀 (첫 호출 시 생성)
+        self.tool_pool_size = tool_pool_size
+        self._tool_pool: ThreadPoolExecutor | None = None
+        self._tool_pool_lock = threading.Lock()
+
+    def close(self):
+        """
+        Tool 호출 스레드 풀 종료
 
-    def register_tool(self, name: str, tool: Any):
+        타임아웃으로 버려진 Tool 호출은 기다리지 않습니다.
+        """
+        if self._tool_pool is not None:
+            self._tool_pool.shutdown(wait=False, cancel_futures=True)
+            self._tool_pool = None
+
+    def __enter__(self):
+        """Context manager 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager 종료"""
+        self.close()
+
+    def register_tool(self, name: str, tool: Any, execution: ToolExecution = "thread"):
         """
         Tool 등록
 
         Args:
             name: Tool 이름 (예: "parse_event_info")
             tool: LangChain @tool 함수
+            execution: 실행 방식
+                - "thread": Tool 스레드 풀에서 실행 (기본값, I/O 위주 Tool)
+                - "inline": 호출한 스레드에서 바로 실행 (타임아웃 적용 안 됨)
+                - "process": 공유 프로세스 풀에서 실행 (CPU 위주 Tool)
+
+        Raises:
+            ValueError: 알 수 없는 실행 방식
+            TypeError: process Tool을 프로세스로 보낼 수 없는 경우
 
         Example:
             >>> from personal_assistant.tools.schedule_tools import parse_event_info
             >>> executor.register_tool("parse_event_info", parse_event_info)
         """
+        if execution not in TOOL_EXECUTIONS:
+            raise ValueError(f"알 수 없는 실행 방식입니다: {execution}")
+
+        if execution == "process":
+            self._process_targets[name] = process_target(tool)
+        else:
+            self._process_targets.pop(name, None)
         self.tools[name] = tool
+        self.tool_executions[name] = execution
         if self.verbose:
             print(f"✓ Tool 등록: {name}")
 
+    def register_speculator(self, output_to: str, predictor: Predictor):
+        """
+        추측 실행 predictor 등록
+
+        output_to가 이 변수인 Step이 시작되면 predictor로 값을 예측하고,
+        그 변수만 기다리는 read_only Tool Step을 미리 실행합니다.
+        실제 결과로 치환한 input이 예측 때와 같을 때만 미리 실행한 결과를
+        사용하므로, 예측이 틀려도 결과는 달라지지 않습니다.
+
+        Args:
+            output_to: 예측할 변수명 (예: "event_data")
+            predictor: 실행 컨텍스트 변수를 받아 예측값을 반환하는 함수
+                (예측할 수 없으면 None)
+
+        Example:
+            >>> executor.register_speculator(
+            ...     "event_data",
+            ...     lambda v: {"date": predict_event_date(v["user_query"])},
+            ... )
+        """
+        self.speculators[output_to] = predictor
+
     def execute(
         self,
         user_query: str,
         context: dict[str, Any] | None = None,
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+        run_id: str | None = None,
     ) -> dict[str, Any]:
         """
         Skill Card 실행
@@ -98,44 +438,574 @@ class SkillCardExecutor:
         Args:
             user_query: 사용자 질의
             context: 추가 컨텍스트 (user_id, conversation_history 등)
+            quiet: True면 Step별 콘솔 로그를 출력하지 않음
+            on_event: Step 시작/종료 등 실행 이벤트를 받을 콜백
+            run_id: 체크포인트 키 (checkpoint_store가 있을 때만 사용,
+                없으면 자동 생성되어 결과와 예외 노트에 포함)
 
         Returns:
             실행 결과
         """
-        # 실행 컨텍스트 초기화
+        ctx = self._start(user_query, context, quiet, on_event, run_id)
+        return self._run(ctx)
+
+    def resume(
+        self,
+        run_id: str,
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+    ) -> dict[str, Any]:
+        """
+        체크포인트에서 실행 재개
+
+        이미 끝난 Step(성공 또는 skip)은 건너뛰고 나머지 Step만 실행합니다.
+        실행이 성공하면 체크포인트는 삭제됩니다.
+
+        Args:
+            run_id: execute()에 사용한 run_id
+            quiet: True면 Step별 콘솔 로그를 출력하지 않음
+            on_event: Step 시작/종료 등 실행 이벤트를 받을 콜백
+
+        Returns:
+            실행 결과 (execute()와 동일한 형태)
+
+        Raises:
+            ValueError: checkpoint_store가 없거나 다른 Skill Card의 체크포인트
+            KeyError: run_id의 체크포인트가 없음
+        """
+        ctx = self._restore(run_id, quiet, on_event)
+        return self._run(ctx)
+
+    def _run(self, ctx: ExecutionContext) -> dict[str, Any]:
+        """Execution Plan 실행 (execute/resume 공통)"""
+        try:
+            if self.parallel:
+                self._execute_parallel(ctx)
+            else:
+                # Execution Plan의 각 Step 순서대로 실행
+                for step in self.skill_card.execution_plan:
+                    if ctx.exit_step is not None:
+                        break
+                    if step.step in ctx.completed:
+                        continue
+                    try:
+                        self._execute_step(step, ctx)
+                    except Exception as e:
+                        self._handle_step_error(step, ctx, e)
+        except Exception as e:
+            self._fail(ctx, e)
+            raise
+
+        return self._finish(ctx)
+
+    async def aexecute(
+        self,
+        user_query: str,
+        context: dict[str, Any] | None = None,
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+        run_id: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Skill Card 비동기 실행
+
+        execute()와 같은 결과를 반환하지만 Tool을 tool.ainvoke로 호출하므로
+        실행 중에 스레드를 점유하지 않습니다. 하나의 이벤트 루프에서
+        여러 Skill Card 실행을 동시에 진행할 수 있습니다.
+
+        Args:
+            user_query: 사용자 질의
+            context: 추가 컨텍스트 (user_id, conversation_history 등)
+            quiet: True면 Step별 콘솔 로그를 출력하지 않음
+            on_event: Step 시작/종료 등 실행 이벤트를 받을 콜백
+            run_id: 체크포인트 키 (checkpoint_store가 있을 때만 사용)
+
+        Returns:
+            실행 결과 (execute()와 동일한 형태)
+
+        Example:
+            >>> results = await asyncio.gather(
+            ...     executor.aexecute("내일 회의"),
+            ...     executor.aexecute("모레 미팅"),
+            ... )
+        """
+        ctx = self._start(user_query, context, quiet, on_event, run_id)
+        return await self._arun(ctx)
+
+    async def aresume(
+        self,
+        run_id: str,
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+    ) -> dict[str, Any]:
+        """
+        체크포인트에서 비동기 실행 재개 (resume()의 비동기 버전)
+
+        Args:
+            run_id: execute()/aexecute()에 사용한 run_id
+            quiet: True면 Step별 콘솔 로그를 출력하지 않음
+            on_event: Step 시작/종료 등 실행 이벤트를 받을 콜백
+
+        Returns:
+            실행 결과 (execute()와 동일한 형태)
+        """
+        ctx = self._restore(run_id, quiet, on_event)
+        return await self._arun(ctx)
+
+    async def _arun(self, ctx: ExecutionContext) -> dict[str, Any]:
+        """Execution Plan 비동기 실행 (aexecute/aresume 공통)"""
+        try:
+            if self.parallel:
+                await self._aexecute_parallel(ctx)
+            else:
+                for step in self.skill_card.execution_plan:
+                    if ctx.exit_step is not None:
+                        break
+                    if step.step in ctx.completed:
+                        continue
+                    try:
+                        await self._aexecute_step(step, ctx)
+                    except Exception as e:
+                        self._handle_step_error(step, ctx, e)
+        except Exception as e:
+            self._fail(ctx, e)
+            raise
+
+        return self._finish(ctx)
+
+    def execute_stream(
+        self,
+        user_query: str,
+        context: dict[str, Any] | None = None,
+        quiet: bool = True,
+    ) -> Iterator[StepEvent]:
+        """
+        Skill Card 실행 (이벤트 스트리밍)
+
+        실행은 백그라운드 스레드에서 진행되고, Step이 시작/종료될 때마다
+        StepEvent를 바로 반환합니다. 마지막 이벤트는 plan_finished
+        (output=최종 결과) 또는 plan_failed(error=에러 메시지)이며,
+        실패해도 예외를 다시 발생시키지 않습니다.
+
+        Args:
+            user_query: 사용자 질의
+            context: 추가 컨텍스트
+            quiet: True면 콘솔 로그를 출력하지 않음 (기본값: True)
+
+        Yields:
+            StepEvent
+
+        Example:
+            >>> for event in executor.execute_stream("내일 회의"):
+            ...     if event.type == "step_finished":
+            ...         render_progress(event.step, event.output)
+        """
+        events: queue.Queue[StepEvent | None] = queue.Queue()
+
+        def run():
+            try:
+                self.execute(user_query, context, quiet=quiet, on_event=events.put)
+            except Exception:
+                pass  # plan_failed 이벤트로 이미 전달됨
+            finally:
+                events.put(None)
+
+        threading.Thread(target=run, name="skill-card-stream", daemon=True).start()
+
+        while (event := events.get()) is not None:
+            yield event
+
+    async def aexecute_stream(
+        self,
+        user_query: str,
+        context: dict[str, Any] | None = None,
+        quiet: bool = True,
+    ) -> AsyncIterator[StepEvent]:
+        """
+        Skill Card 비동기 실행 (이벤트 스트리밍)
+
+        execute_stream()의 async iterator 버전입니다.
+        순회를 중간에 멈추면 진행 중인 실행도 취소됩니다.
+
+        Args:
+            user_query: 사용자 질의
+            context: 추가 컨텍스트
+            quiet: True면 콘솔 로그를 출력하지 않음 (기본값: True)
+
+        Yields:
+            StepEvent
+
+        Example:
+            >>> async for event in executor.aexecute_stream("내일 회의"):
+            ...     await websocket.send_json(event.to_dict())
+        """
+        events: asyncio.Queue[StepEvent | None] = asyncio.Queue()
+
+        async def run():
+            try:
+                await self.aexecute(
+                    user_query, context, quiet=quiet, on_event=events.put_nowait
+                )
+            except Exception:
+                pass  # plan_failed 이벤트로 이미 전달됨
+            finally:
+                events.put_nowait(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+        finally:
+            if not task.done():
+                task.cancel()
+
+    def execute_many(
+        self,
+        queries: Iterable[BatchQuery],
+        concurrency: int = 8,
+        context: dict[str, Any] | None = None,
+    ) -> BatchRun:
+        """
+        여러 질의를 동시에 실행 (배치 모드)
+
+        이 Executor와 등록된 Tool을 그대로 재사용하며, Step별 콘솔 로그는
+        출력하지 않습니다. 결과는 끝나는 순서대로 반환되고, 순회가 끝나면
+        batch.stats에 처리량과 Step별 지연 시간 히스토그램이 집계됩니다.
+
+        Args:
+            queries: 질의 목록 (str 또는 (질의, 컨텍스트) 튜플)
+            concurrency: 동시에 실행할 최대 질의 수
+            context: 모든 질의에 공통으로 넣을 컨텍스트
+
+        Returns:
+            BatchRun (순회하면 BatchItem을 반환)
+
+        Example:
+            >>> batch = executor.execute_many(
+            ...     [("내일 회의", {"user_id": "u1"}), "모레 미팅"],
+            ...     concurrency=16,
+            ... )
+            >>> for item in batch:
+            ...     print(item.index, item.success, item.elapsed_ms)
+            >>> batch.print_summary()
+        """
+        return BatchRun(
+            lambda query, ctx: self.execute(query, ctx, quiet=True),
+            queries,
+            concurrency=concurrency,
+            context=context,
+        )
+
+    def _start(
+        self,
+        user_query: str,
+        context: dict[str, Any] | None,
+        quiet: bool = False,
+        on_event: EventListener | None = None,
+        run_id: str | None = None,
+    ) -> ExecutionContext:
+        """실행 컨텍스트 초기화 및 시작 로그 출력"""
         initial_data = {
             "user_query": user_query,
             **(context or {}),
         }
-        ctx = ExecutionContext(initial_data)
+        ctx = ExecutionContext(initial_data, quiet=quiet, on_event=on_event)
+        if self.checkpoint_store is not None:
+            ctx.run_id = run_id or uuid.uuid4().hex
+        if self.plan_timeout_ms is not None:
+            ctx.deadline = time.monotonic() + self.plan_timeout_ms / 1000
 
-        print(f"\n🚀 Execution Plan 시작: {self.skill_card.agent_name}")
-        print(f"📝 질의: {user_query}\n")
+        self._log(ctx, f"\n🚀 Execution Plan 시작: {self.skill_card.agent_name}")
+        self._log(ctx, f"📝 질의: {user_query}\n")
+        self._start_plan_span(ctx, user_query)
+        ctx.emit(StepEvent("plan_started", input=user_query))
+        return ctx
 
-        # Execution Plan의 각 Step 실행
-        for step in self.skill_card.execution_plan:
-            try:
-                self._execute_step(step, ctx)
-            except Exception as e:
-                # on_error에 따라 처리
-                if step.on_error == "fail":
-                    print(f"❌ Step {step.step} 실패: {e}")
-                    ctx.add_step_result(step.step, step.action, None, str(e))
-                    raise
-                elif step.on_error == "skip":
-                    print(f"⚠️  Step {step.step} 스킵: {e}")
-                    ctx.add_step_result(step.step, step.action, None, str(e))
-                    continue
+    def _restore(
+        self, run_id: str, quiet: bool, on_event: EventListener | None
+    ) -> ExecutionContext:
+        """체크포인트에서 실행 컨텍스트 복원 및 재개 로그 출력"""
+        if self.checkpoint_store is None:
+            raise ValueError("resume()에는 checkpoint_store가 필요합니다")
 
-        print("\n✅ Execution Plan 완료!\n")
+        checkpoint = self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            raise KeyError(f"체크포인트가 없습니다: {run_id}")
+        if checkpoint.get("card_id") != self.skill_card.id:
+            raise ValueError(
+                f"다른 Skill Card의 체크포인트입니다: {checkpoint.get('card_id')}"
+            )
 
-        # 최종 결과 반환
-        return {
+        ctx = ExecutionContext.from_dict(checkpoint, quiet=quiet, on_event=on_event)
+        if self.plan_timeout_ms is not None:
+            ctx.deadline = time.monotonic() + self.plan_timeout_ms / 1000
+
+        self._log(ctx, f"\n🔁 Execution Plan 재개: {self.skill_card.agent_name}")
+        self._log(ctx, f"📝 run_id: {run_id} (완료된 Step: {sorted(ctx.completed)})\n")
+        self._start_plan_span(ctx, ctx.get("user_query"))
+        ctx.emit(StepEvent("plan_started", input=ctx.get("user_query")))
+        return ctx
+
+    def _start_plan_span(self, ctx: ExecutionContext, user_query: Any):
+        """plan span 시작 (리스너가 없으면 생략)"""
+        if self.tracer is None or not self.tracer.enabled:
+            return
+        ctx.plan_span = self.tracer.start_span(
+            "plan",
+            trace_id=ctx.run_id or uuid.uuid4().hex,
+            card_id=self.skill_card.id,
+            input_bytes=payload_size(user_query),
+        )
+
+    def _finish(self, ctx: ExecutionContext) -> dict[str, Any]:
+        """완료 로그 출력 및 최종 결과 생성"""
+        self._log(ctx, "\n✅ Execution Plan 완료!\n")
+
+        result = {
             "success": True,
+            # 버전별 지연 시간 비교(canary)용
+            "card_id": self.skill_card.id,
+            "card_version": self.skill_card.version,
             "variables": ctx.variables,
             "step_results": ctx.step_results,
+            "exited_early": ctx.exit_step is not None,
+            "exit_step": ctx.exit_step,
+        }
+        if ctx.run_id is not None:
+            result["run_id"] = ctx.run_id
+            # 끝난 실행은 재개할 필요가 없으므로 체크포인트 삭제
+            self.checkpoint_store.delete(ctx.run_id)
+        self._abandon_speculations(ctx)
+        if ctx.plan_span is not None:
+            self.tracer.end_span(ctx.plan_span, output=ctx.variables)
+        ctx.emit(
+            StepEvent("plan_finished", output=result, elapsed_ms=ctx.plan_elapsed_ms())
+        )
+        return result
+
+    def _fail(self, ctx: ExecutionContext, error: Exception):
+        """실패 체크포인트 저장 및 실행 실패 이벤트 전달"""
+        self._abandon_speculations(ctx)
+        if ctx.run_id is not None:
+            self._checkpoint(ctx, status="failed", error=str(error))
+            error.add_note(f"run_id: {ctx.run_id} (resume()으로 재개 가능)")
+        if ctx.plan_span is not None:
+            self.tracer.end_span(ctx.plan_span, status="error", error=str(error))
+        ctx.emit(
+            StepEvent("plan_failed", error=str(error), elapsed_ms=ctx.plan_elapsed_ms())
+        )
+
+    def _execute_parallel(self, ctx: ExecutionContext):
+        """
+        의존성 그래프 기반 병렬 실행
+
+        선행 Step이 모두 끝난 Step부터 Worker Pool에 제출합니다.
+        변수 치환과 결과 저장은 호출 스레드에서만 수행하므로
+        ExecutionContext에 대한 동시 쓰기는 없습니다.
+
+        Args:
+            ctx: 실행 컨텍스트
+        """
+        remaining = self._pending_steps(ctx)
+        running: dict[Future, ExecutionStep] = {}
+        failure: Exception | None = None
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="skill-card-step"
+        ) as pool:
+            while remaining or running:
+                # 1. 실행 가능한 Step 제출 (plan 순서 유지)
+                if failure is None:
+                    ready = sorted(n for n, deps in remaining.items() if not deps)
+                    for n in ready:
+                        step = self.graph.steps[n]
+                        del remaining[n]
+                        try:
+                            if not self._should_run(step, ctx):
+                                self._release(n, remaining)
+                                continue
+                            resolved_input = self._prepare_step(step, ctx)
+                            self._speculate(step, ctx)
+                        except Exception as e:
+                            failure = self._capture_step_error(step, ctx, e)
+                            self._release(n, remaining)
+                            continue
+                        future = pool.submit(
+                            self._run_action, step, resolved_input, ctx
+                        )
+                        running[future] = step
+                elif not running:
+                    break
+
+                if not running:
+                    continue
+
+                # 2. 하나라도 끝날 때까지 대기
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        self._complete_step(step, ctx, future.result())
+                    except Exception as e:
+                        failure = failure or self._capture_step_error(step, ctx, e)
+                    self._release(step.step, remaining)
+                self._drop_after_exit(ctx, remaining)
+
+        # Step 결과는 plan 순서로 정렬
+        ctx.step_results.sort(key=lambda r: r["step"])
+
+        if failure is not None:
+            raise failure
+
+    async def _aexecute_parallel(self, ctx: ExecutionContext):
+        """
+        의존성 그래프 기반 비동기 병렬 실행
+
+        _execute_parallel()과 같은 스케줄링을 asyncio Task로 수행합니다.
+        동시에 실행되는 Step 수는 max_workers로 제한합니다.
+
+        Args:
+            ctx: 실행 컨텍스트
+        """
+        remaining = self._pending_steps(ctx)
+        running: dict[asyncio.Task, ExecutionStep] = {}
+        failure: Exception | None = None
+
+        while remaining or running:
+            if failure is None:
+                ready = sorted(n for n, deps in remaining.items() if not deps)
+                # 동시 실행 수 제한: 빈 슬롯만큼만 제출
+                for n in ready[: self.max_workers - len(running)]:
+                    step = self.graph.steps[n]
+                    del remaining[n]
+                    try:
+                        if not self._should_run(step, ctx):
+                            self._release(n, remaining)
+                            continue
+                        resolved_input = self._prepare_step(step, ctx)
+                        self._aspeculate(step, ctx)
+                    except Exception as e:
+                        failure = self._capture_step_error(step, ctx, e)
+                        self._release(n, remaining)
+                        continue
+                    task = asyncio.create_task(
+                        self._arun_action(step, resolved_input, ctx)
+                    )
+                    running[task] = step
+            elif not running:
+                break
+
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = running.pop(task)
+                try:
+                    self._complete_step(step, ctx, task.result())
+                except Exception as e:
+                    failure = failure or self._capture_step_error(step, ctx, e)
+                self._release(step.step, remaining)
+            self._drop_after_exit(ctx, remaining)
+
+        ctx.step_results.sort(key=lambda r: r["step"])
+
+        if failure is not None:
+            raise failure
+
+    def _checkpoint(
+        self, ctx: ExecutionContext, status: str = "running", error: str | None = None
+    ):
+        """
+        진행 상황을 checkpoint_store에 저장
+
+        Args:
+            ctx: 실행 컨텍스트
+            status: 실행 상태 (running/failed)
+            error: 실패 메시지
+        """
+        if ctx.run_id is None:
+            return
+        checkpoint = ctx.to_dict()
+        checkpoint.update(
+            card_id=self.skill_card.id,
+            card_version=self.skill_card.version,
+            status=status,
+            error=error,
+        )
+        self.checkpoint_store.save(ctx.run_id, checkpoint)
+
+    def _pending_steps(self, ctx: ExecutionContext) -> dict[int, set[int]]:
+        """아직 끝나지 않은 Step → 끝나지 않은 선행 Step 집합"""
+        return {
+            n: deps - ctx.completed
+            for n, deps in self.graph.dependencies.items()
+            if n not in ctx.completed
         }
 
+    def _drop_after_exit(self, ctx: ExecutionContext, remaining: dict[int, set[int]]):
+        """exit_if로 종료되면 종료 Step보다 뒤에 있는 Step은 실행하지 않음"""
+        if ctx.exit_step is None:
+            return
+        exit_order = self.step_order[ctx.exit_step]
+        for n in [n for n in remaining if self.step_order[n] > exit_order]:
+            del remaining[n]
+
+    def _log(self, ctx: ExecutionContext, *args: Any):
+        """실행 로그 출력 (ctx.quiet이면 생략)"""
+        if not ctx.quiet:
+            print(*args)
+
+    def _release(self, step_number: int, remaining: dict[int, set[int]]):
+        """끝난 Step을 후속 Step들의 대기 목록에서 제거"""
+        for dependent in self.graph.dependents.get(step_number, ()):
+            if dependent in remaining:
+                remaining[dependent].discard(step_number)
+
+    def _capture_step_error(
+        self, step: ExecutionStep, ctx: ExecutionContext, error: Exception
+    ) -> Exception | None:
+        """
+        on_error 처리 후 전파할 예외 반환 (skip이면 None)
+
+        Args:
+            step: 실패한 Step
+            ctx: 실행 컨텍스트
+            error: 발생한 예외
+        """
+        try:
+            self._handle_step_error(step, ctx, error)
+        except Exception as e:
+            return e
+        return None
+
+    def _handle_step_error(
+        self, step: ExecutionStep, ctx: ExecutionContext, error: Exception
+    ):
+        """
+        on_error에 따른 에러 처리
+
+        Args:
+            step: 실패한 Step
+            ctx: 실행 컨텍스트
+            error: 발생한 예외
+
+        Raises:
+            Exception: on_error가 "fail"이거나 plan 마감 시간을 넘기면
+                원래 예외를 다시 발생
+        """
+        if step.on_error == "fail" or isinstance(error, PlanTimeoutError):
+            self._log(ctx, f"❌ Step {step.step} 실패: {error}")
+            record = ctx.add_step_result(step.step, step.action, None, str(error))
+            self._emit_step(ctx, "step_failed", record)
+            raise error
+        elif step.on_error == "skip":
+            self._log(ctx, f"⚠️  Step {step.step} 스킵: {error}")
+            record = ctx.add_step_result(step.step, step.action, None, str(error))
+            ctx.completed.add(step.step)
+            self._checkpoint(ctx)
+            self._emit_step(ctx, "step_skipped", record)
+
     def _execute_step(self, step: ExecutionStep, ctx: ExecutionContext):
         """
         단일 Step 실행
@@ -144,135 +1014,728 @@ class SkillCardExecutor:
             step: 실행할 Step
             ctx: 실행 컨텍스트
         """
-        print(f"▶ Step {step.step}: {step.action}")
+        if not self._should_run(step, ctx):
+            return
+
+        # 1. Input 변수 치환 (예측 가능한 Step이면 뒤따르는 조회 Step 추측 실행)
+        resolved_input = self._prepare_step(step, ctx)
+        self._speculate(step, ctx)
+
+        # 2. Action 실행 (추측 실행 결과가 맞으면 그대로 사용)
+        result = self._run_action(step, resolved_input, ctx)
+
+        # 3. 결과 저장 및 기록
+        self._complete_step(step, ctx, result)
+
+    async def _aexecute_step(self, step: ExecutionStep, ctx: ExecutionContext):
+        """
+        단일 Step 비동기 실행
+
+        Args:
+            step: 실행할 Step
+            ctx: 실행 컨텍스트
+        """
+        if not self._should_run(step, ctx):
+            return
+        resolved_input = self._prepare_step(step, ctx)
+        self._aspeculate(step, ctx)
+        result = await self._arun_action(step, resolved_input, ctx)
+        self._complete_step(step, ctx, result)
+
+    def _should_run(self, step: ExecutionStep, ctx: ExecutionContext) -> bool:
+        """
+        when 조건 확인 (거짓이면 Step을 건너뛴 것으로 기록)
+
+        Args:
+            step: 실행할 Step
+            ctx: 실행 컨텍스트
+
+        Returns:
+            Step 실행 여부
+        """
+        condition = self.when_conditions.get(step.step)
+        if condition is None or condition.evaluate(ctx.variables):
+            return True
+
+        self._log(ctx, f"⏭  Step {step.step} 건너뜀 (조건 불충족: {step.when})\n")
+        record = ctx.add_step_result(step.step, step.action, None, skipped=True)
+        ctx.completed.add(step.step)
+        self._checkpoint(ctx)
+        self._emit_step(ctx, "step_skipped", record)
+        return False
+
+    def _prepare_step(self, step: ExecutionStep, ctx: ExecutionContext) -> Any:
+        """
+        Step 시작: 로그 출력 및 Input 변수 치환
+
+        Args:
+            step: 실행할 Step
+            ctx: 실행 컨텍스트
+
+        Returns:
+            치환된 Input
+        """
+        ctx.started[step.step] = time.perf_counter()
+        self._log(ctx, f"▶ Step {step.step}: {step.action}")
         if self.verbose:
-            print(f"  📄 {step.description}")
+            self._log(ctx, f"  📄 {step.description}")
 
-        # 1. Input 변수 치환
-        resolved_input = self._resolve_variables(step.input, ctx)
+        resolved_input = self.templates[step.step].resolve(ctx.variables)
         if self.verbose:
-            print(f"  📥 Input: {resolved_input}")
+            self._log(ctx, f"  📥 Input: {resolved_input}")
+        if ctx.plan_span is not None:
+            ctx.step_spans[step.step] = self.tracer.start_span(
+                "step",
+                trace_id=ctx.plan_span.trace_id,
+                parent_id=ctx.plan_span.span_id,
+                card_id=self.skill_card.id,
+                step=step.step,
+                action=step.action,
+                input_bytes=payload_size(resolved_input),
+            )
+        ctx.emit(
+            StepEvent(
+                "step_started", step=step.step, action=step.action, input=resolved_input
+            )
+        )
+        return resolved_input
 
-        # 2. Action 실행
-        result = self._execute_action(step.action, resolved_input)
+    def _complete_step(self, step: ExecutionStep, ctx: ExecutionContext, result: Any):
+        """
+        Step 종료: 결과를 변수에 저장하고 실행 결과 기록
 
+        Args:
+            step: 실행한 Step
+            ctx: 실행 컨텍스트
+            result: Action 실행 결과
+        """
         if self.verbose:
-            print(f"  📤 Output: {result}")
+            self._log(ctx, f"  📤 Output: {result}")
         else:
             # 간단한 요약만 출력
             if isinstance(result, dict):
-                print(f"  ✓ 결과: {len(result)}개 필드")
+                self._log(ctx, f"  ✓ 결과: {len(result)}개 필드")
             elif isinstance(result, list):
-                print(f"  ✓ 결과: {len(result)}개 항목")
+                self._log(ctx, f"  ✓ 결과: {len(result)}개 항목")
             else:
-                print("  ✓ 완료")
+                self._log(ctx, "  ✓ 완료")
 
-        # 3. 결과를 변수에 저장
+        # 결과를 변수에 저장
         if step.output_to:
             ctx.set(step.output_to, result)
             if self.verbose:
-                print(f"  💾 저장: {step.output_to} = {result}")
+                self._log(ctx, f"  💾 저장: {step.output_to} = {result}")
+
+        # 실행 결과 기록
+        record = ctx.add_step_result(step.step, step.action, result)
+        ctx.completed.add(step.step)
+        self._checkpoint(ctx)
+        self._emit_step(ctx, "step_finished", record)
 
-        # 4. 실행 결과 기록
-        ctx.add_step_result(step.step, step.action, result)
-        print()
+        # 종료 조건 확인
+        condition = self.exit_conditions.get(step.step)
+        if condition is not None and condition.evaluate(ctx.variables):
+            ctx.exit_step = step.step
+            self._log(ctx, f"  ⏹ 종료 조건 충족: {step.exit_if} → 남은 Step 생략")
+        self._log(ctx)
 
-    def _resolve_variables(self, data: Any, ctx: ExecutionContext) -> Any:
+    def _emit_step(self, ctx: ExecutionContext, event_type: str, record: dict):
+        """Step 실행 결과 기록을 이벤트로 전달하고 Step span 종료"""
+        span = ctx.step_spans.pop(record["step"], None)
+        if span is not None:
+            self.tracer.end_span(
+                span,
+                status=_SPAN_STATUS[event_type],
+                error=record["error"],
+                output=record["result"],
+                attempts=record["attempts"],
+                cached=record["cached"],
+            )
+        if ctx.on_event is None:
+            return
+        ctx.emit(
+            StepEvent(
+                event_type,
+                step=record["step"],
+                action=record["action"],
+                output=record["result"],
+                error=record["error"],
+                elapsed_ms=record["elapsed_ms"],
+                attempts=record["attempts"],
+                cached=record["cached"],
+            )
+        )
+
+    def _run_action(
+        self, step: ExecutionStep, input_data: dict, ctx: ExecutionContext
+    ) -> Any:
+        """추측 실행 결과가 맞으면 사용하고, 아니면 Action 실행"""
+        entry = ctx.speculations.pop(step.step, None)
+        if entry is not None:
+            try:
+                confirmed = entry.input.result() == input_data
+                result = entry.result.result() if confirmed else MISSING
+            except Exception:
+                result = MISSING
+            if self._adopt_speculation(step, entry, result, ctx):
+                return result
+        return self._execute_action(step, input_data, ctx)
+
+    async def _arun_action(
+        self, step: ExecutionStep, input_data: dict, ctx: ExecutionContext
+    ) -> Any:
+        """추측 실행 결과가 맞으면 사용하고, 아니면 Action 비동기 실행"""
+        entry = ctx.speculations.pop(step.step, None)
+        if entry is not None:
+            try:
+                confirmed = await entry.input == input_data
+                result = await entry.result if confirmed else MISSING
+            except Exception:
+                result = MISSING
+            if self._adopt_speculation(step, entry, result, ctx):
+                return result
+        return await self._aexecute_action(step, input_data, ctx)
+
+    def _adopt_speculation(
+        self,
+        step: ExecutionStep,
+        entry: SpeculativeStep,
+        result: Any,
+        ctx: ExecutionContext,
+    ) -> bool:
         """
-        변수 치환: ${variable} → 실제 값
+        추측 실행 결과를 실행 컨텍스트에 반영
 
-        Args:
-            data: 치환할 데이터 (str, dict, list 등)
-            ctx: 실행 컨텍스트
+        Returns:
+            결과 사용 여부 (False면 예측이 틀렸거나 추측 실행이 실패함)
+        """
+        if result is MISSING:
+            self._log(ctx, "  ⚡ 추측 실행 결과 폐기 (예측과 실제 input이 다름)")
+            return False
+
+        self._log(ctx, "  ⚡ 추측 실행 결과 사용")
+        ctx.attempts[step.step] = entry.attempts
+        if entry.cached:
+            ctx.cached.add(step.step)
+        ctx.speculated.add(step.step)
+        return True
+
+    def _speculation_targets(
+        self, producer: ExecutionStep, ctx: ExecutionContext
+    ) -> list[ExecutionStep]:
+        """
+        producer의 결과만 기다리는 read_only Tool Step 목록 (plan 순서)
+
+        이미 끝났거나 추측 대상인 Step에만 의존하는 Step을 고릅니다.
+        """
+        assumed = ctx.completed | {producer.step}
+        targets = []
+        for step in self.skill_card.execution_plan[
+            self.step_order[producer.step] + 1 :
+        ]:
+            config = self.tool_configs.get(step.action)
+            if (
+                step.step in ctx.completed
+                or step.step in ctx.speculations
+                or config is None
+                or not config.read_only
+                or not self.graph.dependencies[step.step] <= assumed
+            ):
+                continue
+            targets.append(step)
+            assumed = assumed | {step.step}
+        return targets
+
+    def _speculative_context(
+        self, producer: ExecutionStep, ctx: ExecutionContext
+    ) -> tuple[ExecutionContext, list[ExecutionStep]] | None:
+        """
+        예측값을 넣은 추측 실행용 컨텍스트와 대상 Step 생성
 
         Returns:
-            치환된 데이터
+            (컨텍스트, 대상 Step 목록) 또는 추측 실행할 수 없으면 None
         """
-        if isinstance(data, str):
-            # "${variable}" 패턴 찾기
-            pattern = r"\$\{([^}]+)\}"
+        predictor = self.speculators.get(producer.output_to)
+        if predictor is None:
+            return None
+        targets = self._speculation_targets(producer, ctx)
+        if not targets:
+            return None
+        try:
+            predicted = predictor(ctx.variables)
+        except Exception:
+            predicted = None
+        if predicted is None:
+            return None
 
-            def replace(match):
-                var_path = match.group(1)  # "event_data.title"
-                return str(self._get_nested_value(var_path, ctx))
+        spec_ctx = ExecutionContext(
+            {**ctx.variables, producer.output_to: predicted}, quiet=True
+        )
+        spec_ctx.deadline = ctx.deadline
+        self._log(ctx, f"  ⚡ 추측 실행: Step {[s.step for s in targets]}")
+        return spec_ctx, targets
 
-            return re.sub(pattern, replace, data)
+    def _speculative_input(self, step: ExecutionStep, spec_ctx: ExecutionContext):
+        """예측값으로 input 치환 (예측값으로 채울 수 없으면 SpeculationAbandonedError)"""
+        condition = self.when_conditions.get(step.step)
+        if condition is not None and not condition.evaluate(spec_ctx.variables):
+            raise SpeculationAbandonedError(f"Step {step.step}: when 조건 불충족")
+        spec_input = self.templates[step.step].resolve(spec_ctx.variables)
+        if has_unresolved(spec_input):
+            raise SpeculationAbandonedError(f"Step {step.step}: 예측값으로 input 부족")
+        return spec_input
 
-        elif isinstance(data, dict):
-            # dict의 모든 값에 대해 재귀적으로 치환
-            return {k: self._resolve_variables(v, ctx) for k, v in data.items()}
+    def _speculate(self, producer: ExecutionStep, ctx: ExecutionContext):
+        """뒤따르는 read_only Step을 백그라운드 스레드에서 추측 실행"""
+        prepared = self._speculative_context(producer, ctx)
+        if prepared is None:
+            return
+        spec_ctx, targets = prepared
+        entries = [SpeculativeStep.threaded(step.step) for step in targets]
+        ctx.speculations.update((entry.step, entry) for entry in entries)
 
-        elif isinstance(data, list):
-            # list의 모든 요소에 대해 재귀적으로 치환
-            return [self._resolve_variables(item, ctx) for item in data]
+        def run():
+            for step, entry in zip(targets, entries, strict=True):
+                if entry.abandoned:
+                    entry.fail(SpeculationAbandonedError("실행 종료"))
+                    continue
+                try:
+                    spec_input = self._speculative_input(step, spec_ctx)
+                    entry.input.set_result(spec_input)
+                    result = self._execute_action(step, spec_input, spec_ctx)
+                except Exception as e:
+                    entry.fail(e)
+                    continue
+                self._finish_speculation(step, entry, result, spec_ctx)
 
-        else:
-            # 다른 타입은 그대로 반환
-            return data
+        threading.Thread(target=run, name="skill-card-speculation", daemon=True).start()
 
-    def _get_nested_value(self, path: str, ctx: ExecutionContext) -> Any:
+    def _aspeculate(self, producer: ExecutionStep, ctx: ExecutionContext):
+        """뒤따르는 read_only Step을 asyncio Task로 추측 실행"""
+        prepared = self._speculative_context(producer, ctx)
+        if prepared is None:
+            return
+        spec_ctx, targets = prepared
+        entries = [SpeculativeStep.in_loop(step.step) for step in targets]
+        ctx.speculations.update((entry.step, entry) for entry in entries)
+
+        async def run():
+            for step, entry in zip(targets, entries, strict=True):
+                try:
+                    spec_input = self._speculative_input(step, spec_ctx)
+                    entry.input.set_result(spec_input)
+                    result = await self._aexecute_action(step, spec_input, spec_ctx)
+                except Exception as e:
+                    entry.fail(e)
+                    continue
+                self._finish_speculation(step, entry, result, spec_ctx)
+
+        ctx.speculation_tasks.append(asyncio.create_task(run()))
+
+    def _finish_speculation(
+        self,
+        step: ExecutionStep,
+        entry: SpeculativeStep,
+        result: Any,
+        spec_ctx: ExecutionContext,
+    ):
+        """추측 실행 결과 기록 (뒤따르는 추측 Step이 사용할 수 있도록 저장)"""
+        entry.attempts = spec_ctx.attempts.get(step.step, 1)
+        entry.cached = step.step in spec_ctx.cached
+        if step.output_to:
+            spec_ctx.set(step.output_to, result)
+        entry.result.set_result(result)
+
+    def _abandon_speculations(self, ctx: ExecutionContext):
+        """실행이 끝나면 아직 시작하지 않은 추측 실행 중단"""
+        for entry in ctx.speculations.values():
+            entry.abandoned = True
+        ctx.speculations.clear()
+        for task in ctx.speculation_tasks:
+            task.cancel()
+
+    def _execute_action(
+        self, step: ExecutionStep, input_data: dict, ctx: ExecutionContext
+    ) -> Any:
         """
-        중첩된 변수 값 가져오기
+        실제 Action 실행
+
+        등록된 Tool을 호출하거나, 없으면 Mock으로 시뮬레이션합니다.
+        Tool 호출에는 타임아웃과 재시도 정책이 적용됩니다.
 
         Args:
-            path: "event_data.title" 같은 경로
-            ctx: 실행 컨텍스트
+            step: 실행할 Step
+            input_data: 입력 데이터
+            ctx: 실행 컨텍스트 (plan 마감 시간, 시도 횟수 기록)
 
         Returns:
-            해당 경로의 값
+            실행 결과
         """
-        parts = path.split(".")
-        value = ctx.get(parts[0])
+        action = step.action
 
-        # 중첩된 경로 탐색 (event_data.title)
-        for part in parts[1:]:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return f"${{{path}}}"  # 못 찾으면 원본 그대로
+        # 1. 등록된 Tool이 있으면 실제 실행
+        if action in self.tools:
+            cached = self._cache_lookup(step, input_data, ctx)
+            if cached is not MISSING:
+                return cached
+
+            # 호출 중에 무효화되면 결과를 캐시하지 않도록 세대를 먼저 읽음
+            generation = self._cache_generation(action)
+            tool = self.tools[action]
+            tool_input = self._prepare_tool_input(action, input_data, ctx)
+            max_attempts = self._max_attempts(action)
+
+            for attempt in range(1, max_attempts + 1):
+                ctx.attempts[step.step] = attempt
+                timeout = self._attempt_timeout(step, ctx)
+                try:
+                    # LangChain Tool 호출
+                    result = self._invoke(
+                        action, tool, tool_input, timeout, ctx.deadline
+                    )
+                except Exception as e:
+                    self._log(ctx, f"  ⚠️  Tool 실행 오류: {e}")
+                    if isinstance(e, StepTimeoutError):
+                        self._check_deadline(step, ctx)
+                    delay = self._retry_delay(attempt, max_attempts, e, ctx)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+
+                if self.verbose:
+                    self._log(ctx, f"  ✅ Tool 성공: {action}")
+                self._cache_store(action, input_data, result, generation)
+                return result
 
-        return value if value is not None else f"${{{path}}}"
+        # 2. Tool이 없으면 Mock 데이터로 시뮬레이션 (하위 호환성)
+        return self._mock_result(action, input_data, ctx)
 
-    def _execute_action(self, action: str, input_data: dict) -> Any:
+    async def _aexecute_action(
+        self, step: ExecutionStep, input_data: dict, ctx: ExecutionContext
+    ) -> Any:
         """
-        실제 Action 실행
+        실제 Action 비동기 실행
 
-        등록된 Tool을 호출하거나, 없으면 Mock으로 시뮬레이션합니다.
+        tool.ainvoke가 있으면 사용하고, 없으면 tool.invoke를
+        별도 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+        타임아웃이 나면 진행 중인 호출은 취소됩니다.
 
         Args:
-            action: 실행할 액션 이름
+            step: 실행할 Step
             input_data: 입력 데이터
+            ctx: 실행 컨텍스트 (plan 마감 시간, 시도 횟수 기록)
 
         Returns:
             실행 결과
         """
-        # 1. 등록된 Tool이 있으면 실제 실행
+        action = step.action
+
         if action in self.tools:
+            cached = self._cache_lookup(step, input_data, ctx)
+            if cached is not MISSING:
+                return cached
+
+            # 호출 중에 무효화되면 결과를 캐시하지 않도록 세대를 먼저 읽음
+            generation = self._cache_generation(action)
             tool = self.tools[action]
+            tool_input = self._prepare_tool_input(action, input_data, ctx)
+            max_attempts = self._max_attempts(action)
+
+            for attempt in range(1, max_attempts + 1):
+                ctx.attempts[step.step] = attempt
+                timeout = self._attempt_timeout(step, ctx)
+                try:
+                    call = self._ainvoke(action, tool, tool_input)
+                    try:
+                        result = await asyncio.wait_for(call, timeout)
+                    except TimeoutError as e:
+                        raise StepTimeoutError(
+                            f"{action}: {timeout * 1000:.0f}ms 안에 끝나지 않았습니다"
+                        ) from e
+                except Exception as e:
+                    self._log(ctx, f"  ⚠️  Tool 실행 오류: {e}")
+                    if isinstance(e, StepTimeoutError):
+                        self._check_deadline(step, ctx)
+                    delay = self._retry_delay(attempt, max_attempts, e, ctx)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
 
+                if self.verbose:
+                    self._log(ctx, f"  ✅ Tool 성공: {action}")
+                self._cache_store(action, input_data, result, generation)
+                return result
+
+        return self._mock_result(action, input_data, ctx)
+
+    def _cache_lookup(
+        self, step: ExecutionStep, input_data: dict, ctx: ExecutionContext
+    ) -> Any:
+        """
+        캐시 조회 (cache_ttl_ms가 설정된 Tool만)
+
+        Returns:
+            캐시된 결과 (없으면 MISSING)
+        """
+        config = self.tool_configs.get(step.action)
+        if self.cache is None or config is None or config.cache_ttl_ms <= 0:
+            return MISSING
+
+        result = self.cache.get(step.action, input_data)
+        if result is not MISSING:
+            ctx.cached.add(step.step)
+            ctx.attempts[step.step] = 0
             if self.verbose:
-                print(f"\n  🔧 Tool 호출: {action}")
-                print(f"  📥 Tool Input: {input_data}")
+                self._log(ctx, f"  ⚡ 캐시 적중: {step.action}")
+        return result
 
-            try:
-                # parse_event_info의 경우 verbose 파라미터 추가
-                if action == "parse_event_info" and self.verbose:
-                    input_data = {**input_data, "verbose": True}
+    def _cache_generation(self, action: str) -> tuple[int, int] | None:
+        """Tool 호출 전 무효화 세대 (캐시가 없으면 None)"""
+        return None if self.cache is None else self.cache.generation(action)
+
+    def _cache_store(
+        self,
+        action: str,
+        input_data: dict,
+        result: Any,
+        generation: tuple[int, int] | None = None,
+    ):
+        """성공한 결과 캐시 저장 및 쓰기 Tool의 invalidates 처리"""
+        config = self.tool_configs.get(action)
+        if self.cache is None or config is None:
+            return
+        if config.invalidates:
+            self.cache.invalidate(*config.invalidates)
+        if config.cache_ttl_ms > 0:
+            self.cache.set(action, input_data, result, config.cache_ttl_ms, generation)
 
-                # LangChain Tool 호출
-                result = tool.invoke(input_data)
+    def _invoke(
+        self,
+        action: str,
+        tool: Any,
+        input_data: dict,
+        timeout: float | None,
+        deadline: float | None = None,
+    ) -> Any:
+        """
+        Tool 실행 방식에 따라 tool.invoke 호출
 
-                if self.verbose:
-                    print(f"  ✅ Tool 성공: {action}")
+        deadline은 plan 마감 시각(time.monotonic() 기준)으로, Tool 풀 대기 시간의
+        상한으로 씁니다.
 
-                return result
-            except Exception as e:
-                print(f"  ⚠️  Tool 실행 오류: {e}")
-                raise
+        Raises:
+            StepTimeoutError: timeout 안에 끝나지 않은 경우 (inline 제외)
+        """
+        execution = self.tool_executions.get(action, "thread")
+        if execution == "process":
+            future = get_process_pool().submit(
+                invoke_in_process, self._process_targets[action], dump_input(input_data)
+            )
+            return self._wait_result(future, tool, timeout)
+        if execution == "inline":
+            return tool.invoke(input_data)
+        return self._invoke_with_timeout(tool, input_data, timeout, deadline)
 
-        # 2. Tool이 없으면 Mock 데이터로 시뮬레이션 (하위 호환성)
+    def _ainvoke(self, action: str, tool: Any, input_data: dict) -> Awaitable[Any]:
+        """
+        Tool 실행 방식에 따라 비동기 호출 생성
+
+        - process: 프로세스 풀 Future를 asyncio Future로 감쌈
+        - tool.ainvoke가 있으면 사용
+        - thread: tool.invoke를 별도 스레드에서 실행
+        - inline: tool.invoke를 이벤트 루프에서 바로 실행
+        """
+        execution = self.tool_executions.get(action, "thread")
+        if execution == "process":
+            return asyncio.wrap_future(
+                get_process_pool().submit(
+                    invoke_in_process,
+                    self._process_targets[action],
+                    dump_input(input_data),
+                )
+            )
+        if hasattr(tool, "ainvoke"):
+            return tool.ainvoke(input_data)
+        if execution == "inline":
+
+            async def invoke_inline():
+                return tool.invoke(input_data)
+
+            return invoke_inline()
+        return asyncio.to_thread(tool.invoke, input_data)
+
+    def _invoke_with_timeout(
+        self,
+        tool: Any,
+        input_data: dict,
+        timeout: float | None,
+        deadline: float | None = None,
+    ) -> Any:
+        """
+        tool.invoke를 timeout(초) 안에 실행
+
+        timeout은 Tool 풀에서 실제로 실행을 시작한 시점부터 잽니다. 여러 실행
+        (execute_many)이 풀을 함께 쓸 때 빈 스레드를 기다린 시간은 Step 타임아웃에
+        포함하지 않고, plan 마감 시각(deadline)까지만 기다립니다.
+
+        스레드는 강제로 멈출 수 없으므로, 타임아웃이 나면 결과를 버리고
+        호출 스레드만 먼저 반환합니다.
+
+        Raises:
+            StepTimeoutError: timeout 안에 끝나지 않았거나, 시작 전에 plan
+                마감 시각이 지난 경우
+        """
+        if timeout is None:
+            return tool.invoke(input_data)
+
+        started = threading.Event()
+
+        def run():
+            started.set()
+            return tool.invoke(input_data)
+
+        future = self._get_tool_pool().submit(run)
+        queue_wait = None if deadline is None else max(deadline - time.monotonic(), 0)
+        # 대기 중에 취소되면 시작 전 (취소 실패 = 방금 시작함)
+        if not started.wait(queue_wait) and future.cancel():
+            raise StepTimeoutError(
+                f"{getattr(tool, 'name', tool)}: Tool 풀 대기 중 plan 마감 시간 초과"
+            )
+        if deadline is not None:
+            timeout = min(timeout, max(deadline - time.monotonic(), 0))
+        return self._wait_result(future, tool, timeout)
+
+    def _wait_result(self, future: Future, tool: Any, timeout: float | None) -> Any:
+        """
+        Future 결과를 timeout(초) 안에 받기 (타임아웃이면 아직 시작 전일 때만 취소)
+
+        Raises:
+            StepTimeoutError: timeout 안에 끝나지 않은 경우
+        """
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as e:
+            future.cancel()
+            raise StepTimeoutError(
+                f"{getattr(tool, 'name', tool)}: "
+                f"{timeout * 1000:.0f}ms 안에 끝나지 않았습니다"
+            ) from e
+
+    def _get_tool_pool(self) -> ThreadPoolExecutor:
+        """Tool 호출 스레드 풀 (여러 스레드에서 동시에 불려도 하나만 생성)"""
+        if self._tool_pool is None:
+            with self._tool_pool_lock:
+                if self._tool_pool is None:
+                    self._tool_pool = ThreadPoolExecutor(
+                        max_workers=self.tool_pool_size,
+                        thread_name_prefix="skill-card-tool",
+                    )
+        return self._tool_pool
+
+    def _max_attempts(self, action: str) -> int:
+        """Tool 설정(tools[].retry)에 따른 최대 시도 횟수"""
+        config = self.tool_configs.get(action)
+        return 1 + max(config.retry, 0) if config else 1
+
+    def _attempt_timeout(
+        self, step: ExecutionStep, ctx: ExecutionContext
+    ) -> float | None:
+        """
+        이번 시도의 타임아웃 (초)
+
+        step.timeout_ms와 tools[].timeout_ms 중 작은 값을 쓰되,
+        전체 plan 마감까지 남은 시간을 넘지 않습니다.
+
+        Raises:
+            PlanTimeoutError: plan 마감 시간이 이미 지난 경우
+        """
+        self._check_deadline(step, ctx)
+        remaining = ctx.remaining_ms()
+        if not self.enforce_timeouts:
+            return remaining / 1000 if remaining is not None else None
+
+        limits = [step.timeout_ms]
+        config = self.tool_configs.get(step.action)
+        if config:
+            limits.append(config.timeout_ms)
+        if remaining is not None:
+            limits.append(remaining)
+        return min(limits) / 1000
+
+    def _check_deadline(self, step: ExecutionStep, ctx: ExecutionContext):
+        """
+        plan 마감 시간 확인
+
+        Raises:
+            PlanTimeoutError: plan 마감 시간이 이미 지난 경우
+        """
+        remaining = ctx.remaining_ms()
+        if remaining is not None and remaining <= 0:
+            raise PlanTimeoutError(
+                f"Execution Plan 마감 시간({self.plan_timeout_ms}ms) 초과: "
+                f"Step {step.step} 중단"
+            )
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        max_attempts: int,
+        error: Exception,
+        ctx: ExecutionContext,
+    ) -> float | None:
+        """
+        다음 재시도까지 대기 시간 (초), 재시도하지 않으면 None
+
+        지수 백오프 + Full Jitter: uniform(0, min(max, base * 2^(attempt-1)))
+        대기 후 plan 마감 시간을 넘기면 재시도하지 않습니다.
+        """
+        if attempt >= max_attempts or isinstance(error, PlanTimeoutError):
+            return None
+
+        ceiling = min(
+            self.retry_backoff_max_ms, self.retry_backoff_ms * 2 ** (attempt - 1)
+        )
+        delay_ms = random.uniform(0, ceiling)
+
+        remaining = ctx.remaining_ms()
+        if remaining is not None and delay_ms >= remaining:
+            return None
+        self._log(
+            ctx, f"  🔁 재시도 {attempt}/{max_attempts - 1} ({delay_ms:.0f}ms 후)"
+        )
+        return delay_ms / 1000
+
+    def _prepare_tool_input(
+        self, action: str, input_data: dict, ctx: ExecutionContext
+    ) -> dict:
+        """Tool 호출 직전 Input 보정 (verbose 로그 포함)"""
+        if self.verbose:
+            self._log(ctx, f"\n  🔧 Tool 호출: {action}")
+            self._log(ctx, f"  📥 Tool Input: {input_data}")
+
+        # parse_event_info의 경우 verbose 파라미터 추가
+        if action == "parse_event_info" and self.verbose:
+            input_data = {**input_data, "verbose": True}
+        return input_data
+
+    def _mock_result(self, action: str, input_data: dict, ctx: ExecutionContext) -> Any:
+        """
+        Tool이 등록되지 않은 Action의 Mock 결과
+
+        Args:
+            action: 실행할 액션 이름
+            input_data: 입력 데이터
+            ctx: 실행 컨텍스트
+
+        Returns:
+            Mock 실행 결과
+        """
         if self.verbose:
-            print(f"  ⚠️  Tool '{action}'이 등록되지 않았습니다. Mock 데이터 사용")
+            self._log(
+                ctx, f"  ⚠️  Tool '{action}'이 등록되지 않았습니다. Mock 데이터 사용"
+            )
         mock_results = {
             "parse_event_info": {
                 "title": "팀 회의",
@@ -0,0 +1,212 @@
+"""
+Skill Card 키워드 인덱스
+
+모든 Skill Card의 trigger 키워드를 Aho-Corasick 오토마톤 하나로 묶어
+질의를 한 번만 훑어서 매칭하는 모듈
+
+📌 목적:
+- 카드 x 키워드마다 `kw in query`를 반복하지 않음
+- 매칭 비용 = 질의 길이 + 매칭 수 (카드/키워드 수와 무관)
+- 키워드별 가중치(trigger.keyword_weights)로 카드 순위 결정
+
+💡 점수 계산:
+- score: 매칭된 (서로 다른) 키워드 가중치 합 (기본 가중치 1.0)
+- hits: 질의에서 키워드가 등장한 횟수
+- 정렬: score 내림차순 → hits 내림차순 → 카드 등록 순서
+
+💡 사용 방식:
+    index = KeywordIndex.from_cards(manager.cards.values())
+    for match in index.search("내일 회의 일정 잡아줘"):
+        print(match.card_id, match.score, match.keywords)
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from .schema import SkillCard, Trigger
+
+
+@dataclass
+class KeywordMatch:
+    """
+    카드별 키워드 매칭 결과
+
+    Attributes:
+        card_id: Skill Card ID
+        score: 매칭된 키워드 가중치 합
+        hits: 키워드 등장 횟수
+        keywords: 매칭된 키워드 (등장 순서)
+    """
+
+    card_id: str
+    score: float = 0.0
+    hits: int = 0
+    keywords: list[str] = field(default_factory=list)
+
+
+class KeywordIndex:
+    """
+    Aho-Corasick 기반 다중 키워드 인덱스
+
+    키워드는 소문자로 정규화해서 저장하고, 질의도 소문자로 바꿔 매칭합니다.
+    만들어진 뒤에는 읽기만 하므로 여러 스레드에서 동시에 search해도 안전합니다.
+    """
+
+    def __init__(self):
+        # 노드 번호 → {문자: 다음 노드}, 0번이 루트
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 노드 번호 → 이 노드에서 끝나는 키워드 번호 (fail 링크 출력 포함)
+        self._output: list[tuple[int, ...]] = [()]
+        # 키워드 번호 → 키워드, (카드 ID, 가중치) 목록
+        self._keywords: list[str] = []
+        self._owners: list[list[tuple[str, float]]] = []
+        self._keyword_ids: dict[str, int] = {}
+        # 카드 ID → 등록 순서 (동점일 때 정렬 기준)
+        self._order: dict[str, int] = {}
+        self._built = True
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[SkillCard]) -> "KeywordIndex":
+        """
+        Skill Card 목록으로 인덱스 생성
+
+        Args:
+            cards: Skill Card 목록
+
+        Returns:
+            빌드된 KeywordIndex
+        """
+        return cls.from_triggers((card.id, card.trigger) for card in cards)
+
+    @classmethod
+    def from_triggers(cls, triggers: Iterable[tuple[str, Trigger]]) -> "KeywordIndex":
+        """
+        (카드 ID, Trigger) 목록으로 인덱스 생성 (SkillCard 검증 없이 사용)
+
+        Args:
+            triggers: (Skill Card ID, Trigger) 목록
+
+        Returns:
+            빌드된 KeywordIndex
+        """
+        index = cls()
+        for card_id, trigger in triggers:
+            weights = {k.lower(): w for k, w in trigger.keyword_weights.items()}
+            for keyword in trigger.keywords:
+                index.add(keyword, card_id, weights.get(keyword.lower(), 1.0))
+        index.build()
+        return index
+
+    def __len__(self) -> int:
+        """등록된 (서로 다른) 키워드 수"""
+        return len(self._keywords)
+
+    def add(self, keyword: str, card_id: str, weight: float = 1.0):
+        """
+        키워드 등록 (등록 후 build() 호출 필요)
+
+        Args:
+            keyword: 키워드 (빈 문자열은 무시)
+            card_id: 키워드를 가진 Skill Card ID
+            weight: 키워드 가중치
+        """
+        self._order.setdefault(card_id, len(self._order))
+        keyword = keyword.lower()
+        if not keyword:
+            return
+
+        keyword_id = self._keyword_ids.get(keyword)
+        if keyword_id is None:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                node = next_node
+            keyword_id = len(self._keywords)
+            self._keyword_ids[keyword] = keyword_id
+            self._keywords.append(keyword)
+            self._owners.append([])
+            self._output[node] = (*self._output[node], keyword_id)
+
+        owners = self._owners[keyword_id]
+        if all(owner != card_id for owner, _ in owners):
+            owners.append((card_id, weight))
+        self._built = False
+
+    def build(self):
+        """fail 링크 계산 (BFS)"""
+        queue: deque[int] = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                # 접미사로 끝나는 키워드도 함께 출력
+                if self._output[self._fail[child]]:
+                    self._output[child] = (
+                        *self._output[child],
+                        *self._output[self._fail[child]],
+                    )
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """
+        질의에서 키워드 등장 위치 찾기 (질의를 한 번만 훑음)
+
+        Args:
+            text: 질의
+
+        Yields:
+            (키워드가 끝나는 위치, 키워드)
+        """
+        if not self._built:
+            raise RuntimeError("add() 뒤에 build()를 호출해야 합니다")
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for position, char in enumerate(text.lower()):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword_id in output[node]:
+                yield position, self._keywords[keyword_id]
+
+    def search(self, query: str) -> list[KeywordMatch]:
+        """
+        질의와 매칭되는 카드를 점수순으로 반환
+
+        Args:
+            query: 사용자 질의
+
+        Returns:
+            KeywordMatch 목록 (score → hits 내림차순, 동점이면 등록 순서)
+        """
+        matches: dict[str, KeywordMatch] = {}
+        for _, keyword in self.iter_matches(query):
+            for card_id, weight in self._owners[self._keyword_ids[keyword]]:
+                match = matches.get(card_id)
+                if match is None:
+                    match = matches[card_id] = KeywordMatch(card_id)
+                match.hits += 1
+                if keyword not in match.keywords:
+                    match.keywords.append(keyword)
+                    match.score += weight
+
+        return sorted(
+            matches.values(),
+            key=lambda m: (-m.score, -m.hits, self._order[m.card_id]),
+        )
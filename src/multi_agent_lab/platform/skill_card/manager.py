@@ -4,20 +4,69 @@ Skill Card Manager
 Skill Card를 로드하고 관리하는 클래스
 
 📌 목적:
-- Skill Card JSON 파일들을 로드
-- 키워드 매칭으로 적절한 Skill Card 선택
+- Skill Card JSON 파일들을 로드 (.cache 컴파일 캐시, get() 시 지연 검증)
+- 카드/인덱스를 불변 스냅샷으로 묶어 원자적으로 교체 (핫 리로드)
+- 같은 ID의 여러 버전 보관, 버전 고정 / 가중치 트래픽 분배
+- 키워드 매칭으로 적절한 Skill Card 선택 (Aho-Corasick 인덱스, 가중치 순위)
+- 예시 문장 유사도로 Skill Card 선택 (trigger.examples, similarity_threshold)
 - 유효성 검증
 
 💡 사용 방식:
     manager = SkillCardManager()
     card = manager.get("SC_SCHEDULE_001")
     matched = manager.find_by_keywords("회의 일정 잡아줘")
+    similar = manager.find_by_similarity("다음주 팀 싱크 잡아줘")
+
+💡 버전:
+    manager.get("SC_SCHEDULE_001", version="1.0.0")
+    manager.set_traffic("SC_SCHEDULE_001", {"1.0.0": 0.9, "1.1.0": 0.1})
+    card = manager.resolve("SC_SCHEDULE_001", key=user_id)
+
+💡 핫 리로드:
+    manager.refresh()                       # 바뀐 파일만 반영, 스냅샷 교체
+    SkillCardWatcher(manager).start()       # 주기적으로 refresh()
+    # get() 때 파일이 스캔 이후 바뀌었으면 refresh 후 새 스냅샷에서 다시 조회
 """
 
-import json
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import TypeVar
 
+from .keyword_index import KeywordIndex, KeywordMatch
+from .registry import CardEntry, CardRegistry, LazyCards, StaleCardError
 from .schema import SkillCard
+from .semantic import Embedder, HashingEmbedder, SemanticIndex, SemanticMatch
+from .versions import TrafficSplit, latest_version, version_key
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    Skill Card 레지스트리 스냅샷
+
+    카드 목록과 트리거 인덱스를 한 묶음으로 들고 있고, 만든 뒤에는 바뀌지
+    않습니다. refresh()는 새 스냅샷을 만든 뒤 참조만 교체하므로, 조회 중인
+    스레드는 항상 이전 또는 새 스냅샷 하나를 온전히 봅니다. 카드는 스캔한
+    내용(sha256)과 같을 때만 검증해서 반환하므로, 스냅샷이 아직 보지 못한
+    수정 내용이 섞이지 않습니다 (StaleCardError).
+
+    Attributes:
+        version: 스냅샷 번호 (교체될 때마다 1 증가)
+        files: 파일명 → CardEntry (스캔 결과, 실패/중복 파일 포함)
+        cards: Skill Card ID → SkillCard (지연 검증)
+        keyword_index: 키워드 인덱스
+        semantic_index: 예시 문장 인덱스
+    """
+
+    version: int
+    files: dict[str, CardEntry]
+    cards: LazyCards
+    keyword_index: KeywordIndex
+    semantic_index: SemanticIndex
 
 
 class SkillCardManager:
@@ -27,75 +76,231 @@ class SkillCardManager:
         self,
         cards_dir: str
         | Path = "src/multi_agent_lab/domains/personal_assistant/skill_cards",
+        embedder: Embedder | None = None,
+        verbose: bool = False,
     ):
         """
         Args:
             cards_dir: Skill Card JSON 파일들이 있는 디렉토리
+            embedder: 예시 문장 임베더 (None이면 HashingEmbedder)
+            verbose: 카드별 로드 로그 출력 여부 (실패 로그는 항상 출력)
         """
         self.cards_dir = Path(cards_dir)
-        self.cards: dict[str, SkillCard] = {}
-        self._load_all_cards()
+        self.embedder: Embedder = embedder or HashingEmbedder()
+        self.verbose = verbose
+        self.registry = CardRegistry(self.cards_dir)
+        self._snapshot = RegistrySnapshot(
+            version=0,
+            files={},
+            cards=LazyCards(self.registry, {}),
+            keyword_index=KeywordIndex(),
+            semantic_index=SemanticIndex.from_triggers([], self.embedder),
+        )
+        # Skill Card ID → 버전별 트래픽 가중치 (set_traffic이 통째로 교체)
+        self._traffic: dict[str, TrafficSplit] = {}
+        # refresh는 한 번에 하나만 (조회는 락 없이 스냅샷 참조)
+        self._refresh_lock = threading.Lock()
+        self.refresh(force=True)
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        """현재 레지스트리 스냅샷"""
+        return self._snapshot
+
+    @property
+    def cards(self) -> LazyCards:
+        """Skill Card ID → SkillCard (현재 스냅샷)"""
+        return self._snapshot.cards
+
+    @property
+    def keyword_index(self) -> KeywordIndex:
+        """키워드 인덱스 (현재 스냅샷)"""
+        return self._snapshot.keyword_index
+
+    @property
+    def semantic_index(self) -> SemanticIndex:
+        """예시 문장 인덱스 (현재 스냅샷)"""
+        return self._snapshot.semantic_index
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        바뀐 카드 파일만 다시 읽어서 새 스냅샷으로 교체
+
+        트리거/요약 정보만 캐시에서 읽고 (바뀐 파일만 다시 컴파일),
+        전체 SkillCard 검증은 get()으로 처음 조회할 때 수행합니다.
+
+        Args:
+            force: 바뀐 파일이 없어도 스냅샷을 다시 만들지 여부
+
+        Returns:
+            스냅샷을 교체했는지 여부
+        """
+        with self._refresh_lock:
+            if self.cards_dir.exists():
+                files = self.registry.scan()
+            else:
+                print(f"⚠️  Skill Cards 디렉토리가 없습니다: {self.cards_dir}")
+                self.cards_dir.mkdir(parents=True, exist_ok=True)
+                files = {}
+
+            previous = self._snapshot
+            if not force and _digests(files) == _digests(previous.files):
+                return False
+            self._snapshot = self._build_snapshot(files, previous)
+            return True
+
+    def _build_snapshot(
+        self, files: dict[str, CardEntry], previous: RegistrySnapshot
+    ) -> RegistrySnapshot:
+        """스캔 결과로 새 스냅샷 생성 (이전 스냅샷의 검증 결과/임베딩 재사용)"""
+        files = _mark_duplicates(files)
+        versions: dict[str, dict[str, CardEntry]] = {}
+        for name, entry in files.items():
+            old = previous.files.get(name)
+            # 바뀐 파일만 로그 출력 (watcher가 폴링할 때 같은 로그 반복 방지)
+            report = old is None or (old.sha256, old.error) != (
+                entry.sha256,
+                entry.error,
+            )
+            if not entry.ok:
+                if report:
+                    print(f"✗ Failed to load {entry.file}: {entry.error}")
+                continue
+            versions.setdefault(entry.id, {})[entry.summary["version"]] = entry
+            if report and self.verbose:
+                print(
+                    f"✓ Loaded: {entry.id} v{entry.summary['version']} - "
+                    f"{entry.summary['agent_name']}"
+                )
+
+        # 기본 버전 = 가장 높은 버전 (트리거 인덱스도 기본 버전 기준)
+        entries = {
+            card_id: by_version[latest_version(by_version)]
+            for card_id, by_version in versions.items()
+        }
+
+        triggers = [(card_id, e.build_trigger()) for card_id, e in entries.items()]
+        reuse = previous.semantic_index.embed_examples
+        key = getattr(self.embedder, "cache_key", None)
+
+        def embed(examples: list[str]):
+            if key is None:
+                return reuse(examples)
+            # .cache의 행렬을 mmap으로 재사용, 없으면 바뀐 예시만 임베딩
+            return self.registry.embed_examples(examples, reuse, key)
+
+        return RegistrySnapshot(
+            version=previous.version + 1,
+            files=files,
+            cards=LazyCards(
+                self.registry, entries, previous=previous.cards, versions=versions
+            ),
+            keyword_index=KeywordIndex.from_triggers(triggers),
+            semantic_index=SemanticIndex.from_triggers(
+                triggers, self.embedder, embed=embed
+            ),
+        )
+
+    def get(self, card_id: str, version: str | None = None) -> SkillCard | None:
+        """
+        Skill Card 조회 (처음 조회할 때 Pydantic 검증)
+
+        Args:
+            card_id: Skill Card ID
+            version: 버전 (None이면 가장 높은 버전)
 
-    def _load_all_cards(self):
-        """디렉토리에서 모든 Skill Card JSON 파일 로드"""
-        if not self.cards_dir.exists():
-            print(f"⚠️  Skill Cards 디렉토리가 없습니다: {self.cards_dir}")
-            self.cards_dir.mkdir(parents=True, exist_ok=True)
-            return
+        Returns:
+            SkillCard 또는 None (없거나 검증 실패)
+        """
+        return self._lookup(lambda s: _load_card(s.cards, card_id, version), None)
+
+    def versions(self, card_id: str) -> list[str]:
+        """
+        Skill Card의 버전 목록
 
-        for card_file in self.cards_dir.glob("*.json"):
-            try:
-                with open(card_file, encoding="utf-8") as f:
-                    data = json.load(f)
+        Args:
+            card_id: Skill Card ID
+
+        Returns:
+            버전 목록 (낮은 버전 → 높은 버전)
+        """
+        return sorted(self._snapshot.cards.versions.get(card_id, {}), key=version_key)
 
-                # Pydantic으로 검증
-                skill_card = SkillCard(**data)
+    def set_traffic(self, card_id: str, weights: Mapping[str, float] | None):
+        """
+        버전별 트래픽 가중치 설정 (canary 배포)
 
-                self.cards[skill_card.id] = skill_card
-                print(f"✓ Loaded: {skill_card.id} - {skill_card.agent_name}")
+        Args:
+            card_id: Skill Card ID
+            weights: 버전 → 가중치 (None이면 해제, 항상 가장 높은 버전 사용)
 
-            except Exception as e:
-                print(f"✗ Failed to load {card_file.name}: {e}")
+        Raises:
+            ValueError: 가중치가 음수이거나 합이 0인 경우
 
-    def get(self, card_id: str) -> SkillCard | None:
+        Example:
+            >>> manager.set_traffic("SC_SCHEDULE_001", {"1.0.0": 90, "1.1.0": 10})
         """
-        Skill Card 조회
+        traffic = dict(self._traffic)
+        if weights is None:
+            traffic.pop(card_id, None)
+        else:
+            traffic[card_id] = TrafficSplit(dict(weights))
+        # 조회 스레드가 락 없이 읽을 수 있도록 dict 자체를 교체
+        self._traffic = traffic
+
+    def resolve(
+        self,
+        card_id: str,
+        version: str | None = None,
+        key: str | None = None,
+    ) -> SkillCard | None:
+        """
+        요청에 사용할 Skill Card 버전 결정
+
+        우선순위: version 고정 → 트래픽 가중치 → 가장 높은 버전
 
         Args:
             card_id: Skill Card ID
+            version: 고정할 버전
+            key: 트래픽 분배 sticky 키 (예: user_id, None이면 요청마다 무작위)
 
         Returns:
             SkillCard 또는 None
         """
-        return self.cards.get(card_id)
+        return self._lookup(
+            lambda s: _resolve(s.cards, self._traffic, card_id, version, key), None
+        )
 
     def list_all(self) -> list[dict]:
         """
         모든 Skill Card 목록 조회
 
         Returns:
-            Skill Card 목록 (간략 정보)
+            Skill Card 목록 (간략 정보, version은 기본 버전)
         """
+        cards = self._snapshot.cards
         return [
             {
-                "id": card.id,
-                "name": card.agent_name,
-                "type": card.agent_type,
-                "description": card.description,
-                "version": card.version,
+                "id": card_id,
+                "name": entry.summary["agent_name"],
+                "type": entry.summary["agent_type"],
+                "description": entry.summary["description"],
+                "version": entry.summary["version"],
+                "versions": sorted(cards.versions[card_id], key=version_key),
             }
-            for card in self.cards.values()
+            for card_id, entry in cards.entries.items()
         ]
 
-    def find_by_keywords(self, query: str) -> list[SkillCard]:
+    def find_by_keywords(self, query: str, key: str | None = None) -> list[SkillCard]:
         """
         키워드 매칭으로 Skill Card 찾기
 
         Args:
             query: 사용자 질의
+            key: 트래픽 분배 sticky 키 (resolve() 참고)
 
         Returns:
-            매칭되는 Skill Card 목록
+            매칭되는 Skill Card 목록 (키워드 가중치 합 → 등장 횟수 순)
 
         Example:
             >>> manager = SkillCardManager()
@@ -103,15 +308,65 @@ class SkillCardManager:
             >>> print(cards[0].agent_name)
             '일정 관리 전문가'
         """
-        query_lower = query.lower()
-        matched = []
 
-        for card in self.cards.values():
-            # 키워드 매칭
-            if any(kw in query_lower for kw in card.trigger.keywords):
-                matched.append(card)
+        # 인덱스와 카드를 같은 스냅샷에서 조회 (중간에 교체되어도 일관됨)
+        def lookup(snapshot: RegistrySnapshot) -> list[SkillCard]:
+            matches = snapshot.keyword_index.search(query)
+            return self._resolve_all(snapshot, (m.card_id for m in matches), key)
 
-        return matched
+        return self._lookup(lookup, [])
+
+    def match_keywords(self, query: str) -> list[KeywordMatch]:
+        """
+        키워드 매칭 상세 결과 (점수, 등장 횟수, 매칭된 키워드)
+
+        Args:
+            query: 사용자 질의
+
+        Returns:
+            KeywordMatch 목록 (점수순)
+        """
+        return self.keyword_index.search(query)
+
+    def find_by_similarity(self, query: str, key: str | None = None) -> list[SkillCard]:
+        """
+        예시 문장 유사도로 Skill Card 찾기
+
+        카드별로 가장 비슷한 예시 문장과의 유사도가 그 카드의
+        trigger.similarity_threshold 이상이면 매칭됩니다.
+
+        Args:
+            query: 사용자 질의
+            key: 트래픽 분배 sticky 키 (resolve() 참고)
+
+        Returns:
+            매칭되는 Skill Card 목록 (유사도순)
+        """
+
+        def lookup(snapshot: RegistrySnapshot) -> list[SkillCard]:
+            matches = snapshot.semantic_index.search(query)
+            return self._resolve_all(snapshot, (m.card_id for m in matches), key)
+
+        return self._lookup(lookup, [])
+
+    def match_similarity(
+        self,
+        query: str,
+        threshold: float | None = None,
+        top_k: int | None = None,
+    ) -> list[SemanticMatch]:
+        """
+        예시 문장 유사도 상세 결과
+
+        Args:
+            query: 사용자 질의
+            threshold: 최소 유사도 (None이면 카드별 similarity_threshold)
+            top_k: 최대 반환 개수
+
+        Returns:
+            SemanticMatch 목록 (유사도순)
+        """
+        return self.semantic_index.search(query, threshold=threshold, top_k=top_k)
 
     def validate(self, card: SkillCard) -> tuple[bool, list[str]]:
         """
@@ -144,7 +399,102 @@ class SkillCardManager:
 
         return len(errors) == 0, errors
 
+    def _lookup(self, lookup: Callable[[RegistrySnapshot], T], default: T) -> T:
+        """
+        현재 스냅샷에서 조회 (카드 파일이 스캔 이후 바뀌었으면 refresh 후 한 번 더)
+
+        Args:
+            lookup: 스냅샷 → 조회 결과
+            default: refresh 후에도 파일이 계속 바뀌는 중이면 반환할 값
+        """
+        try:
+            return lookup(self._snapshot)
+        except StaleCardError:
+            self.refresh()
+        try:
+            return lookup(self._snapshot)
+        except StaleCardError as e:
+            print(f"✗ Failed to load: {e}")
+            return default
+
+    def _resolve_all(
+        self, snapshot: RegistrySnapshot, card_ids: Iterable[str], key: str | None
+    ) -> list[SkillCard]:
+        """ID 순서대로 버전 결정 후 조회 (검증 실패한 카드는 제외)"""
+        traffic = self._traffic
+        found = (
+            _resolve(snapshot.cards, traffic, card_id, None, key)
+            for card_id in card_ids
+        )
+        return [card for card in found if card is not None]
+
     def reload(self):
-        """Skill Card 재로드"""
-        self.cards.clear()
-        self._load_all_cards()
+        """
+        Skill Card 재로드
+
+        새 스냅샷을 만든 뒤 교체하므로 재로드 중에도 조회가 비지 않습니다.
+        """
+        self.refresh(force=True)
+
+
+def _load_card(
+    cards: LazyCards, card_id: str, version: str | None = None
+) -> SkillCard | None:
+    """
+    카드 조회 (없으면 None, 검증 실패하면 로그 출력 후 None)
+
+    Raises:
+        StaleCardError: 스캔 이후 파일이 바뀜 (호출자가 refresh 후 재조회)
+    """
+    try:
+        if version is None:
+            return cards.get(card_id)
+        return cards.load(card_id, version)
+    except KeyError:
+        return None
+    except StaleCardError:
+        raise
+    except (OSError, ValueError) as e:
+        print(f"✗ Failed to load {card_id} v{version or 'latest'}: {e}")
+        return None
+
+
+def _resolve(
+    cards: LazyCards,
+    traffic: dict[str, TrafficSplit],
+    card_id: str,
+    version: str | None,
+    key: str | None,
+) -> SkillCard | None:
+    """고정 버전 → 트래픽 가중치 → 기본 버전 순서로 카드 선택"""
+    if version is None and card_id in traffic:
+        version = traffic[card_id].choose(
+            card_id, cards.versions.get(card_id, {}), key=key
+        )
+    return _load_card(cards, card_id, version)
+
+
+def _mark_duplicates(files: dict[str, CardEntry]) -> dict[str, CardEntry]:
+    """
+    같은 (ID, 버전)을 선언한 파일을 모두 에러로 표시
+
+    파일명 순서로 한쪽을 고르면 어느 내용이 쓰일지 드러나지 않으므로,
+    중복이 풀릴 때까지 해당 버전을 제외합니다.
+    """
+    owners: dict[tuple[str, str], list[str]] = {}
+    for name, entry in files.items():
+        if entry.ok:
+            owners.setdefault((entry.id, entry.summary["version"]), []).append(name)
+
+    marked = dict(files)
+    for (card_id, version), names in owners.items():
+        if len(names) > 1:
+            error = f"중복된 Skill Card {card_id} v{version}: {', '.join(names)}"
+            for name in names:
+                marked[name] = replace(files[name], error=error)
+    return marked
+
+
+def _digests(files: dict[str, CardEntry]) -> dict[str, str]:
+    """파일명 → 내용 해시 (스냅샷 교체 필요 여부 판단용)"""
+    return {name: entry.sha256 for name, entry in files.items()}
@@ -0,0 +1,124 @@
+"""
+Execution Plan Planner
+
+Execution Plan의 Step 간 의존성 그래프(DAG)를 만드는 모듈
+
+📌 목적:
+- 각 Step의 input에 있는 ${...} 참조와 output_to를 분석
+- 서로 의존하지 않는 Step을 찾아 동시에 실행할 수 있게 함
+
+💡 의존성 규칙 (순차 실행과 결과가 같도록):
+- 읽기 → 쓰기: Step이 읽는 변수를 앞에서 마지막으로 쓴 Step
+- 쓰기 → 쓰기: 같은 output_to를 앞에서 마지막으로 쓴 Step
+- 쓰기 → 읽기: 같은 output_to를 앞에서 읽은 Step (덮어쓰기 전에 읽어야 함)
+- when / exit_if 조건이 참조하는 변수도 읽기로 취급
+- exit_if가 있는 Step 뒤의 Step은 모두 그 Step 이후에 실행 (종료 여부를 먼저 확인)
+
+💡 사용 방식:
+    graph = ExecutionGraph.from_steps(card.execution_plan)
+    graph.dependencies[3]  # {2} → Step 3은 Step 2가 끝나야 실행 가능
+"""
+
+from dataclasses import dataclass, field
+
+from .condition import compile_condition
+from .schema import ExecutionStep
+from .template import compile_template
+
+
+@dataclass
+class ExecutionGraph:
+    """
+    Execution Plan의 의존성 그래프
+
+    Attributes:
+        steps: Step 번호 → ExecutionStep
+        dependencies: Step 번호 → 먼저 끝나야 하는 Step 번호 집합
+        dependents: Step 번호 → 이 Step이 끝나길 기다리는 Step 번호 집합
+    """
+
+    steps: dict[int, ExecutionStep]
+    dependencies: dict[int, set[int]] = field(default_factory=dict)
+    dependents: dict[int, set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_steps(cls, steps: list[ExecutionStep]) -> "ExecutionGraph":
+        """
+        Step 목록에서 의존성 그래프 생성
+
+        Args:
+            steps: Execution Plan (리스트 순서 = 순차 실행 순서)
+
+        Returns:
+            ExecutionGraph
+        """
+        graph = cls(steps={s.step: s for s in steps})
+        last_writer: dict[str, int] = {}
+        readers_since_write: dict[str, set[int]] = {}
+        exit_steps: set[int] = set()
+        # Step 번호 → 직간접적으로 먼저 끝나야 하는 Step 번호 집합
+        ancestors: dict[int, set[int]] = {}
+
+        for step in steps:
+            deps: set[int] = set()
+            reads = set(compile_template(step.input).references)
+            for expression in (step.when, step.exit_if):
+                condition = compile_condition(expression)
+                if condition is not None:
+                    reads |= condition.references
+
+            for var in reads:
+                if var in last_writer:
+                    deps.add(last_writer[var])
+
+            if step.output_to:
+                if step.output_to in last_writer:
+                    deps.add(last_writer[step.output_to])
+                deps |= readers_since_write.get(step.output_to, set())
+
+            deps.discard(step.step)
+            # 이미 간접적으로 기다리는 exit_if Step은 중복해서 추가하지 않음
+            reachable = deps.union(*(ancestors[d] for d in deps))
+            barriers = exit_steps - reachable
+            deps |= barriers
+            ancestors[step.step] = reachable.union(
+                barriers, *(ancestors[b] for b in barriers)
+            )
+            graph.dependencies[step.step] = deps
+            graph.dependents.setdefault(step.step, set())
+            for dep in deps:
+                graph.dependents.setdefault(dep, set()).add(step.step)
+
+            for var in reads:
+                readers_since_write.setdefault(var, set()).add(step.step)
+            if step.output_to:
+                last_writer[step.output_to] = step.step
+                readers_since_write[step.output_to] = set()
+            if step.exit_if:
+                exit_steps.add(step.step)
+
+        return graph
+
+    def roots(self) -> list[int]:
+        """의존성이 없는 (바로 실행 가능한) Step 번호 목록"""
+        return [n for n, deps in self.dependencies.items() if not deps]
+
+    def levels(self) -> list[list[int]]:
+        """
+        동시에 실행 가능한 Step 묶음 (위상 정렬 레벨)
+
+        Returns:
+            [[1], [2, 4], [3]] 처럼 앞 레벨이 끝나면 실행 가능한 Step 목록
+        """
+        remaining = {n: set(deps) for n, deps in self.dependencies.items()}
+        result: list[list[int]] = []
+        while remaining:
+            ready = sorted(n for n, deps in remaining.items() if not deps)
+            if not ready:
+                raise ValueError("Execution Plan에 순환 의존성이 있습니다")
+            result.append(ready)
+            for n in ready:
+                del remaining[n]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return result
@@ -0,0 +1,155 @@
+"""
+Tool 실행 풀
+
+Tool의 실행 방식(inline/thread/process)과 여러 Executor가 공유하는
+프로세스 풀을 관리하는 모듈
+
+📌 실행 방식:
+- inline: 호출한 스레드에서 바로 실행 (가벼운 Tool, 타임아웃 적용 안 됨)
+- thread: Executor의 Tool 스레드 풀에서 실행 (기본값, I/O 위주 Tool)
+- process: 공유 프로세스 풀에서 실행 (CPU 위주 Tool, GIL을 점유하지 않음)
+
+💡 process Tool 전달 방식:
+- pickle 가능한 Tool은 그대로 전달
+- @tool로 만든 LangChain Tool은 pickle할 수 없으므로 "모듈 경로 + 이름"만
+  전달하고 자식 프로세스에서 import
+- input은 부모 프로세스에서 미리 pickle해서 보내므로 pickle할 수 없는
+  값이 있으면 바로 TypeError 발생
+
+💡 사용 방식:
+    configure_process_pool(max_workers=4)
+    executor.register_tool("calculate_var", calculate_var, execution="process")
+"""
+
+import importlib
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Literal
+
+ToolExecution = Literal["inline", "thread", "process"]
+TOOL_EXECUTIONS: tuple[str, ...] = ("inline", "thread", "process")
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_size: int = min(os.cpu_count() or 1, 8)
+_process_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ToolReference:
+    """
+    import 경로로 찾는 Tool (pickle할 수 없는 Tool을 프로세스로 보낼 때 사용)
+
+    Attributes:
+        module: 모듈 경로 (예: "multi_agent_lab.domains.financial.tools")
+        name: 모듈 안의 Tool 이름
+    """
+
+    module: str
+    name: str
+
+    def resolve(self) -> Any:
+        """Tool 객체 조회 (프로세스마다 한 번만 import)"""
+        return _resolve_reference(self.module, self.name)
+
+
+@cache
+def _resolve_reference(module: str, name: str) -> Any:
+    return getattr(importlib.import_module(module), name)
+
+
+def process_target(tool: Any) -> Any:
+    """
+    프로세스 풀로 보낼 Tool 표현 (Tool 자체 또는 ToolReference)
+
+    Args:
+        tool: 등록할 Tool
+
+    Raises:
+        TypeError: pickle할 수 없고 import 경로로도 찾을 수 없는 Tool
+    """
+    try:
+        pickle.dumps(tool)
+        return tool
+    except Exception:
+        pass
+
+    # @tool 데코레이터: 원래 함수의 모듈에 같은 이름으로 Tool이 있음
+    func = getattr(tool, "func", None) or getattr(tool, "coroutine", None)
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__name__", None)
+    if module and name and module != "__main__":
+        reference = ToolReference(module, name)
+        try:
+            if reference.resolve() is tool:
+                return reference
+        except (ImportError, AttributeError):
+            pass
+
+    raise TypeError(
+        f"process 실행 Tool은 pickle 가능하거나 모듈 최상위에 정의되어야 합니다: "
+        f"{getattr(tool, 'name', tool)!r}"
+    )
+
+
+def dump_input(input_data: Any) -> bytes:
+    """
+    Tool input을 프로세스로 보내기 위해 미리 pickle
+
+    Raises:
+        TypeError: pickle할 수 없는 값이 있는 경우
+    """
+    try:
+        return pickle.dumps(input_data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise TypeError(f"process Tool input을 pickle할 수 없습니다: {e}") from e
+
+
+def invoke_in_process(target: Any, payload: bytes) -> Any:
+    """자식 프로세스에서 실행되는 함수: input을 풀고 tool.invoke 호출"""
+    tool = target.resolve() if isinstance(target, ToolReference) else target
+    return tool.invoke(pickle.loads(payload))
+
+
+def configure_process_pool(max_workers: int):
+    """
+    공유 프로세스 풀 크기 설정
+
+    이미 만들어진 풀은 종료하고, 다음 호출 때 새 크기로 다시 만듭니다.
+
+    Args:
+        max_workers: 최대 프로세스 수
+    """
+    global _process_pool_size
+    if max_workers < 1:
+        raise ValueError("max_workers는 1 이상이어야 합니다")
+    with _process_pool_lock:
+        _process_pool_size = max_workers
+    shutdown_process_pool()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """공유 프로세스 풀 (처음 사용할 때 생성)"""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=_process_pool_size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _process_pool
+
+
+def shutdown_process_pool(wait: bool = True):
+    """공유 프로세스 풀 종료"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
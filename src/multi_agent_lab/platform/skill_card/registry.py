@@ -0,0 +1,323 @@
+"""
+Skill Card 레지스트리 캐시
+
+Skill Card JSON 파일의 트리거/요약 정보를 cards_dir/.cache에 컴파일해두고,
+바뀐 파일만 다시 읽는 모듈
+
+📌 목적:
+- 시작할 때 모든 카드를 json.load + Pydantic 검증하지 않음
+- 파일 mtime/size가 같으면 파일을 열지도 않음, 달라도 sha256이 같으면 재사용
+- 예시 문장 임베딩 행렬은 .npy로 저장하고 mmap으로 로드
+  (여러 워커 프로세스가 같은 페이지 캐시를 공유)
+- 전체 SkillCard 검증은 get()으로 처음 조회할 때 (LazyCards)
+- 그 사이 파일이 바뀌었으면 (sha256 불일치) StaleCardError로 알림
+  (스냅샷의 트리거와 다른 내용의 카드를 돌려주지 않음)
+
+💡 캐시 구조:
+    cards_dir/.cache/
+    ├── index.json                  # 파일명 → CardEntry (stamp, id, 요약, trigger)
+    └── examples-<digest>.npy       # 예시 문장 임베딩 행렬 (float32)
+
+💡 사용 방식:
+    registry = CardRegistry("skill_cards")
+    entries = registry.scan()           # 바뀐 파일만 다시 컴파일
+    cards = LazyCards(registry, {e.id: e for e in entries.values() if e.ok})
+    cards["SC_SCHEDULE_001"]            # 이때 SkillCard 검증
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .schema import SkillCard, Trigger
+
+CACHE_DIR_NAME = ".cache"
+# CardEntry 구조가 바뀌면 올려서 이전 캐시를 무시
+CACHE_VERSION = 1
+
+
+class StaleCardError(ValueError):
+    """카드 파일이 스냅샷을 만든 뒤 바뀜 (refresh 후 다시 조회해야 함)"""
+
+
+@dataclass(frozen=True)
+class CardEntry:
+    """
+    컴파일된 Skill Card 파일 정보
+
+    Attributes:
+        file: 파일명 (cards_dir 기준)
+        mtime_ns: 파일 수정 시각 (st_mtime_ns)
+        size: 파일 크기 (바이트)
+        sha256: 파일 내용 해시
+        id: Skill Card ID (파싱 실패 시 None)
+        summary: agent_name, agent_type, description, version
+        trigger: 검증된 Trigger dict
+        error: 파싱/트리거 검증 실패 메시지
+    """
+
+    file: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    id: str | None = None
+    summary: dict[str, str] = field(default_factory=dict)
+    trigger: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """컴파일 성공 여부"""
+        return self.error is None and self.id is not None
+
+    def build_trigger(self) -> Trigger:
+        """Trigger 객체 (컴파일할 때 검증했으므로 다시 검증하지 않음)"""
+        return Trigger.model_construct(**self.trigger)
+
+
+class CardRegistry:
+    """
+    Skill Card 파일 스캔 및 컴파일 캐시
+
+    캐시 디렉토리에 쓸 수 없으면 캐시 없이 동작합니다.
+    """
+
+    def __init__(self, cards_dir: str | Path):
+        """
+        Args:
+            cards_dir: Skill Card JSON 파일들이 있는 디렉토리
+        """
+        self.cards_dir = Path(cards_dir)
+        self.cache_dir = self.cards_dir / CACHE_DIR_NAME
+        self.index_path = self.cache_dir / "index.json"
+
+    def scan(self) -> dict[str, CardEntry]:
+        """
+        디렉토리 스캔 (바뀐 파일만 다시 컴파일)
+
+        Returns:
+            파일명 → CardEntry (파일명 순)
+        """
+        cached = self._read_index()
+        entries: dict[str, CardEntry] = {}
+        changed = False
+
+        for path in sorted(self.cards_dir.glob("*.json")):
+            stat = path.stat()
+            entry = cached.get(path.name)
+            if (
+                entry is None
+                or entry.mtime_ns != stat.st_mtime_ns
+                or entry.size != stat.st_size
+            ):
+                raw = path.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                if entry is not None and entry.sha256 == digest:
+                    # touch만 된 파일: 내용이 같으므로 stamp만 갱신
+                    entry = replace(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                else:
+                    entry = compile_entry(path.name, raw, digest, stat)
+                changed = True
+            entries[path.name] = entry
+
+        if changed or cached.keys() != entries.keys():
+            self._write_index(entries)
+        return entries
+
+    def load_card(self, entry: CardEntry) -> SkillCard:
+        """
+        Skill Card 전체 검증
+
+        Args:
+            entry: 컴파일된 파일 정보
+
+        Raises:
+            StaleCardError: 파일 내용이 entry.sha256과 다름 (스캔 이후 수정됨)
+            ValueError: 검증 실패 (pydantic.ValidationError 포함)
+        """
+        raw = (self.cards_dir / entry.file).read_bytes()
+        if hashlib.sha256(raw).hexdigest() != entry.sha256:
+            raise StaleCardError(f"{entry.file}: 스캔 이후 파일이 바뀌었습니다")
+        return SkillCard.model_validate_json(raw)
+
+    def embed_examples(
+        self, examples: list[str], embed: Callable[[list[str]], np.ndarray], key: str
+    ) -> np.ndarray:
+        """
+        예시 문장 임베딩 (같은 문장 목록 + 임베더면 .npy를 mmap으로 로드)
+
+        Args:
+            examples: 예시 문장 목록 (행 순서)
+            embed: 임베딩 함수
+            key: 임베더 설정 식별자 (Embedder.cache_key)
+
+        Returns:
+            (len(examples), dimension) float32 행렬 (읽기 전용일 수 있음)
+        """
+        # 파일명: examples-{임베더}-{예시 목록}.npy (임베더별로 따로 정리)
+        embedder = hashlib.sha256(key.encode("utf-8")).hexdigest()[:8]
+        payload = json.dumps([key, examples], ensure_ascii=False).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()[:16]
+        path = self.cache_dir / f"examples-{embedder}-{digest}.npy"
+
+        if path.exists():
+            try:
+                return np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                pass  # 깨진 캐시는 다시 계산
+
+        matrix = np.ascontiguousarray(embed(examples), dtype=np.float32)
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, path)
+            # 같은 임베더의 이전 예시 목록 행렬만 정리 (다른 임베더를 쓰는
+            # 매니저가 같은 디렉토리를 써도 서로의 캐시를 지우지 않음)
+            for old in self.cache_dir.glob(f"examples-{embedder}-*.npy"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+            # 임베더 구분이 없던 이전 형식 (examples-{16자리}.npy)
+            for old in self.cache_dir.glob("examples-" + "?" * 16 + ".npy"):
+                old.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return matrix
+
+    def _read_index(self) -> dict[str, CardEntry]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") != CACHE_VERSION:
+                return {}
+            return {name: CardEntry(**entry) for name, entry in data["files"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def _write_index(self, entries: dict[str, CardEntry]):
+        data = {
+            "version": CACHE_VERSION,
+            "files": {name: asdict(entry) for name, entry in entries.items()},
+        }
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_path = self.index_path.with_name(
+                f".index.json.{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_text(
+                json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # 읽기 전용 디렉토리: 캐시 없이 동작
+
+
+def compile_entry(
+    name: str, raw: bytes, digest: str, stat: os.stat_result
+) -> CardEntry:
+    """
+    카드 파일에서 트리거/요약 정보만 추출 (전체 SkillCard 검증은 하지 않음)
+
+    Args:
+        name: 파일명
+        raw: 파일 내용
+        digest: sha256 hex
+        stat: 파일 stat
+
+    Returns:
+        CardEntry (실패하면 error 설정)
+    """
+    entry = CardEntry(name, stat.st_mtime_ns, stat.st_size, digest)
+    try:
+        data = json.loads(raw)
+        card_id = data.get("id")
+        if not isinstance(card_id, str) or not card_id:
+            raise ValueError("id가 없습니다")
+        trigger = Trigger.model_validate(data.get("trigger", {}))
+        summary = {
+            "agent_name": str(data.get("agent_name", "")),
+            "agent_type": str(data.get("agent_type", "")),
+            "description": str(data.get("description", "")),
+            "version": str(data.get("version", "1.0.0")),
+        }
+    except Exception as e:
+        return replace(entry, error=str(e))
+    return replace(entry, id=card_id, summary=summary, trigger=trigger.model_dump())
+
+
+class LazyCards(Mapping[str, SkillCard]):
+    """
+    처음 조회할 때 검증하는 Skill Card dict
+
+    ID로 조회하면 기본 버전(가장 높은 버전)을, load(id, version)으로
+    특정 버전을 반환합니다. len()/in/순회는 캐시된 ID만 사용하므로
+    검증하지 않습니다. 검증에 실패한 카드를 조회하면 ValueError가, 스캔 이후
+    파일이 바뀌었으면 StaleCardError가 발생합니다 (검증 결과는 저장하지 않음).
+    """
+
+    def __init__(
+        self,
+        registry: CardRegistry,
+        entries: dict[str, CardEntry],
+        previous: "LazyCards | None" = None,
+        versions: dict[str, dict[str, CardEntry]] | None = None,
+    ):
+        """
+        Args:
+            registry: 카드 파일을 읽을 레지스트리
+            entries: Skill Card ID → 기본 버전 CardEntry
+            previous: 이전 스냅샷의 LazyCards (내용이 같은 카드는 검증 결과 재사용)
+            versions: Skill Card ID → 버전 → CardEntry (None이면 기본 버전만)
+        """
+        self.registry = registry
+        self.entries = entries
+        self.versions = versions or {
+            card_id: {entry.summary.get("version", ""): entry}
+            for card_id, entry in entries.items()
+        }
+        self._loaded: dict[tuple[str, str], SkillCard] = {}
+        if previous is not None:
+            for (card_id, version), card in list(previous._loaded.items()):
+                old = previous.versions.get(card_id, {}).get(version)
+                new = self.versions.get(card_id, {}).get(version)
+                if old is not None and new is not None and old.sha256 == new.sha256:
+                    self._loaded[card_id, version] = card
+
+    def __getitem__(self, card_id: str) -> SkillCard:
+        return self.load(card_id, self.entries[card_id].summary.get("version", ""))
+
+    def load(self, card_id: str, version: str) -> SkillCard:
+        """
+        특정 버전 조회 (처음 조회할 때 검증)
+
+        Raises:
+            KeyError: 없는 ID/버전
+            StaleCardError: 스캔 이후 파일이 바뀜
+            ValueError: 검증 실패
+        """
+        card = self._loaded.get((card_id, version))
+        if card is None:
+            card = self.registry.load_card(self.versions[card_id][version])
+            self._loaded[card_id, version] = card
+        return card
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self.entries
+
+    @property
+    def loaded(self) -> frozenset[str]:
+        """검증까지 끝난 카드 ID (버전 무관)"""
+        return frozenset(card_id for card_id, _ in self._loaded)
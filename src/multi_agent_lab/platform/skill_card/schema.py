@@ -26,6 +26,13 @@ class ToolConfig(BaseModel):
     required: bool = Field(False, description="필수 여부")
     timeout_ms: int = Field(3000, description="타임아웃 (밀리초)")
     retry: int = Field(0, description="재시도 횟수")
+    cache_ttl_ms: int = Field(0, description="결과 캐시 유지 시간 (0이면 캐시 안 함)")
+    invalidates: list[str] = Field(
+        default_factory=list, description="성공 시 캐시를 비울 Tool 이름 목록"
+    )
+    read_only: bool = Field(
+        False, description="부작용 없는 조회 Tool 여부 (추측 실행 가능)"
+    )
 
 
 class ExecutionStep(BaseModel):
@@ -43,6 +50,13 @@ class ExecutionStep(BaseModel):
     output_to: str = Field("", description="출력 변수명 (다음 step에서 사용)")
     timeout_ms: int = Field(3000, description="타임아웃")
     on_error: str = Field("fail", description="에러 처리 전략 (fail/skip)")
+    when: str = Field(
+        "", description="실행 조건 (예: ${event_data.date}, 거짓이면 Step 건너뜀)"
+    )
+    exit_if: str = Field(
+        "",
+        description="종료 조건 (Step 실행 후 참이면 plan 종료, 예: !${slots.best_slot})",
+    )
 
 
 class Trigger(BaseModel):
@@ -53,6 +67,10 @@ class Trigger(BaseModel):
     """
 
     keywords: list[str] = Field(default_factory=list, description="트리거 키워드")
+    keyword_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description='키워드별 가중치 (없으면 1.0, 예: {"일정": 2.0})',
+    )
     intent: str = Field("", description="의도 (intent)")
     similarity_threshold: float = Field(0.85, description="유사도 임계값")
     examples: list[str] = Field(default_factory=list, description="예시 질의")
@@ -0,0 +1,276 @@
+"""
+Skill Card 의미 기반 매칭
+
+trigger.examples 문장을 벡터로 바꿔두고, 질의와의 코사인 유사도가
+trigger.similarity_threshold 이상인 Skill Card를 찾는 모듈
+
+📌 목적:
+- 키워드가 없는 표현("다음주 화요일 팀 싱크 잡아줘")도 예시 문장으로 매칭
+- 카드 로드 시 예시 벡터를 한 번만 계산해서 연속된 NumPy 행렬에 저장
+- 질의 1개 = 임베딩 1번 + 행렬-벡터 곱 1번 (카드 수만큼 반복하지 않음)
+
+💡 임베더 교체:
+- 기본값은 HashingEmbedder (문자 n-gram 해싱, 오프라인/외부 모델 불필요)
+- embed(texts) -> (n, dimension) 행렬을 돌려주는 객체면 무엇이든 사용 가능
+  (예: sentence-transformers, Ollama 임베딩 래퍼)
+
+💡 사용 방식:
+    manager = SkillCardManager(embedder=HashingEmbedder(dimension=1024))
+    for match in manager.match_similarity("다음주 팀 싱크 잡아줘"):
+        print(match.card_id, match.score, match.example)
+"""
+
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from .schema import SkillCard, Trigger
+
+
+class Embedder(Protocol):
+    """
+    문장 임베더 인터페이스
+
+    embed()는 L2 정규화된 (len(texts), dimension) float32 행렬을 반환해야
+    합니다. 정규화되어 있으므로 내적 = 코사인 유사도입니다.
+
+    cache_key 속성(설정이 같으면 같은 문자열)이 있으면 SkillCardManager가
+    예시 임베딩 행렬을 .cache에 저장해두고 다시 사용합니다.
+    """
+
+    dimension: int
+
+    def embed(self, texts: list[str]) -> np.ndarray: ...
+
+
+class HashingEmbedder:
+    """
+    문자 n-gram 해싱 임베더
+
+    단어마다 앞뒤에 경계 문자를 붙여 n-gram을 만들고, crc32 해시로
+    고정 크기 벡터에 누적합니다. 한국어처럼 조사가 붙는 언어에서도
+    "회의를"과 "회의"가 비슷한 벡터가 됩니다.
+
+    Example:
+        >>> embedder = HashingEmbedder()
+        >>> vectors = embedder.embed(["내일 회의", "내일 회의 잡아줘"])
+        >>> float(vectors[0] @ vectors[1]) > 0.5
+        True
+    """
+
+    def __init__(self, dimension: int = 512, ngram_range: tuple[int, int] = (2, 3)):
+        """
+        Args:
+            dimension: 벡터 차원
+            ngram_range: 문자 n-gram 최소/최대 길이
+        """
+        if dimension < 1:
+            raise ValueError("dimension은 1 이상이어야 합니다")
+        self.dimension = dimension
+        self.ngram_range = ngram_range
+        self.cache_key = f"hashing:{dimension}:{ngram_range[0]}-{ngram_range[1]}"
+
+    def _features(self, text: str) -> Iterable[str]:
+        low, high = self.ngram_range
+        for word in text.lower().split():
+            padded = f"<{word}>"
+            for n in range(low, high + 1):
+                for i in range(len(padded) - n + 1):
+                    yield padded[i : i + n]
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                # crc32는 프로세스가 달라도 같은 값 (hash()는 PYTHONHASHSEED에 따라 바뀜)
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if digest & 0x8000_0000 else -1.0
+                matrix[row, digest % self.dimension] += sign
+        # 자주 나오는 n-gram의 영향을 줄이고 L2 정규화
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        return _normalize(matrix)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+@dataclass(frozen=True)
+class SemanticMatch:
+    """
+    카드별 의미 기반 매칭 결과
+
+    Attributes:
+        card_id: Skill Card ID
+        score: 가장 비슷한 예시 문장과의 코사인 유사도
+        example: 가장 비슷한 예시 문장
+    """
+
+    card_id: str
+    score: float
+    example: str
+
+
+class SemanticIndex:
+    """
+    Skill Card 예시 문장 벡터 인덱스
+
+    Attributes:
+        matrix: (예시 수, dimension) float32 C-연속 행렬 (카드별로 연속된 행)
+        owners: 행 번호 → 카드 번호 (int32, 오름차순)
+        offsets: 카드 번호 → 첫 행 번호 (카드 행 범위 = offsets[i]:offsets[i + 1])
+        card_ids: 카드 번호 → Skill Card ID
+        thresholds: 카드 번호 → similarity_threshold (float32)
+        examples: 행 번호 → 예시 문장
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        matrix: np.ndarray,
+        owners: np.ndarray,
+        card_ids: list[str],
+        thresholds: np.ndarray,
+        examples: list[str],
+    ):
+        self.embedder = embedder
+        self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        self.owners = owners
+        self.card_ids = card_ids
+        self.thresholds = thresholds
+        self.examples = examples
+        # 질의마다 owners 전체를 훑지 않도록 카드별 행 범위를 미리 계산
+        self.offsets = np.searchsorted(owners, np.arange(len(card_ids) + 1))
+
+    @classmethod
+    def from_cards(
+        cls, cards: Iterable[SkillCard], embedder: Embedder
+    ) -> "SemanticIndex":
+        """
+        Skill Card 예시 문장으로 인덱스 생성 (예시가 없는 카드는 제외)
+
+        Args:
+            cards: Skill Card 목록
+            embedder: 문장 임베더
+
+        Returns:
+            SemanticIndex
+        """
+        return cls.from_triggers(((card.id, card.trigger) for card in cards), embedder)
+
+    @classmethod
+    def from_triggers(
+        cls,
+        triggers: Iterable[tuple[str, Trigger]],
+        embedder: Embedder,
+        embed: Callable[[list[str]], np.ndarray] | None = None,
+    ) -> "SemanticIndex":
+        """
+        (카드 ID, Trigger) 목록으로 인덱스 생성
+
+        Args:
+            triggers: (Skill Card ID, Trigger) 목록
+            embedder: 질의 임베더
+            embed: 예시 문장 임베딩 함수 (None이면 embedder.embed,
+                캐시된 행렬을 쓰려면 CardRegistry.embed_examples 사용)
+
+        Returns:
+            SemanticIndex
+        """
+        card_ids: list[str] = []
+        thresholds: list[float] = []
+        examples: list[str] = []
+        owners: list[int] = []
+        for card_id, trigger in triggers:
+            texts = [e for e in trigger.examples if e.strip()]
+            if not texts:
+                continue
+            owners.extend([len(card_ids)] * len(texts))
+            card_ids.append(card_id)
+            thresholds.append(trigger.similarity_threshold)
+            examples.extend(texts)
+
+        if examples:
+            matrix = (embed or embedder.embed)(examples)
+        else:
+            matrix = np.zeros((0, embedder.dimension), dtype=np.float32)
+        return cls(
+            embedder,
+            matrix,
+            np.asarray(owners, dtype=np.int32),
+            card_ids,
+            np.asarray(thresholds, dtype=np.float32),
+            examples,
+        )
+
+    def __len__(self) -> int:
+        """인덱스에 있는 예시 문장 수"""
+        return len(self.examples)
+
+    def embed_examples(self, texts: list[str]) -> np.ndarray:
+        """
+        예시 문장 임베딩 (이 인덱스에 이미 있는 문장은 행을 재사용)
+
+        카드 하나만 바뀌었을 때 나머지 카드의 예시를 다시 임베딩하지 않도록
+        새 인덱스를 만들 때 사용합니다.
+
+        Args:
+            texts: 예시 문장 목록
+
+        Returns:
+            (len(texts), dimension) float32 행렬
+        """
+        rows = {text: row for row, text in enumerate(self.examples)}
+        missing = [t for t in dict.fromkeys(texts) if t not in rows]
+        fresh = {}
+        if missing:
+            fresh = dict(zip(missing, self.embedder.embed(missing), strict=True))
+        return np.stack(
+            [self.matrix[rows[t]] if t in rows else fresh[t] for t in texts]
+        ).astype(np.float32, copy=False)
+
+    def search(
+        self,
+        query: str,
+        threshold: float | None = None,
+        top_k: int | None = None,
+    ) -> list[SemanticMatch]:
+        """
+        질의와 비슷한 카드를 유사도순으로 반환
+
+        Args:
+            query: 사용자 질의
+            threshold: 최소 유사도 (None이면 카드별 similarity_threshold)
+            top_k: 최대 반환 개수 (None이면 전부)
+
+        Returns:
+            SemanticMatch 목록 (score 내림차순)
+        """
+        if not self.card_ids:
+            return []
+
+        vector = self.embedder.embed([query])[0]
+        scores = self.matrix @ vector
+
+        # 카드별 최고 유사도 (카드 행이 연속이므로 reduceat 한 번)
+        offsets = self.offsets
+        best = np.maximum.reduceat(scores, offsets[:-1])
+        limits = self.thresholds if threshold is None else threshold
+        selected = np.flatnonzero(best >= limits)
+        selected = selected[np.argsort(-best[selected], kind="stable")][:top_k]
+
+        matches = []
+        for card in selected:
+            start, end = offsets[card], offsets[card + 1]
+            row = start + int(np.argmax(scores[start:end]))
+            matches.append(
+                SemanticMatch(
+                    self.card_ids[card], float(best[card]), self.examples[row]
+                )
+            )
+        return matches
@@ -0,0 +1,88 @@
+"""
+Step 추측 실행 (Speculative Execution)
+
+오래 걸리는 Step(예: LLM으로 일정 파싱)이 끝나기 전에, 그 결과를 싸게
+예측해서 뒤따르는 조회 Step을 미리 실행해두는 모듈
+
+📌 동작 방식:
+1. output_to 변수에 predictor가 등록된 Step이 시작되면 값을 예측
+2. 그 변수만 기다리는 read_only Tool Step들을 예측값으로 미리 실행
+3. 실제 Step에 도달하면 실제 값으로 치환한 input과 비교
+   - 같으면: 미리 실행한 결과 사용 (조회 지연 시간이 LLM 호출 뒤로 숨음)
+   - 다르면: 버리고 평소처럼 실행
+
+💡 Skill Card 설정 (tools[]):
+    {"name": "get_calendar_events", "read_only": true}
+
+💡 사용 방식:
+    executor.register_speculator(
+        "event_data",
+        lambda variables: {"date": predict_event_date(variables["user_query"])},
+    )
+"""
+
+import asyncio
+import concurrent.futures
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# 실행 컨텍스트 변수 → 예측값 (예측할 수 없으면 None)
+Predictor = Callable[[dict[str, Any]], Any]
+
+
+class SpeculationAbandonedError(Exception):
+    """추측 실행을 하지 않음 (조건 불충족, 예측값으로 input을 채울 수 없음 등)"""
+
+
+@dataclass
+class SpeculativeStep:
+    """
+    추측 실행 중인 Step
+
+    Attributes:
+        step: Step 번호
+        input: 예측값으로 치환한 input (Future)
+        result: 실행 결과 (Future)
+        attempts: Tool 호출 시도 횟수
+        cached: 캐시에서 가져온 결과인지 여부
+        abandoned: True면 아직 시작하지 않은 경우 실행하지 않음
+    """
+
+    step: int
+    input: concurrent.futures.Future | asyncio.Future
+    result: concurrent.futures.Future | asyncio.Future
+    attempts: int = 1
+    cached: bool = False
+    abandoned: bool = field(default=False, repr=False)
+
+    @classmethod
+    def threaded(cls, step: int) -> "SpeculativeStep":
+        """스레드에서 실행할 Step (concurrent.futures.Future 사용)"""
+        return cls(step, concurrent.futures.Future(), concurrent.futures.Future())
+
+    @classmethod
+    def in_loop(cls, step: int) -> "SpeculativeStep":
+        """이벤트 루프에서 실행할 Step (asyncio.Future 사용)"""
+        loop = asyncio.get_running_loop()
+        return cls(step, loop.create_future(), loop.create_future())
+
+    def fail(self, error: Exception):
+        """아직 결과가 없는 Future에 예외 설정"""
+        for future in (self.input, self.result):
+            if not future.done():
+                future.set_exception(error)
+                # 아무도 기다리지 않아도 경고가 나지 않도록 예외를 조회해둠
+                if isinstance(future, asyncio.Future):
+                    future.exception()
+
+
+def has_unresolved(value: Any) -> bool:
+    """치환되지 않은 ${...}가 남아 있는지 여부"""
+    if isinstance(value, str):
+        return "${" in value
+    if isinstance(value, dict):
+        return any(has_unresolved(v) for v in value.values())
+    if isinstance(value, list):
+        return any(has_unresolved(v) for v in value)
+    return False
@@ -0,0 +1,183 @@
+"""
+Step Input 템플릿
+
+Step input의 ${...} 변수 치환을 미리 컴파일해두는 모듈
+
+📌 목적:
+- Skill Card 로드 시 한 번만 파싱 (요청마다 정규식/경로 split 반복 X)
+- 리터럴 조각과 변수 조각을 미리 분리
+- "${created_event}"처럼 값 전체가 변수 하나면 원본 객체를 그대로 전달
+  (dict/list를 str()로 바꾸지 않음)
+
+💡 사용 방식:
+    template = compile_template({"date": "${event_data.date}"})
+    template.references  # {"event_data"}
+    template.resolve({"event_data": {"date": "2025-11-12"}})
+    # → {"date": "2025-11-12"}
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any
+
+VARIABLE_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+# 변수를 찾지 못했을 때를 나타내는 표식 (Placeholder.lookup 반환값)
+MISSING = object()
+
+
+class Template(ABC):
+    """컴파일된 템플릿 기본 클래스"""
+
+    __slots__ = ()
+
+    #: 참조하는 루트 변수명 (예: "${event_data.date}" → "event_data")
+    references: frozenset[str] = frozenset()
+
+    @abstractmethod
+    def resolve(self, variables: dict[str, Any]) -> Any:
+        """
+        변수 값으로 치환
+
+        Args:
+            variables: 실행 컨텍스트 변수
+
+        Returns:
+            치환된 값
+        """
+
+
+class LiteralTemplate(Template):
+    """변수가 없는 값 (str, int, bool 등)"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def resolve(self, variables: dict[str, Any]) -> Any:
+        return self.value
+
+
+class Placeholder(Template):
+    """
+    값 전체가 변수 하나인 경우 ("${event_data.date}")
+
+    경로를 찾지 못하거나 값이 None이면 원본 문자열("${...}")을 반환합니다.
+    """
+
+    __slots__ = ("parts", "raw", "references")
+
+    def __init__(self, path: str):
+        self.parts: tuple[str, ...] = tuple(path.split("."))
+        self.raw = f"${{{path}}}"
+        self.references = frozenset({self.parts[0]})
+
+    def lookup(self, variables: dict[str, Any]) -> Any:
+        """경로 값 조회 (없으면 MISSING)"""
+        value = variables.get(self.parts[0])
+        for part in self.parts[1:]:
+            if not isinstance(value, dict):
+                return MISSING
+            value = value.get(part)
+        return MISSING if value is None else value
+
+    def resolve(self, variables: dict[str, Any]) -> Any:
+        value = self.lookup(variables)
+        return self.raw if value is MISSING else value
+
+
+class InterpolatedTemplate(Template):
+    """리터럴과 변수가 섞인 문자열 ("${event_data.title} 회의")"""
+
+    __slots__ = ("references", "segments")
+
+    def __init__(self, segments: list[str | Placeholder]):
+        self.segments = tuple(segments)
+        self.references = frozenset(
+            ref
+            for seg in segments
+            if isinstance(seg, Placeholder)
+            for ref in seg.references
+        )
+
+    def resolve(self, variables: dict[str, Any]) -> str:
+        return "".join(
+            seg if isinstance(seg, str) else str(seg.resolve(variables))
+            for seg in self.segments
+        )
+
+
+class DictTemplate(Template):
+    """dict 값들을 각각 치환"""
+
+    __slots__ = ("items", "references")
+
+    def __init__(self, items: dict[str, Template]):
+        self.items = tuple(items.items())
+        self.references = frozenset().union(*(t.references for t in items.values()))
+
+    def resolve(self, variables: dict[str, Any]) -> dict[str, Any]:
+        return {key: template.resolve(variables) for key, template in self.items}
+
+
+class ListTemplate(Template):
+    """list 요소들을 각각 치환"""
+
+    __slots__ = ("items", "references")
+
+    def __init__(self, items: list[Template]):
+        self.items = tuple(items)
+        self.references = frozenset().union(*(t.references for t in items))
+
+    def resolve(self, variables: dict[str, Any]) -> list[Any]:
+        return [template.resolve(variables) for template in self.items]
+
+
+def compile_template(data: Any) -> Template:
+    """
+    Step input을 템플릿으로 컴파일
+
+    Args:
+        data: 컴파일할 데이터 (str, dict, list 등)
+
+    Returns:
+        Template
+    """
+    if isinstance(data, str):
+        return compile_string(data)
+    if isinstance(data, dict):
+        return DictTemplate({k: compile_template(v) for k, v in data.items()})
+    if isinstance(data, list):
+        return ListTemplate([compile_template(item) for item in data])
+    return LiteralTemplate(data)
+
+
+def compile_string(text: str) -> Template:
+    """
+    문자열을 리터럴/변수 조각으로 분리
+
+    Args:
+        text: "${...}" 변수가 들어갈 수 있는 문자열
+
+    Returns:
+        LiteralTemplate, Placeholder(값 전체가 변수 하나) 또는 InterpolatedTemplate
+    """
+    matches = list(VARIABLE_PATTERN.finditer(text))
+    if not matches:
+        return LiteralTemplate(text)
+
+    # 값 전체가 변수 하나: 원본 객체 그대로 전달
+    if len(matches) == 1 and matches[0].span() == (0, len(text)):
+        return Placeholder(matches[0].group(1))
+
+    segments: list[str | Placeholder] = []
+    position = 0
+    for match in matches:
+        if match.start() > position:
+            segments.append(text[position : match.start()])
+        segments.append(Placeholder(match.group(1)))
+        position = match.end()
+    if position < len(text):
+        segments.append(text[position:])
+    return InterpolatedTemplate(segments)
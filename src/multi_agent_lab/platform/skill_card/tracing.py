@@ -0,0 +1,222 @@
+"""
+Skill Card 실행 트레이싱
+
+Execution Plan과 각 Step의 실행 구간(span)을 기록하는 모듈
+
+📌 목적:
+- print() 로그 대신 구조화된 타이밍 데이터 수집
+- Step별 소요 시간(monotonic), input/output 크기, 재시도 횟수 기록
+- 리스너가 없으면 span을 만들지 않으므로 비용이 거의 없음
+
+💡 Span 구조:
+    plan span (실행 1회)
+    ├── step span (Step 1)
+    ├── step span (Step 2)
+    └── ...
+
+💡 사용 방식:
+    with JsonLinesExporter("traces.jsonl") as exporter:
+        executor = SkillCardExecutor(card, tracer=Tracer([exporter]))
+        executor.execute("내일 회의", quiet=True)
+"""
+
+import json
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any, Literal
+
+SpanStatus = Literal["ok", "skipped", "error"]
+
+
+@dataclass
+class Span:
+    """
+    실행 구간
+
+    Attributes:
+        name: "plan" 또는 "step"
+        trace_id: 실행 ID (같은 실행의 span은 같은 값)
+        span_id: span ID
+        parent_id: 상위 span ID (plan span은 None)
+        card_id: Skill Card ID
+        step: Step 번호 (plan span은 None)
+        action: Action 이름 (plan span은 None)
+        start_ns: 시작 시각 (time.monotonic_ns)
+        end_ns: 종료 시각 (끝나지 않았으면 None)
+        status: 결과 (ok/skipped/error)
+        error: 에러 메시지
+        input_bytes: input의 JSON 크기 (바이트)
+        output_bytes: output의 JSON 크기 (바이트)
+        attempts: Tool 호출 시도 횟수 (캐시 적중이면 0)
+        cached: 캐시에서 가져온 결과인지 여부
+    """
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    parent_id: str | None = None
+    card_id: str | None = None
+    step: int | None = None
+    action: str | None = None
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    end_ns: int | None = None
+    status: SpanStatus = "ok"
+    error: str | None = None
+    input_bytes: int | None = None
+    output_bytes: int | None = None
+    attempts: int | None = None
+    cached: bool = False
+
+    @property
+    def duration_ms(self) -> float | None:
+        """소요 시간 (밀리초, 끝나지 않았으면 None)"""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    @property
+    def retries(self) -> int:
+        """재시도 횟수"""
+        return max((self.attempts or 0) - 1, 0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """dict로 변환 (duration_ms, retries 포함)"""
+        data = asdict(self)
+        data["duration_ms"] = self.duration_ms
+        data["retries"] = self.retries
+        return data
+
+
+class TraceListener:
+    """
+    span 리스너 기본 클래스
+
+    필요한 메서드만 오버라이드합니다. 실행 스레드에서 바로 호출되므로
+    오래 걸리는 작업은 피해야 합니다.
+    """
+
+    def on_span_start(self, span: Span):
+        """span 시작"""
+
+    def on_span_end(self, span: Span):
+        """span 종료"""
+
+
+class Tracer:
+    """
+    span 생성 및 리스너 전달
+
+    리스너가 없으면 enabled가 False이고, Executor는 span을 만들지 않습니다.
+    """
+
+    def __init__(self, listeners: list[TraceListener] | None = None):
+        """
+        Args:
+            listeners: span을 받을 리스너 목록
+        """
+        self.listeners: tuple[TraceListener, ...] = tuple(listeners or ())
+
+    @property
+    def enabled(self) -> bool:
+        """리스너가 하나라도 있는지 여부"""
+        return bool(self.listeners)
+
+    def add_listener(self, listener: TraceListener):
+        """리스너 추가"""
+        self.listeners = (*self.listeners, listener)
+
+    def start_span(self, name: str, trace_id: str, **attributes: Any) -> Span:
+        """
+        span 시작
+
+        Args:
+            name: "plan" 또는 "step"
+            trace_id: 실행 ID
+            **attributes: Span 필드 (parent_id, step, action 등)
+        """
+        span = Span(name=name, trace_id=trace_id, **attributes)
+        for listener in self.listeners:
+            listener.on_span_start(span)
+        return span
+
+    def end_span(
+        self,
+        span: Span,
+        status: SpanStatus = "ok",
+        error: str | None = None,
+        output: Any = None,
+        **attributes: Any,
+    ):
+        """
+        span 종료
+
+        Args:
+            span: 종료할 span
+            status: 결과
+            error: 에러 메시지
+            output: 결과 값 (크기만 기록)
+            **attributes: 추가로 기록할 Span 필드 (attempts, cached 등)
+        """
+        span.end_ns = time.monotonic_ns()
+        span.status = status
+        span.error = error
+        if output is not None:
+            span.output_bytes = payload_size(output)
+        for key, value in attributes.items():
+            setattr(span, key, value)
+        for listener in self.listeners:
+            listener.on_span_end(span)
+
+
+class JsonLinesExporter(TraceListener):
+    """
+    끝난 span을 JSON Lines로 기록하는 리스너
+
+    여러 스레드에서 동시에 호출해도 줄이 섞이지 않습니다.
+
+    Example:
+        >>> exporter = JsonLinesExporter("traces.jsonl")
+        >>> tracer = Tracer([exporter])
+        >>> ...
+        >>> exporter.close()
+    """
+
+    def __init__(self, target: str | Path | IO[str]):
+        """
+        Args:
+            target: 파일 경로 (이어쓰기) 또는 쓰기 가능한 텍스트 스트림
+        """
+        if isinstance(target, str | Path):
+            self._stream: IO[str] = open(target, "a", encoding="utf-8")  # noqa: SIM115
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        self._lock = threading.Lock()
+
+    def on_span_end(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self):
+        """직접 연 파일이면 닫기"""
+        if self._owns_stream:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def payload_size(value: Any) -> int:
+    """값의 JSON 크기 (바이트)"""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
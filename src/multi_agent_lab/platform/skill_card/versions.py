@@ -0,0 +1,102 @@
+"""
+Skill Card 버전 관리
+
+같은 ID의 여러 버전을 정렬하고, 버전 간 트래픽을 나누는 모듈
+
+📌 목적:
+- 새 Execution Plan을 일부 요청에만 적용 (canary)
+- 같은 사용자(key)는 항상 같은 버전으로 (sticky)
+- 결과의 card_version으로 버전별 지연 시간 비교
+
+💡 사용 방식:
+    manager.set_traffic("SC_SCHEDULE_001", {"1.0.0": 0.9, "1.1.0": 0.1})
+    card = manager.resolve("SC_SCHEDULE_001", key=user_id)   # 가중치로 선택
+    card = manager.resolve("SC_SCHEDULE_001", version="1.0.0")  # 버전 고정
+"""
+
+import hashlib
+import random
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+
+def version_key(version: str) -> tuple:
+    """
+    버전 정렬 키 ("1.10.0" > "1.9.0", "1.1.0" > "1.1.0-beta")
+
+    Args:
+        version: 버전 문자열
+
+    Returns:
+        비교 가능한 tuple
+    """
+    release, _, prerelease = version.partition("-")
+    parts = tuple(
+        (int(p), "") if p.isdigit() else (-1, p) for p in re.split(r"[.+]", release)
+    )
+    # 정식 버전이 같은 pre-release보다 높음
+    return (parts, 0 if prerelease else 1, prerelease)
+
+
+def latest_version(versions: Iterable[str]) -> str:
+    """가장 높은 버전"""
+    return max(versions, key=version_key)
+
+
+@dataclass(frozen=True)
+class TrafficSplit:
+    """
+    버전별 트래픽 가중치
+
+    Attributes:
+        weights: 버전 → 가중치 (합이 1일 필요 없음)
+    """
+
+    weights: Mapping[str, float]
+
+    def __post_init__(self):
+        if any(w < 0 for w in self.weights.values()):
+            raise ValueError("트래픽 가중치는 0 이상이어야 합니다")
+        if not sum(self.weights.values()) > 0:
+            raise ValueError("트래픽 가중치 합이 0보다 커야 합니다")
+
+    def choose(
+        self,
+        card_id: str,
+        available: Iterable[str],
+        key: str | None = None,
+    ) -> str | None:
+        """
+        가중치로 버전 선택
+
+        Args:
+            card_id: Skill Card ID (같은 key라도 카드마다 다르게 나뉘도록 사용)
+            available: 현재 레지스트리에 있는 버전
+            key: sticky 키 (예: user_id, 세션 ID). None이면 무작위
+
+        Returns:
+            선택된 버전 (가중치가 있는 버전이 하나도 없으면 None)
+        """
+        present = set(available)
+        candidates = sorted(
+            ((v, w) for v, w in self.weights.items() if v in present and w > 0),
+            key=lambda item: version_key(item[0]),
+        )
+        if not candidates:
+            return None
+
+        total = sum(w for _, w in candidates)
+        point = _bucket(card_id, key) if key is not None else random.random()
+        point *= total
+        for version, weight in candidates:
+            point -= weight
+            if point < 0:
+                return version
+        return candidates[-1][0]
+
+
+def _bucket(card_id: str, key: str) -> float:
+    """(card_id, key)를 [0, 1) 구간의 고정된 값으로 변환"""
+    digest = hashlib.sha256(f"{card_id}:{key}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
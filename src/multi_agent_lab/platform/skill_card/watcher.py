@@ -0,0 +1,113 @@
+"""
+Skill Card 파일 감시
+
+카드 디렉토리를 주기적으로 확인해서 바뀐 카드만 다시 읽고
+SkillCardManager의 스냅샷을 교체하는 모듈
+
+📌 목적:
+- 서버 재시작 없이 카드 수정 반영
+- 바뀐 파일만 다시 컴파일 (mtime/size → sha256 비교)
+- 새 스냅샷을 다 만든 뒤 참조만 교체하므로 조회가 비는 순간이 없음
+
+💡 외부 의존성 없이 폴링으로 동작합니다. 한 번 확인할 때 드는 비용은
+   카드 파일 수만큼의 stat() 호출입니다.
+
+💡 사용 방식:
+    manager = SkillCardManager()
+    with SkillCardWatcher(manager, interval=2.0):
+        serve_forever()
+
+    # 또는 변경 알림 받기
+    watcher = SkillCardWatcher(
+        manager, on_change=lambda snap: print(f"v{snap.version} 적용")
+    ).start()
+"""
+
+import threading
+from collections.abc import Callable
+
+from .manager import RegistrySnapshot, SkillCardManager
+
+
+class SkillCardWatcher:
+    """
+    카드 디렉토리 폴링 스레드
+
+    Example:
+        >>> watcher = SkillCardWatcher(manager, interval=1.0).start()
+        >>> ...  # 카드 파일 수정
+        >>> watcher.stop()
+    """
+
+    def __init__(
+        self,
+        manager: SkillCardManager,
+        interval: float = 1.0,
+        on_change: Callable[[RegistrySnapshot], None] | None = None,
+    ):
+        """
+        Args:
+            manager: 스냅샷을 교체할 SkillCardManager
+            interval: 확인 주기 (초)
+            on_change: 스냅샷이 교체될 때 호출할 함수 (새 스냅샷 전달)
+        """
+        if interval <= 0:
+            raise ValueError("interval은 0보다 커야 합니다")
+        self.manager = manager
+        self.interval = interval
+        self.on_change = on_change
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """감시 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self) -> bool:
+        """
+        한 번 확인하고 바뀐 카드가 있으면 스냅샷 교체
+
+        Returns:
+            스냅샷을 교체했는지 여부
+        """
+        changed = self.manager.refresh()
+        if changed and self.on_change is not None:
+            self.on_change(self.manager.snapshot)
+        return changed
+
+    def start(self) -> "SkillCardWatcher":
+        """감시 시작 (이미 실행 중이면 그대로)"""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="skill-card-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None):
+        """
+        감시 중지
+
+        Args:
+            timeout: 스레드 종료를 기다릴 최대 시간 (초)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # 감시 스레드는 죽지 않고 이전 스냅샷을 계속 사용
+                print(f"⚠️  Skill Card 갱신 실패: {e}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,197 @@
+"""
+PlanAnalyzer 테스트
+
+테스트 항목:
+1. 참조 검사 (unresolved_reference, unused_output)
+2. 등록되지 않은 action 검사
+3. 잘못된 조건식, 중복 Step 번호
+4. 임계 경로 비용 모델 (측정 통계 / timeout 추정)
+5. 지연 시간 허용치 (over_budget)
+"""
+
+from multi_agent_lab.platform.skill_card import (
+    PlanAnalyzer,
+    SkillCard,
+    SkillCardManager,
+)
+from multi_agent_lab.platform.skill_card.batch import LatencyHistogram
+from multi_agent_lab.platform.skill_card.schema import ExecutionStep
+
+
+def make_card(*steps: ExecutionStep) -> SkillCard:
+    return SkillCard(
+        id="SC_TEST_001",
+        agent_name="테스트 Agent",
+        agent_type="TestAgent",
+        execution_plan=list(steps),
+    )
+
+
+def codes(report) -> list[tuple[str, int | None]]:
+    return [(issue.code, issue.step) for issue in report.issues]
+
+
+def parallel_card() -> SkillCard:
+    """1 → (2, 3) → 4 구조의 카드"""
+    return make_card(
+        ExecutionStep(
+            step=1, action="parse", input={"q": "${user_query}"}, output_to="a"
+        ),
+        ExecutionStep(step=2, action="slow", input={"x": "${a}"}, output_to="b"),
+        ExecutionStep(step=3, action="fast", input={"x": "${a}"}, output_to="c"),
+        ExecutionStep(
+            step=4, action="merge", input={"b": "${b}", "c": "${c}"}, output_to="d"
+        ),
+    )
+
+
+class TestReferences:
+    """변수 참조 검사"""
+
+    def test_schedule_card_is_ok(self):
+        """schedule_card는 컨텍스트 변수를 알려주면 error 없음"""
+        card = SkillCardManager().get("SC_SCHEDULE_001")
+
+        report = PlanAnalyzer(context_variables=["user_query", "user_id"]).analyze(card)
+
+        assert report.ok
+        assert report.warnings == []
+        assert report.graph is not None
+        assert report.cost.critical_path == [1, 2, 3, 4, 5]
+
+    def test_missing_context_variable(self):
+        """컨텍스트에 없는 변수는 unresolved_reference"""
+        card = SkillCardManager().get("SC_SCHEDULE_001")
+
+        report = PlanAnalyzer().analyze(card)
+
+        assert not report.ok
+        assert {step for code, step in codes(report)} == {2, 4, 5}
+        assert all("user_id" in issue.message for issue in report.errors)
+
+    def test_forward_reference(self):
+        """뒤 Step의 output_to를 먼저 읽으면 error"""
+        card = make_card(
+            ExecutionStep(step=1, action="a", input={"x": "${later}"}, output_to="x"),
+            ExecutionStep(step=2, action="b", input={"x": "${x}"}, output_to="later"),
+        )
+
+        report = PlanAnalyzer().analyze(card)
+
+        assert codes(report) == [("unresolved_reference", 1)]
+        assert "Step 2" in report.errors[0].message
+
+    def test_condition_references(self):
+        """when은 실행 전, exit_if는 실행 후 변수를 읽음"""
+        card = make_card(
+            ExecutionStep(step=1, action="a", when="${flag}", output_to="x"),
+            ExecutionStep(step=2, action="b", exit_if="!${y}", output_to="y"),
+            ExecutionStep(step=3, action="c", input={"x": "${x}"}),
+        )
+
+        report = PlanAnalyzer().analyze(card)
+
+        assert codes(report) == [("unresolved_reference", 1)]
+
+    def test_unused_output(self):
+        """덮어쓰기 전에 아무도 읽지 않은 output_to는 warning"""
+        card = make_card(
+            ExecutionStep(step=1, action="a", output_to="x"),
+            ExecutionStep(step=2, action="b", output_to="x"),
+            ExecutionStep(step=3, action="c", input={"x": "${x}"}, output_to="y"),
+        )
+
+        report = PlanAnalyzer().analyze(card)
+
+        # 마지막 Step의 output_to(y)는 실행 결과이므로 제외
+        assert report.ok
+        assert codes(report) == [("unused_output", 1)]
+
+
+class TestPlanChecks:
+    """action, 조건식, Step 번호 검사"""
+
+    def test_unregistered_action(self):
+        """등록된 Tool이 없는 action은 error"""
+        report = PlanAnalyzer(tools={"parse": object(), "slow": object()}).analyze(
+            parallel_card()
+        )
+
+        assert codes(report) == [
+            ("unregistered_action", 3),
+            ("unregistered_action", 4),
+        ]
+
+    def test_invalid_condition(self):
+        """빈 부정 조건식은 error이고 그래프를 만들지 않음"""
+        card = make_card(ExecutionStep(step=1, action="a", when="!"))
+
+        report = PlanAnalyzer().analyze(card)
+
+        assert codes(report) == [("invalid_condition", 1)]
+        assert report.graph is None
+        assert report.cost is None
+
+    def test_duplicate_step(self):
+        """중복 Step 번호는 error"""
+        card = make_card(
+            ExecutionStep(step=1, action="a"),
+            ExecutionStep(step=1, action="b"),
+        )
+
+        report = PlanAnalyzer().analyze(card)
+
+        assert codes(report) == [("duplicate_step", 1)]
+        assert report.cost is None
+
+
+class TestCostModel:
+    """임계 경로 비용 모델"""
+
+    def test_critical_path_with_recorded_latency(self):
+        """측정값으로 임계 경로와 병목 계산"""
+        analyzer = PlanAnalyzer(
+            latency={"parse": 100, "slow": 300, "fast": 50, "merge": 20}
+        )
+
+        cost = analyzer.analyze(parallel_card()).cost
+
+        assert cost.critical_path == [1, 2, 4]
+        assert cost.critical_path_ms == 420
+        assert cost.sequential_ms == 470
+        assert cost.bottleneck.step == 2
+        assert cost.steps[3].slack_ms == 250
+        assert not cost.steps[3].critical
+        assert all(c.measured for c in cost.steps.values())
+
+    def test_histogram_and_timeout_fallback(self):
+        """LatencyHistogram 백분위수 사용, 통계가 없으면 timeout_ms로 추정"""
+        histogram = LatencyHistogram()
+        for _ in range(10):
+            histogram.record(8)
+
+        cost = (
+            PlanAnalyzer(latency={"parse": histogram, "fast": LatencyHistogram()})
+            .analyze(parallel_card())
+            .cost
+        )
+
+        assert cost.steps[1].measured
+        assert cost.steps[1].latency_ms == histogram.percentile(0.5)
+        # 기록이 없는 히스토그램과 통계 없는 action은 timeout_ms(기본 3000)
+        assert not cost.steps[3].measured
+        assert cost.steps[3].latency_ms == 3000
+
+    def test_over_budget(self):
+        """예상 지연 시간이 허용치를 넘으면 error"""
+        analyzer = PlanAnalyzer(
+            latency={"parse": 100, "slow": 300, "fast": 50, "merge": 20},
+            latency_budget_ms=400,
+        )
+
+        report = analyzer.analyze(parallel_card())
+
+        assert codes(report) == [("over_budget", None)]
+        assert "병목: Step 2" in report.summary()
+        assert report.to_dict()["cost"]["bottleneck"] == 2
+        assert report.to_dict()["levels"] == [[1], [2, 3], [4]]
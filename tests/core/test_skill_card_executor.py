@@ -0,0 +1,1465 @@
+"""
+SkillCardExecutor 테스트
+
+테스트 항목:
+1. 의존성 그래프(DAG) 생성
+2. 순차 실행 / 병렬 실행 결과 비교
+3. on_error(fail/skip) 처리
+4. 비동기 실행 (aexecute)
+5. 타임아웃 / 재시도 / plan 마감 시간
+6. Input 템플릿 컴파일 및 변수 치환
+7. 배치 실행 (execute_many)
+8. Step 결과 캐시
+9. 실행 이벤트 스트리밍
+10. 체크포인트 / 재개 (resume)
+11. 트레이싱 (Tracer / JsonLinesExporter)
+12. 조건 실행 (when / exit_if)
+13. 추측 실행 (register_speculator)
+14. Tool 실행 방식 (inline / thread / process)
+"""
+
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+
+import pytest
+from langchain_core.tools import tool as langchain_tool
+
+from multi_agent_lab.platform.skill_card import (
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    JsonLinesExporter,
+    PlanTimeoutError,
+    RedisCheckpointStore,
+    SkillCard,
+    SkillCardExecutor,
+    StepCache,
+    StepEvent,
+    StepTimeoutError,
+    TraceListener,
+    Tracer,
+    shutdown_process_pool,
+)
+from multi_agent_lab.platform.skill_card.condition import compile_condition
+from multi_agent_lab.platform.skill_card.planner import ExecutionGraph
+from multi_agent_lab.platform.skill_card.schema import ExecutionStep, ToolConfig
+from multi_agent_lab.platform.skill_card.template import (
+    LiteralTemplate,
+    Placeholder,
+    compile_template,
+)
+
+
+class FakeTool:
+    """tool.invoke(input)만 흉내내는 테스트용 Tool"""
+
+    def __init__(self, result=None, delay: float = 0.0, error: Exception | None = None):
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.calls: list[dict] = []
+        self.threads: set[str] = set()
+
+    def invoke(self, input_data: dict):
+        self.calls.append(input_data)
+        self.threads.add(threading.current_thread().name)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result if self.result is not None else {"echo": input_data}
+
+
+class AsyncFakeTool(FakeTool):
+    """tool.ainvoke(input)까지 제공하는 테스트용 Tool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.async_calls = 0
+
+    async def ainvoke(self, input_data: dict):
+        self.async_calls += 1
+        self.calls.append(input_data)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result if self.result is not None else {"echo": input_data}
+
+
+class FlakyTool(FakeTool):
+    """처음 failures번은 실패하고 이후 성공하는 Tool"""
+
+    def __init__(self, failures: int, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+
+    def invoke(self, input_data: dict):
+        self.calls.append(input_data)
+        if len(self.calls) <= self.failures:
+            raise ConnectionError(f"fail #{len(self.calls)}")
+        return {"ok": True}
+
+
+def make_card(
+    steps: list[ExecutionStep], tools: list[ToolConfig] | None = None
+) -> SkillCard:
+    return SkillCard(
+        id="SC_TEST_EXEC",
+        agent_name="테스트 Agent",
+        agent_type="TestAgent",
+        execution_plan=steps,
+        tools=tools or [],
+    )
+
+
+def _without_timing(result: dict) -> list[dict]:
+    """elapsed_ms를 제외한 step_results"""
+    return [
+        {k: v for k, v in r.items() if k != "elapsed_ms"}
+        for r in result["step_results"]
+    ]
+
+
+@pytest.fixture
+def diamond_card() -> SkillCard:
+    """1 → (2, 3) → 4 형태의 Execution Plan"""
+    return make_card(
+        [
+            ExecutionStep(
+                step=1, action="parse", input={"q": "${user_query}"}, output_to="a"
+            ),
+            ExecutionStep(
+                step=2, action="left", input={"x": "${a.echo.q}"}, output_to="b"
+            ),
+            ExecutionStep(
+                step=3, action="right", input={"x": "${a.echo.q}"}, output_to="c"
+            ),
+            ExecutionStep(
+                step=4,
+                action="join",
+                input={"b": "${b.echo.x}", "c": "${c.echo.x}"},
+                output_to="d",
+            ),
+        ]
+    )
+
+
+class TestExecutionGraph:
+    """의존성 그래프 생성 테스트"""
+
+    def test_diamond_dependencies(self, diamond_card):
+        graph = ExecutionGraph.from_steps(diamond_card.execution_plan)
+
+        assert graph.dependencies == {1: set(), 2: {1}, 3: {1}, 4: {2, 3}}
+        assert graph.levels() == [[1], [2, 3], [4]]
+
+    def test_schedule_card_dependencies(self):
+        from multi_agent_lab.platform.skill_card import SkillCardManager
+
+        card = SkillCardManager().get("SC_SCHEDULE_001")
+        graph = ExecutionGraph.from_steps(card.execution_plan)
+
+        # get_calendar_events는 parse 결과만 필요, find_free_time은 둘 다 필요
+        assert graph.dependencies[2] == {1}
+        assert graph.dependencies[3] == {1, 2}
+        assert graph.dependencies[5] == {4}
+
+    def test_overwrite_waits_for_readers(self):
+        steps = [
+            ExecutionStep(step=1, action="a", output_to="x"),
+            ExecutionStep(step=2, action="b", input={"v": "${x}"}, output_to="y"),
+            ExecutionStep(step=3, action="c", output_to="x"),
+        ]
+        graph = ExecutionGraph.from_steps(steps)
+
+        # Step 3은 x를 덮어쓰므로 x를 읽는 Step 2 이후에 실행
+        assert graph.dependencies[3] == {1, 2}
+
+
+class TestParallelExecution:
+    """병렬 실행 테스트"""
+
+    def _register(self, executor, delay=0.0):
+        tools = {
+            name: FakeTool(delay=delay) for name in ["parse", "left", "right", "join"]
+        }
+        for name, tool in tools.items():
+            executor.register_tool(name, tool)
+        return tools
+
+    def test_parallel_matches_sequential(self, diamond_card):
+        sequential = SkillCardExecutor(diamond_card)
+        self._register(sequential)
+        parallel = SkillCardExecutor(diamond_card, parallel=True)
+        self._register(parallel)
+
+        seq_result = sequential.execute("hello")
+        par_result = parallel.execute("hello")
+
+        assert par_result["variables"] == seq_result["variables"]
+        assert [r["step"] for r in par_result["step_results"]] == [1, 2, 3, 4]
+        assert par_result["variables"]["d"] == {"echo": {"b": "hello", "c": "hello"}}
+        # 버전별 지연 시간 비교를 위해 카드 버전을 결과에 포함
+        assert par_result["card_id"] == "SC_TEST_EXEC"
+        assert par_result["card_version"] == diamond_card.version
+
+    def test_independent_steps_overlap(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, parallel=True, max_workers=2)
+        tools = self._register(executor, delay=0.2)
+
+        start = time.perf_counter()
+        executor.execute("hello")
+        elapsed = time.perf_counter() - start
+
+        # 순차 실행이면 0.8초, Step 2와 3이 겹치면 약 0.6초
+        assert elapsed < 0.75
+        assert tools["left"].threads != tools["right"].threads
+
+    def test_parallel_fail_stops_dependents(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, parallel=True)
+        tools = self._register(executor)
+        executor.register_tool("left", FakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            executor.execute("hello")
+
+        assert tools["join"].calls == []
+
+    def test_parallel_skip_continues(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="flaky", output_to="a", on_error="skip"),
+                ExecutionStep(step=2, action="after", input={"v": "${a}"}),
+            ]
+        )
+        executor = SkillCardExecutor(card, parallel=True)
+        executor.register_tool("flaky", FakeTool(error=RuntimeError("boom")))
+        after = FakeTool()
+        executor.register_tool("after", after)
+
+        result = executor.execute("hello")
+
+        assert result["step_results"][0]["error"] == "boom"
+        assert after.calls == [{"v": "${a}"}]
+
+    def test_invalid_max_workers(self, diamond_card):
+        with pytest.raises(ValueError):
+            SkillCardExecutor(diamond_card, max_workers=0)
+
+
+class TestAsyncExecution:
+    """aexecute 테스트"""
+
+    def _register(self, executor, delay=0.0):
+        tools = {
+            name: AsyncFakeTool(delay=delay)
+            for name in ["parse", "left", "right", "join"]
+        }
+        for name, tool in tools.items():
+            executor.register_tool(name, tool)
+        return tools
+
+    @pytest.mark.asyncio
+    async def test_aexecute_matches_execute(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card)
+        tools = self._register(executor)
+
+        sync_result = executor.execute("hello")
+        async_result = await executor.aexecute("hello")
+
+        assert async_result["variables"] == sync_result["variables"]
+        assert _without_timing(async_result) == _without_timing(sync_result)
+        assert tools["join"].async_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_aexecute_falls_back_to_invoke(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card)
+        for name in ["parse", "left", "right", "join"]:
+            executor.register_tool(name, FakeTool())
+
+        result = await executor.aexecute("hello")
+
+        assert result["variables"]["d"] == {"echo": {"b": "hello", "c": "hello"}}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_loop(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, parallel=True)
+        self._register(executor, delay=0.1)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(executor.aexecute(f"q{i}") for i in range(20)))
+        elapsed = time.perf_counter() - start
+
+        # 20개 실행이 하나의 루프에서 겹쳐서 진행됨 (순차면 6초 이상)
+        assert elapsed < 1.0
+        assert [r["variables"]["user_query"] for r in results] == [
+            f"q{i}" for i in range(20)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aexecute_fail(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, parallel=True)
+        tools = self._register(executor)
+        executor.register_tool("right", AsyncFakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await executor.aexecute("hello")
+
+        assert tools["join"].calls == []
+
+
+class TestTimeoutAndRetry:
+    """timeout_ms / tools[].retry / plan_timeout_ms 테스트"""
+
+    def test_step_timeout(self):
+        card = make_card([ExecutionStep(step=1, action="slow", timeout_ms=50)])
+        with SkillCardExecutor(card) as executor:
+            executor.register_tool("slow", FakeTool(delay=1.0))
+
+            start = time.perf_counter()
+            with pytest.raises(StepTimeoutError):
+                executor.execute("hello")
+
+        assert time.perf_counter() - start < 0.5
+
+    def test_tool_config_timeout_is_tighter(self):
+        card = make_card(
+            [ExecutionStep(step=1, action="slow", timeout_ms=5000, on_error="skip")],
+            tools=[ToolConfig(name="slow", timeout_ms=50)],
+        )
+        with SkillCardExecutor(card) as executor:
+            executor.register_tool("slow", FakeTool(delay=1.0))
+            result = executor.execute("hello")
+
+        assert "50ms" in result["step_results"][0]["error"]
+
+    def test_retry_until_success(self):
+        card = make_card(
+            [ExecutionStep(step=1, action="flaky", output_to="r")],
+            tools=[ToolConfig(name="flaky", retry=2)],
+        )
+        executor = SkillCardExecutor(card, retry_backoff_ms=1)
+        tool = FlakyTool(failures=2)
+        executor.register_tool("flaky", tool)
+
+        result = executor.execute("hello")
+
+        assert result["variables"]["r"] == {"ok": True}
+        assert result["step_results"][0]["attempts"] == 3
+        assert len(tool.calls) == 3
+
+    def test_retry_exhausted(self):
+        card = make_card(
+            [ExecutionStep(step=1, action="flaky")],
+            tools=[ToolConfig(name="flaky", retry=1)],
+        )
+        executor = SkillCardExecutor(card, retry_backoff_ms=1)
+        executor.register_tool("flaky", FlakyTool(failures=5))
+
+        with pytest.raises(ConnectionError, match="fail #2"):
+            executor.execute("hello")
+
+    def test_plan_deadline_shrinks_later_steps(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="a", timeout_ms=1000),
+                ExecutionStep(step=2, action="b", timeout_ms=1000, on_error="skip"),
+            ]
+        )
+        with SkillCardExecutor(card, plan_timeout_ms=300) as executor:
+            executor.register_tool("a", FakeTool(delay=0.2))
+            executor.register_tool("b", FakeTool(delay=1.0))
+
+            start = time.perf_counter()
+            with pytest.raises(PlanTimeoutError):
+                executor.execute("hello")
+
+        # Step 2는 1000ms가 아니라 남은 약 100ms만 기다림
+        assert time.perf_counter() - start < 0.6
+
+    def test_plan_deadline_overrides_skip(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="a"),
+                ExecutionStep(step=2, action="b", on_error="skip"),
+            ]
+        )
+        executor = SkillCardExecutor(card, plan_timeout_ms=50, enforce_timeouts=False)
+        executor.register_tool("a", FakeTool(delay=0.1))
+        executor.register_tool("b", FakeTool())
+
+        with pytest.raises(PlanTimeoutError):
+            executor.execute("hello")
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_cancels(self):
+        card = make_card([ExecutionStep(step=1, action="slow", timeout_ms=50)])
+        executor = SkillCardExecutor(card)
+        tool = AsyncFakeTool(delay=1.0)
+        executor.register_tool("slow", tool)
+
+        start = time.perf_counter()
+        with pytest.raises(StepTimeoutError):
+            await executor.aexecute("hello")
+
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_async_retry(self):
+        card = make_card(
+            [ExecutionStep(step=1, action="flaky", output_to="r")],
+            tools=[ToolConfig(name="flaky", retry=1)],
+        )
+        executor = SkillCardExecutor(card, retry_backoff_ms=1)
+        executor.register_tool("flaky", FlakyTool(failures=1))
+
+        result = await executor.aexecute("hello")
+
+        assert result["step_results"][0]["attempts"] == 2
+
+
+VARIABLES = {
+    "user_id": "u1",
+    "event_data": {"title": "팀 회의", "date": "2025-11-12", "duration": 60},
+    "created_event": {"id": "EVT001", "title": "팀 회의"},
+}
+
+
+class TestTemplate:
+    """compile_template 테스트"""
+
+    def test_whole_value_passes_object(self):
+        template = compile_template("${created_event}")
+
+        assert isinstance(template, Placeholder)
+        assert template.resolve(VARIABLES) is VARIABLES["created_event"]
+
+    def test_whole_value_keeps_type(self):
+        assert compile_template("${event_data.duration}").resolve(VARIABLES) == 60
+
+    def test_interpolation(self):
+        template = compile_template("${event_data.title} (${event_data.duration}분)")
+
+        assert template.resolve(VARIABLES) == "팀 회의 (60분)"
+
+    def test_missing_path_keeps_placeholder(self):
+        template = compile_template({"a": "${event_data.nope}", "b": "${unknown.x}"})
+
+        assert template.resolve(VARIABLES) == {
+            "a": "${event_data.nope}",
+            "b": "${unknown.x}",
+        }
+
+    def test_nested_structure_and_references(self):
+        template = compile_template(
+            {
+                "date": "${event_data.date}",
+                "hours": {"start": "09:00", "end": "18:00"},
+                "ids": ["${user_id}", 3],
+            }
+        )
+
+        assert template.references == {"event_data", "user_id"}
+        assert template.resolve(VARIABLES) == {
+            "date": "2025-11-12",
+            "hours": {"start": "09:00", "end": "18:00"},
+            "ids": ["u1", 3],
+        }
+
+    def test_literal(self):
+        assert isinstance(compile_template("plain"), LiteralTemplate)
+        assert compile_template(5).resolve({}) == 5
+
+    def test_executor_passes_dict_to_tool(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="create", output_to="created_event"),
+                ExecutionStep(
+                    step=2, action="notify", input={"event": "${created_event}"}
+                ),
+            ]
+        )
+        executor = SkillCardExecutor(card)
+        executor.register_tool("create", FakeTool(result={"id": "EVT001"}))
+        notify = FakeTool()
+        executor.register_tool("notify", notify)
+
+        executor.execute("hello")
+
+        assert notify.calls == [{"event": {"id": "EVT001"}}]
+
+
+class ConcurrencyProbe(FakeTool):
+    """동시에 실행 중인 호출 수의 최대값을 기록하는 Tool"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def invoke(self, input_data: dict):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return super().invoke(input_data)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestBatchExecution:
+    """execute_many 테스트"""
+
+    def _executor(self, probe_delay=0.0):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="probe", input={"q": "${user_query}"}),
+                ExecutionStep(step=2, action="echo", input={"u": "${user_id}"}),
+            ]
+        )
+        executor = SkillCardExecutor(card)
+        probe = ConcurrencyProbe(delay=probe_delay)
+        executor.register_tool("probe", probe)
+        executor.register_tool("echo", FakeTool())
+        return executor, probe
+
+    def test_streams_all_results(self):
+        executor, _ = self._executor()
+
+        batch = executor.execute_many([f"q{i}" for i in range(50)], concurrency=8)
+        items = batch.collect()
+
+        assert [item.index for item in items] == list(range(50))
+        assert all(item.success for item in items)
+        assert batch.stats.total == 50
+        assert batch.stats.throughput > 0
+        assert set(batch.stats.step_latency) == {"probe", "echo"}
+        assert batch.stats.step_latency["probe"].count == 50
+
+    def test_concurrency_is_bounded(self):
+        executor, probe = self._executor(probe_delay=0.02)
+
+        list(executor.execute_many([f"q{i}" for i in range(30)], concurrency=4))
+
+        assert 1 < probe.peak <= 4
+
+    def test_quiet_and_per_query_context(self, capsys):
+        executor, _ = self._executor()
+
+        items = executor.execute_many(
+            [("q0", {"user_id": "a"}), "q1"], context={"user_id": "shared"}
+        ).collect()
+
+        assert capsys.readouterr().out == ""
+        assert items[0].result["variables"]["user_id"] == "a"
+        assert items[1].result["variables"]["user_id"] == "shared"
+
+    def test_failures_are_reported(self):
+        executor, _ = self._executor()
+        executor.register_tool("echo", FakeTool(error=RuntimeError("boom")))
+
+        batch = executor.execute_many(["a", "b"], concurrency=2)
+        items = batch.collect()
+
+        assert all(not item.success for item in items)
+        assert "boom" in items[0].error
+        assert batch.stats.failed == 2
+        assert "실패 2" in batch.summary()
+
+    def test_tool_pool_wait_not_counted_as_timeout(self):
+        """concurrency가 tool_pool_size보다 커도 풀 대기 시간은 타임아웃이 아님"""
+        card = make_card(
+            [ExecutionStep(step=1, action="slow", input={}, timeout_ms=300)]
+        )
+        executor = SkillCardExecutor(card, tool_pool_size=4)
+        executor.register_tool("slow", FakeTool(delay=0.2))
+
+        items = executor.execute_many([f"q{i}" for i in range(12)], concurrency=12)
+
+        assert all(item.success for item in items.collect())
+
+    def test_tool_pool_wait_bounded_by_plan_deadline(self):
+        """풀 대기는 plan 마감 시간까지만"""
+        card = make_card(
+            [ExecutionStep(step=1, action="slow", input={}, timeout_ms=1000)]
+        )
+        executor = SkillCardExecutor(card, tool_pool_size=1, plan_timeout_ms=300)
+        executor.register_tool("slow", FakeTool(delay=0.2))
+
+        items = executor.execute_many(["a", "b", "c"], concurrency=3).collect()
+
+        assert sum(item.success for item in items) == 1
+
+
+class TestStepCache:
+    """tools[].cache_ttl_ms / invalidates 테스트"""
+
+    def _executor(self, cache, ttl_ms=5000):
+        card = make_card(
+            [
+                ExecutionStep(
+                    step=1,
+                    action="read",
+                    input={"date": "${user_query}"},
+                    output_to="r",
+                ),
+                ExecutionStep(step=2, action="write", input={"r": "${r}"}),
+            ],
+            tools=[
+                ToolConfig(name="read", cache_ttl_ms=ttl_ms),
+                ToolConfig(name="write", invalidates=["read"]),
+            ],
+        )
+        executor = SkillCardExecutor(card, cache=cache)
+        read = FakeTool(result={"events": [1, 2]})
+        executor.register_tool("read", read)
+        return executor, read
+
+    def test_read_step_served_from_cache(self):
+        cache = StepCache()
+        executor, read = self._executor(cache)
+        executor.register_tool("write", FakeTool())
+        # write Tool의 invalidates를 빼고 조회 캐시만 확인
+        executor.tool_configs["write"] = ToolConfig(name="write")
+
+        first = executor.execute("2025-11-12")
+        second = executor.execute("2025-11-12")
+        executor.execute("2025-11-13")
+
+        assert len(read.calls) == 2
+        assert first["step_results"][0]["cached"] is False
+        assert second["step_results"][0]["cached"] is True
+        assert second["variables"]["r"] == {"events": [1, 2]}
+        assert cache.hits == 1
+
+    def test_write_invalidates(self):
+        cache = StepCache()
+        executor, read = self._executor(cache)
+        executor.register_tool("write", FakeTool())
+
+        executor.execute("2025-11-12")
+        executor.execute("2025-11-12")
+
+        # write가 성공할 때마다 read 캐시가 비워지므로 매번 다시 조회
+        assert len(read.calls) == 2
+        assert len(cache) == 0
+
+    def test_ttl_expiry(self):
+        cache = StepCache()
+        executor, read = self._executor(cache, ttl_ms=30)
+        executor.tool_configs["write"] = ToolConfig(name="write")
+
+        executor.execute("2025-11-12")
+        time.sleep(0.05)
+        executor.execute("2025-11-12")
+
+        assert len(read.calls) == 2
+
+    def test_invalidation_during_call_skips_stale_store(self):
+        """조회 중에 무효화되면 늦게 끝난 옛 결과를 캐시하지 않음"""
+        cache = StepCache()
+        executor, read = self._executor(cache)
+        executor.tool_configs["write"] = ToolConfig(name="write")
+        read.delay = 0.2
+
+        # 조회 도중 다른 요청의 create_event가 read 캐시를 무효화
+        writer = threading.Timer(0.05, cache.invalidate, args=("read",))
+        writer.start()
+        executor.execute("2025-11-12")
+        writer.join()
+        executor.execute("2025-11-12")
+
+        assert len(read.calls) == 2
+        assert cache.hits == 0
+
+    def test_set_with_stale_generation(self):
+        cache = StepCache()
+        generation = cache.generation("read")
+        cache.invalidate("write")
+
+        # 다른 Action의 무효화는 영향 없음
+        assert cache.set("read", {"d": 1}, 1, ttl_ms=1000, generation=generation)
+
+        cache.invalidate("read")
+        assert not cache.set("read", {"d": 2}, 2, ttl_ms=1000, generation=generation)
+        assert len(cache) == 0
+
+    def test_cached_value_is_isolated(self):
+        cache = StepCache()
+        cache.set("read", {"d": 1}, {"events": [1]}, ttl_ms=1000)
+
+        value = cache.get("read", {"d": 1})
+        value["events"].append(2)
+
+        assert cache.get("read", {"d": 1}) == {"events": [1]}
+
+    def test_lru_limit(self):
+        cache = StepCache(maxsize=2)
+        for i in range(3):
+            cache.set("read", {"d": i}, i, ttl_ms=1000)
+
+        assert len(cache) == 2
+        assert cache.get("read", {"d": 2}) == 2
+
+    def test_no_cache_without_ttl(self):
+        cache = StepCache()
+        executor, read = self._executor(cache, ttl_ms=0)
+        executor.register_tool("write", FakeTool())
+
+        executor.execute("2025-11-12")
+        executor.execute("2025-11-12")
+
+        assert len(read.calls) == 2
+        assert len(cache) == 0
+
+
+class TestStreaming:
+    """execute_stream / aexecute_stream / on_event 테스트"""
+
+    def _register(self, executor, tool_cls=FakeTool):
+        for name in ["parse", "left", "right", "join"]:
+            executor.register_tool(name, tool_cls())
+
+    def test_event_order(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card)
+        self._register(executor)
+
+        events = list(executor.execute_stream("hello"))
+
+        assert [(e.type, e.step) for e in events] == [
+            ("plan_started", None),
+            ("step_started", 1),
+            ("step_finished", 1),
+            ("step_started", 2),
+            ("step_finished", 2),
+            ("step_started", 3),
+            ("step_finished", 3),
+            ("step_started", 4),
+            ("step_finished", 4),
+            ("plan_finished", None),
+        ]
+        assert events[1].input == {"q": "hello"}
+        assert events[2].output == {"echo": {"q": "hello"}}
+        assert events[2].elapsed_ms is not None
+        assert events[-1].output["variables"]["d"] == {
+            "echo": {"b": "hello", "c": "hello"}
+        }
+
+    def test_events_arrive_before_plan_ends(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="fast", output_to="a"),
+                ExecutionStep(step=2, action="slow", input={"v": "${a}"}),
+            ]
+        )
+        executor = SkillCardExecutor(card)
+        executor.register_tool("fast", FakeTool())
+        executor.register_tool("slow", FakeTool(delay=0.3))
+
+        start = time.perf_counter()
+        for event in executor.execute_stream("hello"):
+            if event.type == "step_finished" and event.step == 1:
+                first_step_at = time.perf_counter() - start
+        total = time.perf_counter() - start
+
+        # Step 1 결과는 Step 2(0.3초)가 끝나기 전에 도착
+        assert first_step_at < total - 0.2
+
+    def test_skip_and_fail_events(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="flaky", on_error="skip"),
+                ExecutionStep(step=2, action="broken"),
+            ]
+        )
+        executor = SkillCardExecutor(card)
+        executor.register_tool("flaky", FakeTool(error=RuntimeError("skip me")))
+        executor.register_tool("broken", FakeTool(error=RuntimeError("boom")))
+
+        events = list(executor.execute_stream("hello"))
+
+        assert [e.type for e in events] == [
+            "plan_started",
+            "step_started",
+            "step_skipped",
+            "step_started",
+            "step_failed",
+            "plan_failed",
+        ]
+        assert events[2].error == "skip me"
+        assert events[-1].error == "boom"
+
+    def test_on_event_callback(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, parallel=True)
+        self._register(executor)
+        events: list[StepEvent] = []
+
+        result = executor.execute("hello", on_event=events.append)
+
+        finished = [e.step for e in events if e.type == "step_finished"]
+        assert sorted(finished) == [1, 2, 3, 4]
+        assert finished[0] == 1 and finished[-1] == 4
+        assert events[-1].output is result
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, parallel=True)
+        self._register(executor, AsyncFakeTool)
+
+        events = [e async for e in executor.aexecute_stream("hello")]
+
+        assert events[0].type == "plan_started"
+        assert events[-1].type == "plan_finished"
+        assert sum(e.type == "step_finished" for e in events) == 4
+
+    def test_to_dict(self):
+        event = StepEvent("step_finished", step=1, action="parse", output={"a": 1})
+
+        data = event.to_dict()
+
+        assert data["type"] == "step_finished"
+        assert data["output"] == {"a": 1}
+        assert "timestamp" in data
+
+
+class FakeRedisClient:
+    """RedisClient의 set/get/delete만 흉내내는 테스트용 클라이언트"""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.expires: dict[str, int | None] = {}
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class TestCheckpoint:
+    """checkpoint_store / resume 테스트"""
+
+    def _executor(self, card, store, **kwargs):
+        executor = SkillCardExecutor(card, checkpoint_store=store, **kwargs)
+        tools = {name: FakeTool() for name in ["parse", "left", "right", "join"]}
+        for name, tool in tools.items():
+            executor.register_tool(name, tool)
+        return executor, tools
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_resume_from_failed_step(self, diamond_card, parallel):
+        store = InMemoryCheckpointStore()
+        executor, tools = self._executor(diamond_card, store, parallel=parallel)
+        executor.register_tool("join", FakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError, match="boom") as exc_info:
+            executor.execute("hello", run_id="run-1")
+
+        checkpoint = store.load("run-1")
+        assert checkpoint["status"] == "failed"
+        assert checkpoint["completed"] == [1, 2, 3]
+        assert "run_id: run-1" in exc_info.value.__notes__[0]
+
+        join = FakeTool()
+        executor.register_tool("join", join)
+        result = executor.resume("run-1")
+
+        # Step 1~3은 다시 실행하지 않음
+        assert len(tools["parse"].calls) == 1
+        assert len(tools["left"].calls) == 1
+        assert join.calls == [{"b": "hello", "c": "hello"}]
+        assert [r["step"] for r in result["step_results"]] == [1, 2, 3, 4]
+        assert result["run_id"] == "run-1"
+        # 성공하면 체크포인트 삭제
+        assert store.load("run-1") is None
+
+    def test_skipped_step_is_not_retried(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="flaky", on_error="skip"),
+                ExecutionStep(step=2, action="broken"),
+            ]
+        )
+        store = InMemoryCheckpointStore()
+        executor = SkillCardExecutor(card, checkpoint_store=store)
+        flaky = FakeTool(error=RuntimeError("skip me"))
+        executor.register_tool("flaky", flaky)
+        executor.register_tool("broken", FakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            executor.execute("hello", run_id="run-2")
+
+        executor.register_tool("broken", FakeTool())
+        result = executor.resume("run-2")
+
+        assert len(flaky.calls) == 1
+        assert [r["error"] for r in result["step_results"]] == ["skip me", None]
+
+    def test_run_id_generated(self, diamond_card):
+        store = InMemoryCheckpointStore()
+        executor, _ = self._executor(diamond_card, store)
+
+        result = executor.execute("hello")
+
+        assert result["run_id"]
+        assert len(store) == 0
+
+    def test_no_run_id_without_store(self, diamond_card):
+        executor, _ = self._executor(diamond_card, None)
+
+        assert "run_id" not in executor.execute("hello")
+        with pytest.raises(ValueError):
+            executor.resume("run-1")
+
+    def test_resume_errors(self, diamond_card):
+        store = InMemoryCheckpointStore()
+        executor, _ = self._executor(diamond_card, store)
+        store.save("other", {"card_id": "SC_OTHER", "variables": {}})
+
+        with pytest.raises(KeyError):
+            executor.resume("missing")
+        with pytest.raises(ValueError):
+            executor.resume("other")
+
+    @pytest.mark.asyncio
+    async def test_aresume(self, diamond_card):
+        store = InMemoryCheckpointStore()
+        executor, tools = self._executor(diamond_card, store)
+        executor.register_tool("right", AsyncFakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            await executor.aexecute("hello", run_id="run-3")
+
+        executor.register_tool("right", AsyncFakeTool())
+        result = await executor.aresume("run-3")
+
+        assert len(tools["parse"].calls) == 1
+        assert result["variables"]["d"] == {"echo": {"b": "hello", "c": "hello"}}
+
+    def test_file_store(self, diamond_card, tmp_path):
+        store = FileCheckpointStore(tmp_path)
+        executor, _ = self._executor(diamond_card, store)
+        executor.register_tool("join", FakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            executor.execute("hello", run_id="run-4")
+
+        assert (tmp_path / "run-4.json").exists()
+        executor.register_tool("join", FakeTool())
+        result = executor.resume("run-4")
+
+        assert result["variables"]["d"] == {"echo": {"b": "hello", "c": "hello"}}
+        assert not (tmp_path / "run-4.json").exists()
+        with pytest.raises(ValueError):
+            store.load("../escape")
+
+    def test_redis_store(self):
+        client = FakeRedisClient()
+        store = RedisCheckpointStore(client, ttl_seconds=60)
+
+        store.save("run-5", {"variables": {"date": "2025-11-12"}})
+
+        assert client.expires["skill_card:checkpoint:run-5"] == 60
+        assert store.load("run-5") == {"variables": {"date": "2025-11-12"}}
+        assert store.delete("run-5") is True
+        assert store.load("run-5") is None
+
+
+class SpanCollector(TraceListener):
+    """끝난 span을 모으는 리스너"""
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_span_start(self, span):
+        self.started.append(span)
+
+    def on_span_end(self, span):
+        self.ended.append(span)
+
+
+class TestTracing:
+    """Tracer / JsonLinesExporter 테스트"""
+
+    def test_plan_and_step_spans(self, diamond_card):
+        collector = SpanCollector()
+        executor = SkillCardExecutor(diamond_card, tracer=Tracer([collector]))
+        for name in ["parse", "left", "right", "join"]:
+            executor.register_tool(name, FakeTool(delay=0.01))
+
+        executor.execute("hello", quiet=True)
+
+        plan = collector.ended[-1]
+        steps = collector.ended[:-1]
+        assert plan.name == "plan" and plan.parent_id is None
+        assert [s.step for s in steps] == [1, 2, 3, 4]
+        assert all(s.parent_id == plan.span_id for s in steps)
+        assert all(s.trace_id == plan.trace_id for s in steps)
+        assert all(s.duration_ms >= 10 for s in steps)
+        assert plan.duration_ms >= sum(s.duration_ms for s in steps)
+        assert steps[0].input_bytes == len(json.dumps({"q": "hello"}))
+        assert steps[0].output_bytes == len(json.dumps({"echo": {"q": "hello"}}))
+        assert len(collector.started) == 5
+
+    def test_retry_and_failure_status(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="flaky", output_to="r"),
+                ExecutionStep(step=2, action="skip", on_error="skip"),
+                ExecutionStep(step=3, action="broken"),
+            ],
+            tools=[ToolConfig(name="flaky", retry=2)],
+        )
+        collector = SpanCollector()
+        executor = SkillCardExecutor(
+            card, tracer=Tracer([collector]), retry_backoff_ms=1
+        )
+        executor.register_tool("flaky", FlakyTool(failures=2))
+        executor.register_tool("skip", FakeTool(error=RuntimeError("skip me")))
+        executor.register_tool("broken", FakeTool(error=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            executor.execute("hello", quiet=True)
+
+        flaky, skipped, broken, plan = collector.ended
+        assert (flaky.attempts, flaky.retries, flaky.status) == (3, 2, "ok")
+        assert (skipped.status, skipped.error) == ("skipped", "skip me")
+        assert broken.status == "error"
+        assert (plan.status, plan.error) == ("error", "boom")
+
+    def test_no_spans_without_listener(self, diamond_card):
+        executor = SkillCardExecutor(diamond_card, tracer=Tracer())
+        for name in ["parse", "left", "right", "join"]:
+            executor.register_tool(name, FakeTool())
+        events = []
+
+        executor.execute("hello", quiet=True, on_event=events.append)
+
+        assert not executor.tracer.enabled
+        assert len(events) == 10
+
+    def test_json_lines_exporter(self, diamond_card):
+        stream = io.StringIO()
+        executor = SkillCardExecutor(
+            diamond_card, parallel=True, tracer=Tracer([JsonLinesExporter(stream)])
+        )
+        for name in ["parse", "left", "right", "join"]:
+            executor.register_tool(name, FakeTool())
+
+        executor.execute("hello", quiet=True)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(records) == 5
+        assert records[-1]["name"] == "plan"
+        assert {r["step"] for r in records[:-1]} == {1, 2, 3, 4}
+        assert all(r["duration_ms"] is not None for r in records)
+
+    def test_exporter_writes_file(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        card = make_card([ExecutionStep(step=1, action="a")])
+
+        with JsonLinesExporter(path) as exporter:
+            executor = SkillCardExecutor(card, tracer=Tracer([exporter]))
+            executor.register_tool("a", FakeTool())
+            executor.execute("hello", quiet=True)
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+class TestConditions:
+    """when / exit_if 테스트"""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("${slots.best_slot}", True),
+            ("!${slots.best_slot}", False),
+            ("${slots.missing}", False),
+            ("!${slots.missing}", True),
+            ("${slots.empty}", False),
+            ("${slots.best_slot.start}", True),
+            ("${flag}", False),
+            ("모드: ${mode}", True),
+            ("${mode}", True),
+            ("false", False),
+        ],
+    )
+    def test_evaluate(self, expression, expected):
+        variables = {
+            "slots": {"best_slot": {"start": "14:00"}, "empty": []},
+            "flag": False,
+            "mode": "fast",
+        }
+
+        assert compile_condition(expression).evaluate(variables) is expected
+
+    def test_empty_condition(self):
+        assert compile_condition("") is None
+        assert compile_condition("!${a.b}").references == {"a"}
+
+    def _card(self):
+        return make_card(
+            [
+                ExecutionStep(step=1, action="find", output_to="slots"),
+                ExecutionStep(
+                    step=2,
+                    action="notify",
+                    when="${slots.urgent}",
+                    output_to="notified",
+                ),
+                ExecutionStep(
+                    step=3,
+                    action="check",
+                    input={"slots": "${slots}"},
+                    output_to="checked",
+                    exit_if="!${slots.best_slot}",
+                ),
+                ExecutionStep(step=4, action="create", output_to="created"),
+                ExecutionStep(step=5, action="send", input={"e": "${created}"}),
+            ]
+        )
+
+    def _executor(self, slots, parallel=False):
+        executor = SkillCardExecutor(self._card(), parallel=parallel)
+        tools = {
+            "find": FakeTool(result=slots),
+            "notify": FakeTool(),
+            "check": FakeTool(),
+            "create": FakeTool(),
+            "send": FakeTool(),
+        }
+        for name, tool in tools.items():
+            executor.register_tool(name, tool)
+        return executor, tools
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_exit_early(self, parallel):
+        executor, tools = self._executor({"best_slot": None}, parallel=parallel)
+
+        result = executor.execute("hello")
+
+        assert result["exited_early"] is True
+        assert result["exit_step"] == 3
+        assert [r["step"] for r in result["step_results"]] == [1, 2, 3]
+        assert tools["create"].calls == []
+        assert tools["send"].calls == []
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_no_exit(self, parallel):
+        executor, tools = self._executor({"best_slot": {"start": "14:00"}}, parallel)
+
+        result = executor.execute("hello")
+
+        assert result["exited_early"] is False
+        assert result["exit_step"] is None
+        assert len(tools["send"].calls) == 1
+
+    def test_when_false_skips_step(self):
+        executor, tools = self._executor({"best_slot": {"start": "14:00"}})
+        events = []
+
+        result = executor.execute("hello", on_event=events.append)
+
+        skipped = result["step_results"][1]
+        assert tools["notify"].calls == []
+        assert (skipped["skipped"], skipped["attempts"], skipped["error"]) == (
+            True,
+            0,
+            None,
+        )
+        assert "notified" not in result["variables"]
+        assert [e.step for e in events if e.type == "step_skipped"] == [2]
+
+    def test_when_true_runs_step(self):
+        executor, tools = self._executor({"best_slot": None, "urgent": True})
+
+        executor.execute("hello")
+
+        assert len(tools["notify"].calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_exit_early(self):
+        executor, tools = self._executor({"best_slot": None}, parallel=True)
+
+        result = await executor.aexecute("hello")
+
+        assert result["exit_step"] == 3
+        assert tools["create"].calls == []
+
+    def test_planner_waits_for_exit_step(self):
+        graph = ExecutionGraph.from_steps(self._card().execution_plan)
+
+        # Step 4는 입력 의존성이 없지만 exit_if가 있는 Step 3 이후에 실행
+        assert graph.dependencies[2] == {1}
+        assert graph.dependencies[4] == {3}
+        assert graph.dependencies[5] == {4}
+
+    def test_schedule_card_exit_condition(self):
+        from multi_agent_lab.platform.skill_card import SkillCardManager
+
+        card = SkillCardManager().get("SC_SCHEDULE_001")
+
+        assert card.execution_plan[2].exit_if == "!${available_slots.best_slot}"
+
+
+class TestSpeculation:
+    """추측 실행 테스트"""
+
+    def _card(self, read_only=True):
+        return make_card(
+            [
+                ExecutionStep(
+                    step=1,
+                    action="parse",
+                    input={"q": "${user_query}"},
+                    output_to="event_data",
+                ),
+                ExecutionStep(
+                    step=2,
+                    action="events",
+                    input={"date": "${event_data.date}"},
+                    output_to="existing",
+                ),
+                ExecutionStep(
+                    step=3,
+                    action="free",
+                    input={"date": "${event_data.date}", "busy": "${existing}"},
+                    output_to="slots",
+                ),
+                ExecutionStep(
+                    step=4,
+                    action="create",
+                    input={"date": "${event_data.date}", "slots": "${slots}"},
+                ),
+            ],
+            tools=[
+                ToolConfig(name="events", read_only=read_only),
+                ToolConfig(name="free", read_only=read_only),
+                ToolConfig(name="create"),
+            ],
+        )
+
+    def _executor(self, parsed_date, predicted_date, read_only=True, **kwargs):
+        executor = SkillCardExecutor(self._card(read_only), **kwargs)
+        tools = {
+            "parse": FakeTool(result={"date": parsed_date}, delay=0.2),
+            "events": FakeTool(delay=0.15),
+            "free": FakeTool(delay=0.15),
+            "create": FakeTool(),
+        }
+        for name, tool in tools.items():
+            executor.register_tool(name, tool)
+        executor.register_speculator(
+            "event_data", lambda variables: {"date": predicted_date}
+        )
+        return executor, tools
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_correct_prediction_hides_latency(self, parallel):
+        executor, tools = self._executor("2025-11-13", "2025-11-13", parallel=parallel)
+
+        start = time.perf_counter()
+        result = executor.execute("내일 회의", quiet=True)
+        elapsed = time.perf_counter() - start
+
+        # parse(0.2) + events(0.15) + free(0.15) = 0.5초 → 약 0.3초
+        assert elapsed < 0.45
+        assert len(tools["events"].calls) == 1
+        assert len(tools["free"].calls) == 1
+        assert [r["speculative"] for r in result["step_results"]] == [
+            False,
+            True,
+            True,
+            False,
+        ]
+        assert result["variables"]["slots"] == {
+            "echo": {"date": "2025-11-13", "busy": {"echo": {"date": "2025-11-13"}}}
+        }
+
+    def test_wrong_prediction_is_discarded(self):
+        executor, tools = self._executor("2025-11-14", "2025-11-13")
+
+        result = executor.execute("내일 회의", quiet=True)
+
+        # 추측 실행 1번 + 실제 실행 1번
+        assert [c["date"] for c in tools["events"].calls] == [
+            "2025-11-13",
+            "2025-11-14",
+        ]
+        assert not any(r["speculative"] for r in result["step_results"])
+        assert tools["create"].calls[0]["date"] == "2025-11-14"
+        assert result["variables"]["existing"] == {"echo": {"date": "2025-11-14"}}
+
+    def test_only_read_only_tools(self):
+        executor, tools = self._executor("2025-11-13", "2025-11-13", read_only=False)
+
+        result = executor.execute("내일 회의", quiet=True)
+
+        assert not any(r["speculative"] for r in result["step_results"])
+        assert len(tools["events"].calls) == 1
+
+    def test_no_prediction(self):
+        executor, tools = self._executor("2025-11-13", None)
+
+        result = executor.execute("회의", quiet=True)
+
+        assert not any(r["speculative"] for r in result["step_results"])
+        assert len(tools["events"].calls) == 1
+
+    def test_incomplete_prediction_is_not_speculated(self):
+        card = make_card(
+            [
+                ExecutionStep(step=1, action="parse", output_to="event_data"),
+                ExecutionStep(
+                    step=2,
+                    action="events",
+                    input={"date": "${event_data.date}", "d": "${event_data.duration}"},
+                ),
+            ],
+            tools=[ToolConfig(name="events", read_only=True)],
+        )
+        executor = SkillCardExecutor(card)
+        executor.register_tool("parse", FakeTool(result={"date": "d", "duration": 30}))
+        events = FakeTool()
+        executor.register_tool("events", events)
+        executor.register_speculator("event_data", lambda v: {"date": "d"})
+
+        executor.execute("hello", quiet=True)
+
+        # duration을 예측하지 못하므로 추측 실행하지 않음
+        assert events.calls == [{"date": "d", "d": 30}]
+
+    @pytest.mark.asyncio
+    async def test_async_speculation(self):
+        executor, tools = self._executor("2025-11-13", "2025-11-13")
+
+        start = time.perf_counter()
+        result = await executor.aexecute("내일 회의", quiet=True)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45
+        assert len(tools["events"].calls) == 1
+        assert result["step_results"][1]["speculative"] is True
+
+    @pytest.mark.asyncio
+    async def test_async_wrong_prediction(self):
+        executor, _ = self._executor("2025-11-14", "2025-11-13")
+
+        result = await executor.aexecute("내일 회의", quiet=True)
+
+        assert result["variables"]["existing"] == {"echo": {"date": "2025-11-14"}}
+        assert not any(r["speculative"] for r in result["step_results"])
+
+
+class PidTool:
+    """실행된 프로세스 ID를 반환하는 pickle 가능한 Tool"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def invoke(self, input_data: dict):
+        if self.delay:
+            time.sleep(self.delay)
+        return {"pid": os.getpid(), "input": input_data}
+
+
+@langchain_tool
+def sum_of_squares(n: int) -> int:
+    """0부터 n-1까지 제곱의 합 (CPU 위주 Tool)"""
+    return sum(i * i for i in range(n))
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    """테스트가 끝나면 공유 프로세스 풀 종료"""
+    yield
+    shutdown_process_pool()
+
+
+@pytest.mark.usefixtures("process_pool")
+class TestToolExecution:
+    """register_tool(execution=...) 테스트"""
+
+    def _card(self):
+        return make_card(
+            [ExecutionStep(step=1, action="work", input={"n": 10}, output_to="r")]
+        )
+
+    def test_process_tool_runs_in_other_process(self):
+        executor = SkillCardExecutor(self._card())
+        executor.register_tool("work", PidTool(), execution="process")
+
+        result = executor.execute("hello", quiet=True)
+
+        assert result["variables"]["r"]["pid"] != os.getpid()
+        assert result["variables"]["r"]["input"] == {"n": 10}
+
+    def test_langchain_tool_sent_by_reference(self):
+        executor = SkillCardExecutor(self._card())
+        executor.register_tool("work", sum_of_squares, execution="process")
+
+        result = executor.execute("hello", quiet=True)
+
+        assert result["variables"]["r"] == 285
+
+    def test_unpicklable_tool_rejected(self):
+        executor = SkillCardExecutor(self._card())
+        local_tool = FakeTool()
+        local_tool.invoke = lambda input_data: input_data
+
+        with pytest.raises(TypeError):
+            executor.register_tool("work", local_tool, execution="process")
+
+    def test_unpicklable_input(self):
+        card = make_card(
+            [ExecutionStep(step=1, action="work", input={"lock": "${lock}"})]
+        )
+        executor = SkillCardExecutor(card)
+        executor.register_tool("work", PidTool(), execution="process")
+
+        with pytest.raises(TypeError, match="pickle"):
+            executor.execute("hello", context={"lock": threading.Lock()}, quiet=True)
+
+    def test_process_timeout(self):
+        card = make_card([ExecutionStep(step=1, action="work", timeout_ms=100)])
+        executor = SkillCardExecutor(card)
+        executor.register_tool("work", PidTool(delay=0.5), execution="process")
+
+        with pytest.raises(StepTimeoutError):
+            executor.execute("hello", quiet=True)
+
+    def test_inline_runs_on_calling_thread(self):
+        executor = SkillCardExecutor(self._card())
+        inline = FakeTool()
+        executor.register_tool("work", inline, execution="inline")
+
+        executor.execute("hello", quiet=True)
+
+        assert inline.threads == {threading.current_thread().name}
+
+    def test_invalid_execution(self):
+        executor = SkillCardExecutor(self._card())
+
+        with pytest.raises(ValueError):
+            executor.register_tool("work", FakeTool(), execution="gpu")
+
+    @pytest.mark.asyncio
+    async def test_async_process_tool(self):
+        executor = SkillCardExecutor(self._card())
+        executor.register_tool("work", sum_of_squares, execution="process")
+
+        result = await executor.aexecute("hello", quiet=True)
+
+        assert result["variables"]["r"] == 285
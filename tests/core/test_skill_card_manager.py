@@ -7,17 +7,36 @@ SkillCardManager 테스트
 3. Execution Plan 연속성 검증
 4. 키워드 매칭
 5. 유효성 검사
+6. 키워드 인덱스 (Aho-Corasick, 가중치 순위)
+7. 예시 문장 유사도 매칭 (HashingEmbedder, SemanticIndex)
+8. 레지스트리 캐시 (.cache, 지연 검증)
+9. 핫 리로드 (스냅샷 교체, SkillCardWatcher)
+10. 버전 관리 (버전 고정, 트래픽 분배)
 """
 
 import json
-
-from multi_agent_lab.platform.skill_card import SkillCard, SkillCardManager
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from multi_agent_lab.platform.skill_card import (
+    HashingEmbedder,
+    KeywordIndex,
+    SkillCard,
+    SkillCardManager,
+    SkillCardWatcher,
+)
+from multi_agent_lab.platform.skill_card import registry as registry_module
 from multi_agent_lab.platform.skill_card.schema import (
     Constraints,
     ExecutionStep,
     LLMConfig,
     Trigger,
 )
+from multi_agent_lab.platform.skill_card.versions import TrafficSplit, version_key
 
 
 class TestSkillCardManager:
@@ -293,3 +312,489 @@ class TestSkillCardSchema:
         reloaded_card = SkillCard(**loaded_dict)
         assert reloaded_card.id == card.id
         assert reloaded_card.agent_name == card.agent_name
+
+
+def write_card(
+    directory,
+    card_id: str,
+    keywords: list[str],
+    weights=None,
+    examples=None,
+    threshold: float = 0.85,
+    version: str = "1.0.0",
+    filename: str | None = None,
+):
+    """테스트용 Skill Card JSON 파일 생성"""
+    data = {
+        "id": card_id,
+        "version": version,
+        "agent_name": f"{card_id} Agent",
+        "agent_type": "TestAgent",
+        "trigger": {
+            "keywords": keywords,
+            "keyword_weights": weights or {},
+            "examples": examples or [],
+            "similarity_threshold": threshold,
+        },
+    }
+    (directory / (filename or f"{card_id.lower()}.json")).write_text(
+        json.dumps(data, ensure_ascii=False), encoding="utf-8"
+    )
+
+
+class TestKeywordIndex:
+    """Aho-Corasick 키워드 인덱스 테스트"""
+
+    def test_overlapping_keywords_in_one_pass(self):
+        """겹치는 키워드(접미사 포함)도 모두 찾음"""
+        index = KeywordIndex()
+        for keyword in ["he", "she", "his", "hers"]:
+            index.add(keyword, "SC_A")
+        index.build()
+
+        found = [keyword for _, keyword in index.iter_matches("ushers")]
+
+        assert sorted(found) == ["he", "hers", "she"]
+
+    def test_case_insensitive(self):
+        """키워드와 질의 모두 소문자로 매칭"""
+        index = KeywordIndex()
+        index.add("Meeting", "SC_A")
+        index.build()
+
+        assert [m.card_id for m in index.search("team MEETING today")] == ["SC_A"]
+
+    def test_build_required_after_add(self):
+        """add() 뒤 build() 없이 검색하면 에러"""
+        index = KeywordIndex()
+        index.add("일정", "SC_A")
+
+        with pytest.raises(RuntimeError):
+            index.search("일정")
+
+    def test_rank_by_weight_then_hits(self, tmp_path):
+        """가중치 합 → 등장 횟수 순으로 정렬"""
+        # Given: "할일"에 높은 가중치를 준 카드와 일반 카드
+        write_card(tmp_path, "SC_SCHEDULE", ["일정", "시간"])
+        write_card(tmp_path, "SC_TODO", ["할일", "일정"], weights={"할일": 3.0})
+        manager = SkillCardManager(tmp_path)
+
+        # When: 두 카드가 모두 매칭되는 질의
+        matches = manager.match_keywords("오늘 할일 일정 시간 정리")
+
+        # Then: 가중치 합이 큰 SC_TODO(4.0)가 SC_SCHEDULE(2.0)보다 먼저
+        assert [(m.card_id, m.score) for m in matches] == [
+            ("SC_TODO", 4.0),
+            ("SC_SCHEDULE", 2.0),
+        ]
+        assert matches[0].keywords == ["할일", "일정"]
+
+        # Then: 같은 점수면 등장 횟수가 많은 카드가 먼저
+        matches = manager.match_keywords("일정 일정 시간")
+        assert matches[0].card_id == "SC_SCHEDULE"
+        assert matches[0].hits == 3
+
+    def test_reload_rebuilds_index(self, tmp_path):
+        """reload() 하면 새 카드 키워드가 인덱스에 반영됨"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        manager = SkillCardManager(tmp_path)
+        assert manager.find_by_keywords("주식 매수") == []
+
+        write_card(tmp_path, "SC_B", ["주식"])
+        manager.reload()
+
+        assert [c.id for c in manager.find_by_keywords("주식 매수")] == ["SC_B"]
+
+
+class TestSemanticMatching:
+    """예시 문장 유사도 매칭 테스트"""
+
+    def test_hashing_embedder_is_normalized_and_stable(self):
+        """벡터는 L2 정규화되고 같은 문장은 항상 같은 벡터"""
+        embedder = HashingEmbedder(dimension=64)
+
+        vectors = embedder.embed(["내일 회의 잡아줘", "내일 회의 잡아줘", ""])
+
+        assert vectors.shape == (3, 64)
+        assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+        assert np.array_equal(vectors[0], vectors[1])
+        # 빈 문장은 0 벡터 (0으로 나누지 않음)
+        assert not vectors[2].any()
+
+    def test_examples_in_contiguous_matrix(self, tmp_path):
+        """카드 예시 문장이 하나의 연속 행렬로 저장됨"""
+        write_card(tmp_path, "SC_A", [], examples=["회의 잡아줘", "미팅 추가"])
+        write_card(tmp_path, "SC_B", [], examples=["할일 추가해줘"])
+        write_card(tmp_path, "SC_C", ["키워드만"])
+
+        index = SkillCardManager(tmp_path).semantic_index
+
+        # 예시가 없는 SC_C는 제외
+        assert index.card_ids == ["SC_A", "SC_B"]
+        assert index.matrix.shape == (3, index.embedder.dimension)
+        assert index.matrix.flags["C_CONTIGUOUS"]
+        assert index.owners.tolist() == [0, 0, 1]
+        assert index.offsets.tolist() == [0, 2, 3]
+
+    def test_rank_by_similarity_with_card_threshold(self, tmp_path):
+        """카드별 similarity_threshold 이상만 유사도순으로 반환"""
+        write_card(
+            tmp_path,
+            "SC_SCHEDULE",
+            [],
+            examples=["다음주 월요일에 1시간짜리 미팅 추가해줘"],
+            threshold=0.5,
+        )
+        write_card(
+            tmp_path,
+            "SC_TODO",
+            [],
+            examples=["장보기를 할일 목록에 넣어줘"],
+            threshold=0.5,
+        )
+        manager = SkillCardManager(tmp_path)
+
+        matches = manager.match_similarity("다음주 월요일에 30분 미팅 추가해줘")
+
+        assert [m.card_id for m in matches] == ["SC_SCHEDULE"]
+        assert matches[0].example == "다음주 월요일에 1시간짜리 미팅 추가해줘"
+        assert manager.find_by_similarity("오늘 날씨 어때?") == []
+
+        # threshold를 직접 주면 카드 설정 대신 사용
+        loose = manager.match_similarity("다음주 월요일 할일", threshold=0.0)
+        assert {m.card_id for m in loose} == {"SC_SCHEDULE", "SC_TODO"}
+        assert loose[0].score >= loose[1].score
+        assert len(manager.match_similarity("미팅", threshold=0.0, top_k=1)) == 1
+
+    def test_schedule_card_examples(self):
+        """schedule_card 예시 문장 그대로면 유사도 1.0으로 매칭"""
+        manager = SkillCardManager()
+
+        matches = manager.match_similarity("내일 오후 2시에 팀 회의 일정 잡아줘")
+
+        assert matches[0].card_id == "SC_SCHEDULE_001"
+        assert matches[0].score == pytest.approx(1.0)
+
+
+class TestRegistryCache:
+    """컴파일 캐시와 지연 검증 테스트"""
+
+    @pytest.fixture
+    def count_compiles(self, monkeypatch):
+        """compile_entry 호출 횟수 기록"""
+        calls: list[str] = []
+        original = registry_module.compile_entry
+
+        def counting(name, *args):
+            calls.append(name)
+            return original(name, *args)
+
+        monkeypatch.setattr(registry_module, "compile_entry", counting)
+        return calls
+
+    def test_unchanged_files_are_not_recompiled(self, tmp_path, count_compiles):
+        """두 번째 로드는 캐시만 사용"""
+        write_card(tmp_path, "SC_A", ["일정"], examples=["회의 잡아줘"])
+        SkillCardManager(tmp_path)
+        assert count_compiles == ["sc_a.json"]
+        assert (tmp_path / ".cache" / "index.json").exists()
+        assert list((tmp_path / ".cache").glob("examples-*.npy"))
+
+        manager = SkillCardManager(tmp_path)
+
+        assert count_compiles == ["sc_a.json"]
+        assert [c.id for c in manager.find_by_keywords("일정")] == ["SC_A"]
+        # 예시 행렬은 .npy를 mmap으로 읽어서 사용
+        assert isinstance(manager.semantic_index.matrix.base, np.memmap)
+
+    def test_embedders_keep_separate_example_caches(self, tmp_path):
+        """임베더가 다른 매니저가 같은 디렉토리를 써도 서로의 캐시를 지우지 않음"""
+        write_card(tmp_path, "SC_A", ["일정"], examples=["회의 잡아줘"])
+        SkillCardManager(tmp_path, embedder=HashingEmbedder(dimension=256))
+        SkillCardManager(tmp_path, embedder=HashingEmbedder(dimension=512))
+        assert len(set((tmp_path / ".cache").glob("examples-*.npy"))) == 2
+
+        # 예시가 바뀌면 같은 임베더의 이전 행렬만 교체
+        write_card(tmp_path, "SC_A", ["일정"], examples=["미팅 잡아줘"])
+        SkillCardManager(tmp_path, embedder=HashingEmbedder(dimension=256))
+        SkillCardManager(tmp_path, embedder=HashingEmbedder(dimension=512))
+        assert len(set((tmp_path / ".cache").glob("examples-*.npy"))) == 2
+
+        manager = SkillCardManager(tmp_path, embedder=HashingEmbedder(dimension=256))
+        assert isinstance(manager.semantic_index.matrix.base, np.memmap)
+
+    def test_touched_file_uses_hash(self, tmp_path, count_compiles):
+        """mtime만 바뀌고 내용이 같으면 다시 컴파일하지 않음"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        SkillCardManager(tmp_path)
+        path = tmp_path / "sc_a.json"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        SkillCardManager(tmp_path)
+
+        assert count_compiles == ["sc_a.json"]
+
+    def test_changed_file_is_recompiled(self, tmp_path, count_compiles):
+        """내용이 바뀐 파일만 다시 컴파일"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        write_card(tmp_path, "SC_B", ["주식"])
+        manager = SkillCardManager(tmp_path)
+
+        write_card(tmp_path, "SC_B", ["주식", "환율 변동"])
+        manager.reload()
+
+        assert count_compiles == ["sc_a.json", "sc_b.json", "sc_b.json"]
+        assert [c.id for c in manager.find_by_keywords("환율 변동")] == ["SC_B"]
+
+    def test_cards_are_validated_lazily(self, tmp_path, capsys):
+        """전체 검증은 get()할 때, 실패하면 None"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        data = json.loads((tmp_path / "sc_a.json").read_text(encoding="utf-8"))
+        data["id"] = "SC_BROKEN"
+        data["execution_plan"] = [{"step": "첫번째"}]
+        (tmp_path / "sc_broken.json").write_text(json.dumps(data), encoding="utf-8")
+
+        manager = SkillCardManager(tmp_path)
+
+        # 로드 시점에는 검증하지 않고, 카드별 로그도 출력하지 않음
+        assert manager.cards.loaded == frozenset()
+        assert {c["id"] for c in manager.list_all()} == {"SC_A", "SC_BROKEN"}
+        assert "Loaded" not in capsys.readouterr().out
+
+        assert manager.get("SC_A").id == "SC_A"
+        assert manager.get("SC_BROKEN") is None
+        assert "Failed to load SC_BROKEN" in capsys.readouterr().out
+        assert [c.id for c in manager.find_by_keywords("일정")] == ["SC_A"]
+        assert manager.cards.loaded == frozenset({"SC_A"})
+
+    def test_invalid_trigger_fails_at_load(self, tmp_path, capsys):
+        """id/trigger가 잘못된 파일은 로드할 때 제외"""
+        (tmp_path / "bad.json").write_text(
+            json.dumps({"id": "SC_BAD", "trigger": {"keywords": "일정"}}),
+            encoding="utf-8",
+        )
+
+        manager = SkillCardManager(tmp_path, verbose=True)
+
+        assert len(manager.cards) == 0
+        assert "Failed to load bad.json" in capsys.readouterr().out
+
+
+class TestHotReload:
+    """스냅샷 교체와 파일 감시 테스트"""
+
+    def test_refresh_without_changes_keeps_snapshot(self, tmp_path):
+        """바뀐 파일이 없으면 스냅샷을 교체하지 않음"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        manager = SkillCardManager(tmp_path)
+        snapshot = manager.snapshot
+
+        assert manager.refresh() is False
+        assert manager.snapshot is snapshot
+
+        write_card(tmp_path, "SC_B", ["주식"])
+        assert manager.refresh() is True
+        assert manager.snapshot.version == snapshot.version + 1
+        # 이전 스냅샷은 그대로 (불변)
+        assert "SC_B" not in snapshot.cards
+        assert "SC_B" in manager.cards
+
+    def test_refresh_reuses_unchanged_cards(self, tmp_path, monkeypatch):
+        """바뀌지 않은 카드는 검증 결과와 예시 임베딩을 재사용"""
+        write_card(tmp_path, "SC_A", ["일정"], examples=["회의 잡아줘"])
+        write_card(tmp_path, "SC_B", ["주식"], examples=["주가 알려줘"])
+        manager = SkillCardManager(tmp_path)
+        card_a = manager.get("SC_A")
+        embedded: list[list[str]] = []
+        original = manager.embedder.embed
+
+        def recording(texts):
+            embedded.append(list(texts))
+            return original(texts)
+
+        monkeypatch.setattr(manager.embedder, "embed", recording)
+
+        write_card(tmp_path, "SC_B", ["주식"], examples=["환율 알려줘"])
+        manager.refresh()
+
+        assert manager.get("SC_A") is card_a
+        # 새 예시 문장만 임베딩
+        assert embedded == [["환율 알려줘"]]
+        matches = manager.match_similarity("환율 알려줘", threshold=0.9)
+        assert [m.card_id for m in matches] == ["SC_B"]
+
+    def test_edit_after_snapshot_triggers_refresh(self, tmp_path):
+        """스캔 이후 바뀐 파일은 이전 스냅샷 내용으로 검증하지 않고 refresh"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        manager = SkillCardManager(tmp_path)
+        snapshot = manager.snapshot
+
+        write_card(tmp_path, "SC_A", ["일정", "환율 변동"], version="1.1.0")
+
+        with pytest.raises(registry_module.StaleCardError):
+            snapshot.cards["SC_A"]
+        card = manager.get("SC_A")
+        assert card.version == "1.1.0"
+        assert manager.snapshot.version == snapshot.version + 1
+        assert [c.id for c in manager.find_by_keywords("환율 변동")] == ["SC_A"]
+
+    def test_half_written_file_is_not_served(self, tmp_path, capsys):
+        """쓰는 중인 파일은 refresh 후 로드 실패로 처리 (ValueError 전파 X)"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        manager = SkillCardManager(tmp_path)
+        path = tmp_path / "sc_a.json"
+        path.write_bytes(path.read_bytes()[:20])
+
+        assert manager.find_by_keywords("일정") == []
+        assert manager.get("SC_A") is None
+        assert "Failed to load sc_a.json" in capsys.readouterr().out
+
+    def test_lookups_never_see_empty_registry(self, tmp_path):
+        """reload 중에도 조회 결과가 비지 않음"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        manager = SkillCardManager(tmp_path)
+        stop = threading.Event()
+        misses: list[int] = []
+
+        def lookup():
+            while not stop.is_set():
+                if not manager.find_by_keywords("일정"):
+                    misses.append(1)
+
+        reader = threading.Thread(target=lookup)
+        reader.start()
+        try:
+            for _ in range(30):
+                manager.reload()
+        finally:
+            stop.set()
+            reader.join()
+
+        assert misses == []
+
+    def test_watcher_applies_changes(self, tmp_path):
+        """watcher가 바뀐 카드를 반영하고 on_change 호출"""
+        write_card(tmp_path, "SC_A", ["일정"])
+        manager = SkillCardManager(tmp_path)
+        versions: list[int] = []
+
+        with SkillCardWatcher(
+            manager, interval=0.01, on_change=lambda s: versions.append(s.version)
+        ) as watcher:
+            assert watcher.running
+            write_card(tmp_path, "SC_A", ["일정", "환율 변동"])
+            deadline = time.monotonic() + 5
+            while not versions and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert not watcher.running
+        assert versions == [manager.snapshot.version]
+        assert [c.id for c in manager.find_by_keywords("환율 변동")] == ["SC_A"]
+
+    def test_failed_card_logged_once(self, tmp_path, capsys):
+        """깨진 파일은 바뀌었을 때만 로그 출력 (폴링마다 반복하지 않음)"""
+        (tmp_path / "bad.json").write_text("{", encoding="utf-8")
+        manager = SkillCardManager(tmp_path)
+        assert "Failed to load bad.json" in capsys.readouterr().out
+
+        manager.reload()
+
+        assert "Failed" not in capsys.readouterr().out
+
+
+class TestVersions:
+    """여러 버전 보관과 트래픽 분배 테스트"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        for version in ["1.0.0", "1.10.0", "1.2.0"]:
+            write_card(
+                tmp_path,
+                "SC_A",
+                ["일정"],
+                version=version,
+                filename=f"sc_a_{version}.json",
+            )
+        return SkillCardManager(tmp_path)
+
+    def test_duplicate_version_reported(self, tmp_path, capsys):
+        """같은 (ID, 버전)을 선언한 파일은 한쪽이 이기지 않고 모두 에러"""
+        write_card(tmp_path, "SC_A", ["일정"], filename="a.json")
+        write_card(tmp_path, "SC_A", ["일정", "미팅"], filename="b.json")
+        write_card(tmp_path, "SC_A", ["일정"], version="0.9.0", filename="c.json")
+
+        manager = SkillCardManager(tmp_path)
+
+        out = capsys.readouterr().out
+        assert "Failed to load a.json: 중복된 Skill Card SC_A v1.0.0" in out
+        assert "Failed to load b.json" in out
+        assert not manager.snapshot.files["b.json"].ok
+        assert manager.versions("SC_A") == ["0.9.0"]
+        assert manager.get("SC_A").version == "0.9.0"
+        assert manager.find_by_keywords("미팅") == []
+
+        (tmp_path / "b.json").unlink()
+        manager.refresh()
+
+        assert manager.versions("SC_A") == ["0.9.0", "1.0.0"]
+        assert "Failed" not in capsys.readouterr().out
+
+    def test_version_key_order(self):
+        """숫자 단위 비교, 정식 버전이 pre-release보다 높음"""
+        versions = ["1.10.0", "1.2.0", "1.2.0-beta", "0.9"]
+
+        assert sorted(versions, key=version_key) == [
+            "0.9",
+            "1.2.0-beta",
+            "1.2.0",
+            "1.10.0",
+        ]
+
+    def test_versions_kept_side_by_side(self, manager):
+        """같은 ID의 버전이 덮어쓰이지 않고, 기본은 가장 높은 버전"""
+        assert len(manager.cards) == 1
+        assert manager.versions("SC_A") == ["1.0.0", "1.2.0", "1.10.0"]
+        assert manager.get("SC_A").version == "1.10.0"
+        assert manager.get("SC_A", version="1.0.0").version == "1.0.0"
+        assert manager.get("SC_A", version="9.9.9") is None
+        assert manager.list_all()[0]["versions"] == ["1.0.0", "1.2.0", "1.10.0"]
+
+    def test_pinned_version_overrides_traffic(self, manager):
+        """버전을 고정하면 트래픽 설정을 무시"""
+        manager.set_traffic("SC_A", {"1.2.0": 1})
+
+        assert manager.resolve("SC_A").version == "1.2.0"
+        assert manager.resolve("SC_A", version="1.0.0").version == "1.0.0"
+
+        manager.set_traffic("SC_A", None)
+        assert manager.resolve("SC_A").version == "1.10.0"
+
+    def test_weighted_split_is_sticky(self, manager):
+        """같은 key는 항상 같은 버전, 전체 비율은 가중치를 따름"""
+        manager.set_traffic("SC_A", {"1.0.0": 80, "1.10.0": 20})
+
+        chosen = [manager.resolve("SC_A", key=f"user-{i}").version for i in range(2000)]
+
+        assert set(chosen) == {"1.0.0", "1.10.0"}
+        assert 0.15 < chosen.count("1.10.0") / len(chosen) < 0.25
+        again = [manager.resolve("SC_A", key=f"user-{i}").version for i in range(2000)]
+        assert again == chosen
+        # find_by_keywords도 같은 규칙으로 버전 선택
+        assert manager.find_by_keywords("일정", key="user-0")[0].version == chosen[0]
+
+    def test_split_ignores_missing_versions(self, manager):
+        """레지스트리에 없는 버전은 건너뛰고, 하나도 없으면 기본 버전"""
+        split = TrafficSplit({"2.0.0": 1, "1.2.0": 1})
+
+        assert split.choose("SC_A", manager.versions("SC_A"), key="k") == "1.2.0"
+
+        manager.set_traffic("SC_A", {"2.0.0": 1})
+        assert manager.resolve("SC_A").version == "1.10.0"
+
+    def test_invalid_weights(self, manager):
+        """음수 가중치나 합이 0인 가중치는 에러"""
+        with pytest.raises(ValueError):
+            manager.set_traffic("SC_A", {"1.0.0": -1})
+        with pytest.raises(ValueError):
+            manager.set_traffic("SC_A", {"1.0.0": 0})
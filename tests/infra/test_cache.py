@@ -0,0 +1,67 @@
+"""
+LRUCache 테스트
+"""
+
+from multi_agent_lab.infra.cache import MISSING, LRUCache
+
+
+class FakeClock:
+    """수동으로 진행시키는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_set():
+    cache = LRUCache(maxsize=4)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", MISSING) is MISSING
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = LRUCache(maxsize=4, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    clock.now = 15
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_cache_none_value():
+    cache = LRUCache()
+    cache.set("a", None)
+
+    assert cache.get("a", MISSING) is None
+
+
+def test_delete_where():
+    cache = LRUCache()
+    cache.set(("read", "1"), 1)
+    cache.set(("read", "2"), 2)
+    cache.set(("other", "1"), 3)
+
+    assert cache.delete_where(lambda key: key[0] == "read") == 2
+    assert len(cache) == 1
@@ -0,0 +1,66 @@
+"""
+ChatModelPool 테스트
+"""
+
+import threading
+
+from multi_agent_lab.infra.llm import ChatModelPool
+
+
+class FakeChatModel:
+    """생성 인자만 기록하는 가짜 Chat 모델"""
+
+    created = 0
+
+    def __init__(self, **kwargs):
+        FakeChatModel.created += 1
+        self.kwargs = kwargs
+
+
+def test_same_key_shares_instance():
+    pool = ChatModelPool(factory=FakeChatModel)
+
+    a = pool.get("gpt-oss:20b", temperature=0.1)
+    b = pool.get("gpt-oss:20b", 0.1)
+
+    assert a is b
+    assert a.kwargs == {"model": "gpt-oss:20b", "temperature": 0.1}
+    assert len(pool) == 1
+
+
+def test_different_settings_get_different_instances():
+    pool = ChatModelPool(factory=FakeChatModel)
+
+    base = pool.get("gpt-oss:20b", temperature=0.0)
+
+    assert pool.get("gpt-oss:20b", temperature=0.1) is not base
+    assert pool.get("llama3", temperature=0.0) is not base
+    assert pool.get("gpt-oss:20b", temperature=0.0, num_predict=256) is not base
+    assert len(pool) == 4
+
+
+def test_concurrent_get_creates_once():
+    pool = ChatModelPool(factory=FakeChatModel)
+    before = FakeChatModel.created
+    results = []
+
+    def worker():
+        results.append(pool.get("gpt-oss:20b", temperature=0.1))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakeChatModel.created - before == 1
+    assert all(llm is results[0] for llm in results)
+
+
+def test_clear():
+    pool = ChatModelPool(factory=FakeChatModel)
+    first = pool.get("gpt-oss:20b")
+    pool.clear()
+
+    assert len(pool) == 0
+    assert pool.get("gpt-oss:20b") is not first
@@ -0,0 +1,220 @@
+"""
+RedisCheckpointSaver 테스트
+
+RedisClient를 dict 기반 가짜 객체로 대체하므로 Redis 서버 없이 실행됩니다.
+"""
+
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from multi_agent_lab.infra.database.redis import RedisCheckpointSaver
+
+
+class FakeRedisClient:
+    """RedisClient의 String/Hash/Sorted Set 일부를 흉내내는 테스트용 클라이언트"""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self.expires: dict[str, int | None] = {}
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    def hset(self, name, key, value):
+        self.data.setdefault(name, {})[key] = value
+        return 1
+
+    def hgetall(self, name):
+        return dict(self.data.get(name, {}))
+
+    def zadd(self, name, mapping):
+        self.data.setdefault(name, set()).update(mapping)
+        return len(mapping)
+
+    def zrange(self, name, start, end):
+        members = sorted(self.data.get(name, set()))
+        return members[start : None if end == -1 else end + 1]
+
+    def zrem(self, name, *values):
+        members = self.data.get(name, set())
+        removed = members & set(values)
+        members -= removed
+        return len(removed)
+
+    def zrevrange(self, name, start, end):
+        members = sorted(self.data.get(name, set()), reverse=True)
+        return members[start : None if end == -1 else end + 1]
+
+    def expire(self, key, seconds):
+        self.expires[key] = seconds
+        return key in self.data
+
+    def keys(self, pattern="*"):
+        raise AssertionError("공유 Redis에서 KEYS는 사용하지 않음")
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class CounterState(TypedDict):
+    notes: Annotated[list[str], operator.add]
+
+
+class ProfileState(CounterState, total=False):
+    profile: str
+
+
+def build_app(saver, state=CounterState):
+    """입력 메모를 누적하는 1-Node 그래프"""
+    graph = StateGraph(state)
+    graph.add_node("echo", lambda state: {"notes": ["echo"]})
+    graph.set_entry_point("echo")
+    graph.add_edge("echo", END)
+    return graph.compile(checkpointer=saver)
+
+
+def thread(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@pytest.fixture
+def redis():
+    return FakeRedisClient()
+
+
+def test_state_restored_across_workers(redis):
+    """같은 thread_id면 다른 saver 인스턴스(워커)에서도 이전 상태에서 이어감"""
+    build_app(RedisCheckpointSaver(redis)).invoke({"notes": ["a"]}, thread("t1"))
+    result = build_app(RedisCheckpointSaver(redis)).invoke(
+        {"notes": ["b"]}, thread("t1")
+    )
+
+    assert result["notes"] == ["a", "echo", "b", "echo"]
+
+
+def test_threads_are_isolated(redis):
+    app = build_app(RedisCheckpointSaver(redis))
+    app.invoke({"notes": ["a"]}, thread("t1"))
+
+    assert app.invoke({"notes": ["b"]}, thread("t2"))["notes"] == ["b", "echo"]
+
+
+def test_all_keys_have_ttl(redis):
+    """모든 키에 TTL 설정 (오래된 대화는 Redis가 정리)"""
+    build_app(RedisCheckpointSaver(redis, ttl_seconds=60)).invoke(
+        {"notes": ["a"]}, thread("t1")
+    )
+
+    assert redis.data
+    assert set(redis.expires) == set(redis.data)
+    assert set(redis.expires.values()) == {60}
+
+
+def keys_of(redis, kind: str, thread_id: str = "t1") -> list[str]:
+    prefix = f"langgraph:checkpoint:{thread_id}:{kind}:"
+    return [key for key in redis.data if key.startswith(prefix)]
+
+
+def test_large_payload_compressed(redis):
+    """compress_min_bytes 이상인 값은 zlib 압축 후 복원"""
+    saver = RedisCheckpointSaver(redis, compress_min_bytes=64)
+    app = build_app(saver)
+    app.invoke({"notes": ["할일 " * 200]}, thread("t1"))
+
+    blobs = [redis.data[key] for key in keys_of(redis, "blob:notes")]
+    assert blobs
+    assert all(value.split(":")[1] == "z" for value in blobs)
+    assert app.get_state(thread("t1")).values["notes"][0] == "할일 " * 200
+
+
+def test_unchanged_channel_stored_once(redis):
+    """바뀌지 않은 채널 값은 단계마다 다시 저장하지 않고 blob을 공유"""
+    app = build_app(RedisCheckpointSaver(redis), state=ProfileState)
+    app.invoke({"notes": ["a"], "profile": "긴 대화 기록 " * 100}, thread("t1"))
+    app.invoke({"notes": ["b"]}, thread("t1"))
+    app.invoke({"notes": ["c"]}, thread("t1"))
+
+    assert len(keys_of(redis, "blob:profile")) == 1
+    assert len(keys_of(redis, "checkpoint")) > 1
+    assert app.get_state(thread("t1")).values["profile"] == "긴 대화 기록 " * 100
+
+
+def test_old_checkpoints_trimmed(redis):
+    """index는 최근 max_checkpoints개만, 지운 체크포인트의 blob/writes도 정리"""
+    saver = RedisCheckpointSaver(redis, max_checkpoints=4)
+    app = build_app(saver)
+    for i in range(10):
+        app.invoke({"notes": [str(i)]}, thread("t1"))
+
+    assert len(redis.data["langgraph:checkpoint:t1:index"]) == 4
+    assert len(keys_of(redis, "checkpoint")) == 4
+    assert len(list(saver.list(thread("t1")))) == 4
+    # 남은 blob은 모두 남은 체크포인트가 참조하는 버전
+    referenced = {
+        f"langgraph:checkpoint:t1:blob:{channel}:{version}:"
+        for saved in saver.list(thread("t1"))
+        for channel, version in saved.checkpoint["channel_versions"].items()
+    }
+    assert set(keys_of(redis, "blob")) == referenced
+    assert app.get_state(thread("t1")).values["notes"][-2:] == ["9", "echo"]
+
+
+def test_expired_members_pruned_from_index(redis):
+    """체크포인트 키가 만료된 index 멤버는 list()가 정리"""
+    saver = RedisCheckpointSaver(redis)
+    app = build_app(saver)
+    app.invoke({"notes": ["a"]}, thread("t1"))
+    expired = keys_of(redis, "checkpoint")[0]
+    del redis.data[expired]
+
+    history = list(saver.list(thread("t1")))
+
+    members = redis.data["langgraph:checkpoint:t1:index"]
+    assert len(members) == len(history)
+    assert all(expired.rsplit(":", 2)[1] not in m for m in members)
+
+
+def test_list_and_delete_thread(redis):
+    saver = RedisCheckpointSaver(redis)
+    app = build_app(saver)
+    app.invoke({"notes": ["a"]}, thread("t1"))
+    app.invoke({"notes": ["b"]}, thread("t1"))
+    app.invoke({"notes": ["c"]}, thread("t1*"))
+
+    history = list(saver.list(thread("t1")))
+    ids = [c.config["configurable"]["checkpoint_id"] for c in history]
+    assert ids == sorted(ids, reverse=True)
+    assert history[0].checkpoint["channel_values"]["notes"][-1] == "echo"
+    assert len(list(saver.list(thread("t1"), limit=2))) == 2
+
+    saver.delete_thread("t1")
+
+    assert saver.get_tuple(thread("t1")) is None
+    assert not [key for key in redis.data if key.startswith("langgraph:checkpoint:t1:")]
+    # 패턴 문자가 들어간 thread는 영향 없음
+    assert saver.get_tuple(thread("t1*")) is not None
+
+
+def test_list_requires_thread_id(redis):
+    with pytest.raises(ValueError):
+        list(RedisCheckpointSaver(redis).list(None))
+
+
+@pytest.mark.asyncio
+async def test_async_roundtrip(redis):
+    app = build_app(RedisCheckpointSaver(redis))
+    await app.ainvoke({"notes": ["a"]}, thread("t1"))
+    result = await app.ainvoke({"notes": ["b"]}, thread("t1"))
+
+    assert result["notes"] == ["a", "echo", "b", "echo"]
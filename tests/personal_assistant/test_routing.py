@@ -0,0 +1,345 @@
+"""
+TieredRouter 테스트
+
+Skill Card 트리거 → 로컬 분류기 → LLM 순서의 단계별 라우팅 테스트입니다.
+LLM은 가짜 객체로 대체하므로 Ollama 없이 실행됩니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from multi_agent_lab.domains.personal_assistant.agents.route_cache import (
+    RouteCache,
+    card_fingerprint,
+    normalize_query,
+)
+from multi_agent_lab.domains.personal_assistant.agents.routing import (
+    RouteDecision,
+    TieredRouter,
+    split_clauses,
+)
+from multi_agent_lab.domains.personal_assistant.agents.supervisor import (
+    SKILL_CARDS_DIR,
+    PersonalAssistantSupervisor,
+)
+from multi_agent_lab.platform.skill_card import SkillCardManager
+
+
+class FakeLLM:
+    """invoke() 호출 횟수를 기록하는 가짜 LLM"""
+
+    def __init__(self, answer: str = "unknown", error: Exception | None = None):
+        self.answer = answer
+        self.error = error
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(content=self.answer)
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """personal_assistant Skill Card 매니저"""
+    return SkillCardManager(SKILL_CARDS_DIR)
+
+
+class TestTieredRouter:
+    """단계별 라우팅 테스트"""
+
+    @pytest.mark.parametrize(
+        "query,expected_type",
+        [
+            ("내일 오후 2시에 팀 회의 일정 잡아줘", "schedule"),
+            ("장보기 할일 추가해줘", "todo"),
+        ],
+    )
+    def test_skill_card_tier_skips_llm(self, manager, query, expected_type):
+        """트리거 키워드가 한 Agent로만 매칭되면 LLM 호출 없음"""
+        llm = FakeLLM()
+        decision = TieredRouter(manager, llm=llm).route(query)
+
+        assert decision.agent_type == expected_type
+        assert decision.tier == "skill_card"
+        assert decision.card_id is not None
+        assert llm.calls == 0
+
+    def test_keyword_margin_breaks_tie(self, manager):
+        """여러 Agent가 매칭돼도 가중치 차이가 크면 skill_card 단계에서 결정"""
+        decision = TieredRouter(manager).route("회의 끝나고 할일 정리해줘")
+
+        assert decision.agent_type == "todo"
+        assert decision.tier == "skill_card"
+        assert 0 < decision.confidence < 1
+
+    @pytest.mark.parametrize(
+        "query,expected_type",
+        [
+            ("장보기 목록에 우유 넣어줘", "todo"),
+            ("다음주 화요일 팀 싱크 잡아줘", "schedule"),
+            ("내일 3시 치과", "schedule"),
+            ("숙제 완료 처리해줘", "todo"),
+        ],
+    )
+    def test_classifier_tier(self, manager, query, expected_type):
+        """키워드가 없어도 예시 문장과 충분히 가까우면 분류기가 결정"""
+        llm = FakeLLM()
+        decision = TieredRouter(manager, llm=llm).route(query)
+
+        assert decision.agent_type == expected_type
+        assert decision.tier == "classifier"
+        assert llm.calls == 0
+
+    def test_low_confidence_asks_llm(self, manager):
+        """앞 단계가 확신하지 못하면 LLM 호출"""
+        llm = FakeLLM("Schedule\n")
+        decision = TieredRouter(manager, llm=llm).route("금요일 저녁 동창 모임 잡아줘")
+
+        assert decision.agent_type == "schedule"
+        assert decision.tier == "llm"
+        assert llm.calls == 1
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "날씨 알려줘",
+            "환율 알려줘",
+            "주식 시세 알려줘",
+            "삼성전자 주가 알려줘",
+            "맛집 추천해줘",
+            "보고 싶은 영화 추천해줘",
+        ],
+    )
+    def test_off_topic_not_classified(self, manager, query):
+        """끝 서술어("알려줘" 등)만 예시와 겹치는 질문은 분류기가 결정하지 않음"""
+        llm = FakeLLM("unknown")
+        decision = TieredRouter(manager, llm=llm).route(query)
+
+        assert (decision.agent_type, decision.tier) == ("unknown", "llm")
+        assert llm.calls == 1
+        assert TieredRouter(manager).route(query).agent_type == "unknown"
+
+    @pytest.mark.parametrize(
+        "llm",
+        [None, FakeLLM("잘 모르겠어요"), FakeLLM(error=ConnectionError("no server"))],
+    )
+    def test_fallback_without_usable_llm(self, manager, llm):
+        """LLM이 없거나 실패하면 fallback 단계에서 unknown"""
+        decision = TieredRouter(manager, llm=llm).route("오늘 날씨 어때?")
+
+        assert decision.agent_type == "unknown"
+        assert decision.tier == "fallback"
+
+    def test_fallback_uses_best_guess(self, manager):
+        """동점 키워드는 LLM 실패 시 앞 단계의 최선 추정 사용"""
+        router = TieredRouter(
+            manager, llm=FakeLLM(error=TimeoutError()), min_similarity=1.0
+        )
+        decision = router.route("회의 작업 정리")
+
+        assert decision.tier == "fallback"
+        assert decision.agent_type in ("schedule", "todo")
+        assert decision.card_id is not None
+
+    @pytest.mark.asyncio
+    async def test_aroute_matches_route(self, manager):
+        """aroute는 route와 같은 단계 순서 (LLM은 ainvoke)"""
+        llm = FakeLLM("schedule")
+        router = TieredRouter(manager, llm=llm)
+
+        assert (await router.aroute("장보기 할일 추가해줘")).tier == "skill_card"
+        decision = await router.aroute("금요일 저녁 동창 모임 잡아줘")
+        assert (decision.agent_type, decision.tier) == ("schedule", "llm")
+        assert llm.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_aroute_intents(self, manager):
+        """aroute_intents도 절별로는 LLM을 호출하지 않음"""
+        llm = FakeLLM("todo")
+        router = TieredRouter(manager, llm=llm)
+
+        intents = await router.aroute_intents(
+            "내일 3시 회의 잡고 보고서 작성 할일도 추가해줘"
+        )
+        assert [i.decision.agent_type for i in intents] == ["schedule", "todo"]
+        assert llm.calls == 0
+
+        intents = await router.aroute_intents("점심 먹고 산책 가고 싶다")
+        assert [i.decision.tier for i in intents] == ["llm"]
+        assert llm.calls == 1
+
+    def test_unmapped_agent_type_is_ignored(self, manager):
+        """agent_types 매핑에 없는 카드는 라우팅 후보가 아님"""
+        router = TieredRouter(manager, agent_types={"ScheduleManagerAgent": "schedule"})
+        decision = router.route("장보기 할일 추가해줘")
+
+        assert decision.agent_type != "todo"
+
+
+class TestSupervisorRouter:
+    """Supervisor Router Node 테스트 (Supervisor 생성은 Ollama 연결 불필요)"""
+
+    def test_router_reports_tier(self, manager):
+        """router 노드가 agent_type과 route_tier를 반환"""
+        supervisor = PersonalAssistantSupervisor(verbose=False, skill_cards=manager)
+        supervisor.router.llm = FakeLLM()
+
+        update = supervisor._router(
+            {"query": "장보기 할일 추가해줘", "agent_type": "unknown", "response": ""}
+        )
+
+        assert update["agent_type"] == "todo"
+        assert update["route_tier"] == "skill_card"
+        assert update["intents"] == [
+            {
+                "agent_type": "todo",
+                "query": "장보기 할일 추가해줘",
+                "route_tier": "skill_card",
+            }
+        ]
+        assert supervisor.router.llm.calls == 0
+
+
+class FakeRedisClient:
+    """RedisClient의 set/get만 흉내내는 테스트용 클라이언트"""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.expires: dict[str, int | None] = {}
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+
+class TestRouteCache:
+    """라우팅 결정 캐시 테스트"""
+
+    def test_normalize_query(self):
+        """문장부호/공백/대소문자 차이는 같은 질문"""
+        assert normalize_query("  오늘  할일 보여줘!! ") == "오늘 할일 보여줘"
+        assert normalize_query("TODO 목록?") == normalize_query("todo 목록")
+
+    def test_llm_decision_reused(self, manager):
+        """같은 질문은 LLM을 한 번만 호출"""
+        llm = FakeLLM("schedule")
+        router = TieredRouter(manager, llm=llm, cache=RouteCache())
+
+        first = router.route("금요일 저녁 동창 모임 잡아줘")
+        second = router.route("금요일 저녁 동창 모임 잡아줘?")
+
+        assert (first.tier, first.cached) == ("llm", False)
+        assert (second.agent_type, second.tier, second.cached) == (
+            "schedule",
+            "llm",
+            True,
+        )
+        assert llm.calls == 1
+
+    def test_fallback_not_cached(self, manager):
+        """LLM 실패로 인한 fallback 결정은 저장하지 않음"""
+        llm = FakeLLM(error=ConnectionError())
+        router = TieredRouter(manager, llm=llm, cache=RouteCache())
+
+        router.route("오늘 날씨 어때?")
+        router.route("오늘 날씨 어때?")
+
+        assert llm.calls == 2
+
+    def test_card_change_invalidates(self, manager):
+        """Skill Card 지문이 다르면 이전 결정을 쓰지 않음"""
+        cache = RouteCache()
+        cache.set(
+            "금요일 저녁 동창 모임 잡아줘", "v1", RouteDecision("schedule", "llm", 1.0)
+        )
+
+        assert cache.get("금요일 저녁 동창 모임 잡아줘", "v1") is not None
+        assert cache.get("금요일 저녁 동창 모임 잡아줘", "v2") is None
+        assert cache.fingerprint(manager.snapshot) == card_fingerprint(manager.snapshot)
+
+    def test_redis_shared_between_workers(self, manager):
+        """Redis 공유 캐시로 다른 워커의 결정을 재사용"""
+        redis = FakeRedisClient()
+        llm_a, llm_b = FakeLLM("schedule"), FakeLLM("todo")
+        worker_a = TieredRouter(manager, llm=llm_a, cache=RouteCache(redis=redis))
+        worker_b = TieredRouter(manager, llm=llm_b, cache=RouteCache(redis=redis))
+
+        worker_a.route("금요일 저녁 동창 모임 잡아줘")
+        decision = worker_b.route("금요일 저녁 동창 모임 잡아줘")
+
+        assert decision.agent_type == "schedule"
+        assert decision.cached is True
+        assert llm_b.calls == 0
+        assert worker_b.cache.redis_hits == 1
+        assert list(redis.expires.values()) == [600]
+
+
+class TestRouteIntents:
+    """복합 요청 의도 분리 테스트"""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            (
+                "내일 3시 회의 잡고 보고서 작성 할일도 추가해줘",
+                ["내일 3시 회의 잡고", "보고서 작성 할일도 추가해줘"],
+            ),
+            (
+                "오늘 일정 보여줘. 그리고 할일 목록도 알려줘",
+                ["오늘 일정 보여줘.", "할일 목록도 알려줘"],
+            ),
+            ("회의 잡아줘", ["회의 잡아줘"]),
+        ],
+    )
+    def test_split_clauses(self, query, expected):
+        """쉼표/문장부호/그리고/연결 어미 -고 기준으로 절 분리"""
+        assert split_clauses(query) == expected
+
+    def test_compound_query_split_by_agent(self, manager):
+        """서로 다른 Agent가 필요한 절은 의도별로 분리"""
+        intents = TieredRouter(manager).route_intents(
+            "날씨 좋네, 내일 2시 미팅 잡고 빨래 할일 추가해줘"
+        )
+
+        assert [i.decision.agent_type for i in intents] == ["schedule", "todo"]
+        # 앞쪽 unknown 절은 첫 Agent에게 붙음
+        assert intents[0].query == "날씨 좋네 내일 2시 미팅 잡고"
+        assert intents[1].query == "빨래 할일 추가해줘"
+
+    def test_single_agent_keeps_full_query(self, manager):
+        """절이 여러 개라도 한 Agent면 원래 질문 그대로"""
+        query = "장보기 할일 추가하고 목록 보여줘"
+        intents = TieredRouter(manager).route_intents(query)
+
+        assert len(intents) == 1
+        assert intents[0].query == query
+        assert intents[0].decision.agent_type == "todo"
+
+    @pytest.mark.parametrize(
+        "query", ["회의 끝나고 보고서 정리해줘", "장보기 할일 추가하고 목록 보여줘"]
+    )
+    def test_clause_without_card_evidence_not_split(self, manager, query):
+        """트리거 근거가 없는 절(분류기 결정)은 따로 나누지 않음"""
+        intents = TieredRouter(manager).route_intents(query)
+
+        assert [i.query for i in intents] == [query]
+
+    def test_undecided_clauses_ask_llm_once(self, manager):
+        """절을 로컬에서 결정하지 못하면 전체 질문으로 LLM 한 번만 호출"""
+        llm = FakeLLM("unknown")
+        query = "점심 먹고 산책 가고 싶다"
+
+        intents = TieredRouter(manager, llm=llm).route_intents(query)
+
+        assert [(i.query, i.decision.tier) for i in intents] == [(query, "llm")]
+        assert llm.calls == 1
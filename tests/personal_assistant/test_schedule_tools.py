@@ -0,0 +1,43 @@
+"""
+Schedule Tools 단위 테스트
+
+Ollama 없이 실행 가능한 보조 함수 테스트입니다.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from multi_agent_lab.domains.personal_assistant.tools.schedule_tools import (
+    predict_event_date,
+)
+
+# 2025-11-12 (수요일)
+TODAY = datetime(2025, 11, 12)
+
+
+class TestPredictEventDate:
+    """predict_event_date 테스트"""
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("오늘 오후에 커피챗", "2025-11-12"),
+            ("내일 오후 2시에 팀 회의 일정 잡아줘", "2025-11-13"),
+            ("모레 미팅", "2025-11-14"),
+            ("다음주 월요일에 1시간짜리 미팅 추가해줘", "2025-11-17"),
+            ("다음 주 금요일 점심 약속", "2025-11-21"),
+            ("이번주 금요일 회고", "2025-11-14"),
+            ("2025-12-01 워크숍", "2025-12-01"),
+            ("2025-11-12에 회의", "2025-11-12"),
+            ("워크숍은2025-12-01부터", "2025-12-01"),
+        ],
+    )
+    def test_predict(self, query, expected):
+        """규칙으로 알 수 있는 날짜 표현"""
+        assert predict_event_date(query, today=TODAY) == expected
+
+    @pytest.mark.parametrize("query", ["팀 회의 잡아줘", "오늘이나 내일 중에 미팅"])
+    def test_unknown_or_ambiguous(self, query):
+        """날짜가 없거나 여러 개면 추측하지 않음"""
+        assert predict_event_date(query, today=TODAY) is None
@@ -4,13 +4,32 @@ PersonalAssistantSupervisor 테스트
 LangGraph StateGraph 구조 및 라우팅 로직 테스트입니다.
 """
 
-import pytest
+import asyncio
+import json
+import re
+import time
 
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGenerationChunk
+from langgraph.checkpoint.memory import InMemorySaver
+from pydantic import Field
+
+from multi_agent_lab.domains.personal_assistant.agents import (
+    supervisor as supervisor_module,
+)
+from multi_agent_lab.domains.personal_assistant.agents.routing import TieredRouter
 from multi_agent_lab.domains.personal_assistant.agents.supervisor import (
+    SKILL_CARDS_DIR,
     PersonalAssistantSupervisor,
     SupervisorState,
 )
+from multi_agent_lab.domains.personal_assistant.agents.todo_manager import (
+    TodoManagerAgent,
+)
 from multi_agent_lab.domains.personal_assistant.storage.memory_db import db
+from multi_agent_lab.platform.skill_card import SkillCardManager
 
 
 @pytest.fixture(autouse=True)
@@ -105,8 +124,14 @@ class TestSupervisorGraphStructure:
         assert state["agent_type"] == "unknown"
 
 
+@pytest.fixture(scope="module")
+def router():
+    """LLM 단계가 없는 TieredRouter"""
+    return TieredRouter(SkillCardManager(SKILL_CARDS_DIR))
+
+
 class TestKeywordFallback:
-    """키워드 기반 폴백 로직 테스트"""
+    """LLM 없이 라우팅 (Skill Card 트리거 → 분류기)"""
 
     @pytest.mark.parametrize(
         "query,expected_type",
@@ -123,21 +148,365 @@ class TestKeywordFallback:
             ("완료 처리", "todo"),
         ],
     )
-    def test_keyword_matching(self, query, expected_type):
+    def test_keyword_matching(self, router, query, expected_type):
         """키워드 매칭 테스트"""
-        query_lower = query.lower()
-
-        # 실제 Supervisor._router의 폴백 로직 재현
-        if any(kw in query_lower for kw in ["일정", "회의", "약속", "캘린더", "시간"]):
-            agent_type = "schedule"
-        elif any(
-            kw in query_lower for kw in ["할일", "태스크", "작업", "추가", "완료"]
-        ):
-            agent_type = "todo"
-        else:
-            agent_type = "unknown"
-
-        assert agent_type == expected_type
+        decision = router.route(query)
+
+        assert decision.agent_type == expected_type
+        assert decision.tier in ("skill_card", "classifier")
+
+
+class TestSupervisorLazyAgents:
+    """Sub-Agent 지연 생성 테스트 (Agent 생성은 Ollama 연결 불필요)"""
+
+    def test_agents_not_built_on_init(self):
+        """Supervisor 생성 시 Sub-Agent를 만들지 않음"""
+        supervisor = PersonalAssistantSupervisor(verbose=False)
+
+        assert supervisor.loaded_agents == frozenset()
+
+    def test_agent_built_once_and_llm_shared(self):
+        """처음 접근할 때 한 번만 생성, 같은 설정의 Agent는 LLM 공유"""
+        supervisor = PersonalAssistantSupervisor(verbose=False)
+
+        todo = supervisor.todo_agent
+        assert supervisor.loaded_agents == {"todo"}
+        assert supervisor.todo_agent is todo
+
+        assert supervisor.schedule_agent.llm is todo.llm
+
+
+class SlowAgent:
+    """chat()에 지연이 있는 가짜 Sub-Agent"""
+
+    def __init__(self, name: str, delay: float = 0.3):
+        self.name = name
+        self.delay = delay
+        self.histories = []
+
+    def chat(self, message: str, config=None, history=None) -> str:
+        self.histories.append(list(history or []))
+        time.sleep(self.delay)
+        return f"{self.name}: {message}"
+
+
+class TestSupervisorFanOut:
+    """복합 요청 병렬 실행 테스트 (Sub-Agent를 가짜로 교체, Ollama 불필요)"""
+
+    @pytest.fixture
+    def supervisor(self):
+        """LLM 라우팅 없이 가짜 Sub-Agent를 쓰는 Supervisor"""
+        supervisor = PersonalAssistantSupervisor(verbose=False)
+        supervisor.router.llm = None
+        supervisor.schedule_agent = SlowAgent("schedule")
+        supervisor.todo_agent = SlowAgent("todo")
+        return supervisor
+
+    def test_compound_query_runs_both_agents(self, supervisor):
+        """두 branch를 병렬로 실행하고 응답을 의도 순서대로 합침"""
+        started = time.perf_counter()
+        result = supervisor.invoke("내일 3시 회의 잡고 보고서 작성 할일도 추가해줘")
+        elapsed = time.perf_counter() - started
+
+        assert [i["agent_type"] for i in result["intents"]] == ["schedule", "todo"]
+        assert {r["agent_type"] for r in result["responses"]} == {"schedule", "todo"}
+        assert result["response"].index("schedule: 내일 3시 회의 잡고") < result[
+            "response"
+        ].index("todo: 보고서 작성 할일도 추가해줘")
+        # 합(0.6초)이 아니라 가장 느린 branch 수준
+        assert elapsed < 0.55
+
+    def test_single_intent_response_unchanged(self, supervisor):
+        """의도가 하나면 머리말 없이 Agent 응답 그대로"""
+        result = supervisor.invoke("장보기 할일 추가해줘")
+
+        assert result["agent_type"] == "todo"
+        assert result["response"] == "todo: 장보기 할일 추가해줘"
+
+    def test_unknown_goes_to_fallback(self, supervisor):
+        """Agent를 정하지 못하면 fallback 응답"""
+        result = supervisor.invoke("오늘 날씨 어때?")
+
+        assert result["agent_type"] == "unknown"
+        assert "지원" in result["response"]
+
+
+class AsyncAgent:
+    """achat()만 지원하는 가짜 Sub-Agent (동기 chat 호출 시 실패)"""
+
+    def __init__(self, name: str, delay: float = 0.2):
+        self.name = name
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def chat(self, message: str, config=None, history=None) -> str:
+        raise AssertionError("비동기 경로에서 동기 chat()이 호출됨")
+
+    async def achat(self, message: str, config=None, history=None) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return f"{self.name}: {message}"
+
+
+class TestSupervisorAsync:
+    """achat / abatch 테스트 (가짜 Sub-Agent, Ollama 불필요)"""
+
+    @pytest.fixture
+    def supervisor(self):
+        """비동기 가짜 Sub-Agent를 쓰는 Supervisor"""
+        supervisor = PersonalAssistantSupervisor(verbose=False)
+        supervisor.router.llm = None
+        supervisor.schedule_agent = AsyncAgent("schedule")
+        supervisor.todo_agent = AsyncAgent("todo")
+        return supervisor
+
+    @pytest.mark.asyncio
+    async def test_achat_uses_async_nodes(self, supervisor):
+        """achat은 ainvoke 경로(agent.achat)로 실행"""
+        response = await supervisor.achat("장보기 할일 추가해줘")
+
+        assert response == "todo: 장보기 할일 추가해줘"
+
+    @pytest.mark.asyncio
+    async def test_abatch_runs_concurrently(self, supervisor):
+        """abatch는 여러 대화를 동시에 처리하고 질문 순서대로 반환"""
+        queries = [f"할일 {i}번 추가해줘" for i in range(6)]
+
+        started = time.perf_counter()
+        responses = await supervisor.abatch(queries, max_concurrency=6)
+        elapsed = time.perf_counter() - started
+
+        assert responses == [f"todo: {q}" for q in queries]
+        assert supervisor.todo_agent.max_in_flight == 6
+        # 순차 실행이면 1.2초
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_abatch_respects_max_concurrency(self, supervisor):
+        """max_concurrency를 넘는 대화는 동시에 실행하지 않음"""
+        await supervisor.abatch([f"할일 {i}번 추가해줘" for i in range(6)], 2)
+
+        assert supervisor.todo_agent.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_abatch_invalid_concurrency(self, supervisor):
+        """max_concurrency는 1 이상"""
+        with pytest.raises(ValueError):
+            await supervisor.abatch(["할일 추가해줘"], max_concurrency=0)
+
+
+class FakeToolModel(GenericFakeChatModel):
+    """도구 호출도 스트리밍하는 가짜 Chat 모델 (AgentExecutor 연동용)"""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        message = next(self.messages)
+        if message.tool_calls:
+            call = message.tool_calls[0]
+            chunk = {
+                "name": call["name"],
+                "args": json.dumps(call["args"]),
+                "id": call["id"],
+                "index": 0,
+            }
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content="", tool_call_chunks=[chunk])
+            )
+            return
+        for token in re.split(r"(?<=\s)", message.content):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+class RecordingToolModel(FakeToolModel):
+    """받은 프롬프트 메시지를 기록하는 가짜 Chat 모델"""
+
+    prompts: list = Field(default_factory=list)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompts.append(messages)
+        yield from super()._stream(messages, stop, run_manager, **kwargs)
+
+
+class TestSupervisorStreaming:
+    """stream / astream 테스트 (가짜 LLM을 쓰는 실제 TodoManagerAgent)"""
+
+    @pytest.fixture
+    def supervisor(self):
+        """list_tasks 호출 후 답변을 토큰 단위로 생성하는 Todo Agent"""
+        llm = FakeToolModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="",
+                        tool_calls=[{"name": "list_tasks", "args": {}, "id": "call_1"}],
+                    ),
+                    AIMessage(content="남은 할일은 없습니다."),
+                ]
+            )
+        )
+        agent = TodoManagerAgent(llm=llm)
+        agent.executor.verbose = False
+
+        supervisor = PersonalAssistantSupervisor(verbose=False)
+        supervisor.router.llm = None
+        supervisor.todo_agent = agent
+        return supervisor
+
+    def test_stream_tokens_and_tool_events(self, supervisor):
+        """도구 이벤트 → 토큰 → 최종 응답 순서로 전달"""
+        events = list(supervisor.stream("오늘 할일 목록 보여줘"))
+        types = [e["type"] for e in events]
+
+        tokens = [e for e in events if e["type"] == "token"]
+        assert "".join(e["content"] for e in tokens) == "남은 할일은 없습니다."
+        assert {e["agent"] for e in tokens} == {"todo"}
+        assert len(tokens) > 1
+
+        tool_events = [e for e in events if e["type"].startswith("tool_")]
+        assert [(e["type"], e["tool"]) for e in tool_events] == [
+            ("tool_start", "list_tasks"),
+            ("tool_end", "list_tasks"),
+        ]
+        assert types.index("tool_end") < types.index("token")
+
+        last = events[-1]
+        assert (last["type"], last["node"]) == ("update", "merge")
+        assert last["data"]["response"] == "남은 할일은 없습니다."
+
+    def test_stream_mode_selection(self, supervisor):
+        """updates 모드만 요청하면 Node 완료 이벤트만 전달"""
+        events = list(supervisor.stream("오늘 할일 목록 보여줘", ["updates"]))
+
+        assert {e["type"] for e in events} == {"update"}
+        assert [e["node"] for e in events] == ["router", "todo_executor", "merge"]
+
+    @pytest.mark.asyncio
+    async def test_astream(self, supervisor):
+        """astream은 비동기 경로(agent.achat)로 같은 이벤트 전달"""
+        events = [e async for e in supervisor.astream("오늘 할일 목록 보여줘")]
+
+        tokens = "".join(e["content"] for e in events if e["type"] == "token")
+        assert tokens == "남은 할일은 없습니다."
+        assert any(e["type"] == "tool_end" for e in events)
+
+
+class TestSupervisorCheckpoint:
+    """checkpointer + thread_id 대화 상태 테스트 (가짜 Sub-Agent, 공유 저장소)"""
+
+    @pytest.fixture
+    def saver(self):
+        """워커들이 공유하는 체크포인트 저장소 (Redis 대신 메모리)"""
+        return InMemorySaver()
+
+    def _supervisor(self, saver):
+        supervisor = PersonalAssistantSupervisor(verbose=False, checkpointer=saver)
+        supervisor.router.llm = None
+        supervisor.schedule_agent = SlowAgent("schedule", delay=0)
+        supervisor.todo_agent = SlowAgent("todo", delay=0)
+        return supervisor
+
+    def test_history_restored_on_another_worker(self, saver):
+        """같은 thread_id면 다른 Supervisor(워커)에서 이전 턴 기록을 이어감"""
+        self._supervisor(saver).chat("장보기 할일 추가해줘", thread_id="u1")
+        worker = self._supervisor(saver)
+        result = worker.invoke("내일 3시 회의 잡아줘", thread_id="u1")
+
+        assert [(t["agent_type"], t["query"]) for t in result["history"]] == [
+            ("todo", "장보기 할일 추가해줘"),
+            ("schedule", "내일 3시 회의 잡아줘"),
+        ]
+        assert worker.get_history("u2") == []
+
+    def test_responses_reset_each_turn(self, saver):
+        """이전 턴 응답이 이번 턴 응답에 섞이지 않음"""
+        supervisor = self._supervisor(saver)
+        supervisor.chat(
+            "내일 3시 회의 잡고 보고서 작성 할일도 추가해줘", thread_id="u1"
+        )
+        result = supervisor.invoke("장보기 할일 추가해줘", thread_id="u1")
+
+        assert result["responses"] == [
+            {"agent_type": "todo", "response": "todo: 장보기 할일 추가해줘"}
+        ]
+        assert result["response"] == "todo: 장보기 할일 추가해줘"
+
+    def test_history_window(self, saver, monkeypatch):
+        """history는 최근 MAX_HISTORY_TURNS개만 유지"""
+        monkeypatch.setattr(supervisor_module, "MAX_HISTORY_TURNS", 2)
+        supervisor = self._supervisor(saver)
+        for i in range(3):
+            supervisor.chat(f"할일 {i}번 추가해줘", thread_id="u1")
+
+        assert [t["query"] for t in supervisor.get_history("u1")] == [
+            "할일 1번 추가해줘",
+            "할일 2번 추가해줘",
+        ]
+
+    def test_sub_agent_sees_previous_turn(self, saver):
+        """같은 thread_id의 두 번째 턴에서 Sub-Agent가 이전 턴을 받음"""
+        supervisor = self._supervisor(saver)
+        supervisor.chat("장보기 할일 추가해줘", thread_id="u1")
+        supervisor.chat("우유 사기 할일도 추가해줘", thread_id="u1")
+        supervisor.chat("보고서 할일 추가해줘", thread_id="u2")
+
+        first, second, other = supervisor.todo_agent.histories
+        assert first == []
+        assert second == [
+            HumanMessage("장보기 할일 추가해줘"),
+            AIMessage("todo: 장보기 할일 추가해줘"),
+        ]
+        assert other == []
+
+    def test_agent_history_window(self, saver, monkeypatch):
+        """Sub-Agent에는 최근 AGENT_HISTORY_TURNS개 턴만 전달"""
+        monkeypatch.setattr(supervisor_module, "AGENT_HISTORY_TURNS", 1)
+        supervisor = self._supervisor(saver)
+        for i in range(3):
+            supervisor.chat(f"할일 {i}번 추가해줘", thread_id="u1")
+
+        assert [m.content for m in supervisor.todo_agent.histories[-1]] == [
+            "할일 1번 추가해줘",
+            "todo: 할일 1번 추가해줘",
+        ]
+
+    def test_history_in_agent_prompt(self, saver):
+        """실제 TodoManagerAgent 프롬프트의 chat_history에 이전 턴이 들어감"""
+        llm = RecordingToolModel(
+            messages=iter(
+                [AIMessage(content="추가했습니다."), AIMessage(content="우유입니다.")]
+            )
+        )
+        agent = TodoManagerAgent(llm=llm)
+        agent.executor.verbose = False
+        supervisor = PersonalAssistantSupervisor(verbose=False, checkpointer=saver)
+        supervisor.router.llm = None
+        supervisor.todo_agent = agent
+
+        supervisor.chat("우유 사기 할일 추가해줘", thread_id="u1")
+        supervisor.chat("방금 추가한 할일 알려줘", thread_id="u1")
+
+        prompt = llm.prompts[-1]
+        assert [(m.type, m.content) for m in prompt[1:]] == [
+            ("human", "우유 사기 할일 추가해줘"),
+            ("ai", "추가했습니다."),
+            ("human", "방금 추가한 할일 알려줘"),
+        ]
+
+    def test_get_history_requires_checkpointer(self):
+        supervisor = PersonalAssistantSupervisor(verbose=False)
+
+        with pytest.raises(ValueError):
+            supervisor.get_history("u1")
 
 
 # Integration tests (Ollama 필요)
@@ -13,6 +13,7 @@ from multi_agent_lab.domains.personal_assistant.tools.todo_tools import (
     delete_task,
     list_tasks,
 )
+from multi_agent_lab.platform.skill_card import PlanAnalyzer, SkillCardManager
 
 
 @pytest.fixture(autouse=True)
@@ -171,3 +172,16 @@ class TestDeleteTask:
 
         assert result["success"] is False
         assert "찾을 수 없습니다" in result["error"]
+
+
+class TestTodoCard:
+    """todo_card가 실제 Todo Tool만 사용하는지 검증"""
+
+    def test_card_uses_registered_tools(self):
+        card = SkillCardManager().get("SC_TODO_001")
+        tools = {t.name: t for t in (add_task, complete_task, delete_task, list_tasks)}
+
+        report = PlanAnalyzer(tools=tools).analyze(card)
+
+        assert report.ok
+        assert {t.name for t in card.tools} <= set(tools)